@@ -1,19 +1,37 @@
 import streamlit as st
-from src.simulation_manager import SimulationManager
-import json
 import os
+from src.utils.llm_registry import load_env
+
+# Settings are read as modules are imported and sessions are created, so .env has to be loaded first.
+load_env()
+
+from src.simulation_manager import SimulationManager, AGENT_MODULES, prefetch_questions
+from src.utils.warmup import start_background_import
+from src.utils.speculative import SpeculativeQuestionJob
+from src.worker_pool import SimulationWorkerPool, RemoteSimulation, PoolBusyError
+from src.utils.tracing import get_tracer, span, summarize_spans, tracing_enabled
 
 # --- Constants ---
-CONFIG_DIR = os.path.join("src", "config")
-CONFIG_PATH = os.path.join(CONFIG_DIR, "config.json")
 DEFAULT_JOB_DESC = "As a Software Engineer at Google, you will..."
+# Only the latest messages are drawn as chat bubbles; older ones are folded into one cached markdown block.
+RECENT_MESSAGES = 6
 
 # --- Helper Functions ---
-def save_config(config_data):
-    """Saves the configuration data to the config file."""
-    os.makedirs(CONFIG_DIR, exist_ok=True)
-    with open(CONFIG_PATH, "w") as f:
-        json.dump(config_data, f, indent=4)
+@st.cache_resource
+def get_worker_pool():
+    """
+    Returns the process-wide simulation worker pool, or None to run simulations in this process.
+    Enabled by setting SIMULATION_WORKERS to the number of worker processes.
+    """
+    num_workers = int(os.getenv("SIMULATION_WORKERS", "0"))
+    if num_workers <= 0:
+        return None
+    return SimulationWorkerPool(
+        num_workers=num_workers,
+        max_concurrent_llm_calls=int(os.getenv("SIMULATION_MAX_LLM_CALLS", "4")),
+        max_queue_depth=int(os.getenv("SIMULATION_MAX_QUEUE_DEPTH", "8")),
+        session_idle_ttl=float(os.getenv("SIMULATION_SESSION_TTL", "1800"))
+    ).start()
 
 def initialize_session_state():
     """Initializes session state variables if they don't exist."""
@@ -28,6 +46,15 @@ def initialize_session_state():
         st.session_state.messages = []
     if 'manager' not in st.session_state:
         st.session_state.manager = None
+    if 'feedback_slots' not in st.session_state:
+        st.session_state.feedback_slots = {}
+    if 'history_cache' not in st.session_state:
+        st.session_state.history_cache = {"count": 0, "markdown": ""}
+    if 'question_prefetch' not in st.session_state:
+        # With a worker pool, speculative generation runs on the workers under their shared LLM cap.
+        worker_pool = get_worker_pool()
+        generate = worker_pool.prefetch_questions if worker_pool is not None else prefetch_questions
+        st.session_state.question_prefetch = SpeculativeQuestionJob(generate)
 
 # --- UI Components ---
 def render_config_section():
@@ -38,6 +65,27 @@ def render_config_section():
     job_description = st.text_area("Job Description", DEFAULT_JOB_DESC, height=200)
     return company_name, job_role, job_description
 
+def render_feedback_mode_selector():
+    """Renders the choice of when per-answer feedback is delivered."""
+    modes = {
+        "After each answer": "sync",
+        "In the background": "async",
+        "In batches": "batch",
+        "At the end (exam mode)": "exam",
+    }
+    mode = st.radio(
+        "Feedback Delivery",
+        list(modes),
+        help=(
+            "In the background, the next question is shown straight away and feedback is added when it is ready. "
+            "Batches and exam mode grade several answers in one go, which is faster and uses fewer API calls."
+        )
+    )
+    batch_size = 3
+    if modes[mode] == "batch":
+        batch_size = st.number_input("Answers per batch", min_value=2, max_value=10, value=3)
+    return modes[mode], int(batch_size)
+
 def render_interviewer_profiles():
     """Renders the UI for managing interviewer profiles."""
     st.subheader("Interviewer Profiles")
@@ -73,31 +121,193 @@ def validate_inputs(job_description, interviewers):
                 error = True
     return not error
 
+def add_response_message(response_part):
+    """Adds a manager response to the chat history, keeping background feedback next to its answer."""
+    if response_part.get("type") == "feedback_pending":
+        st.session_state.feedback_slots[response_part["transcript_index"]] = len(st.session_state.messages)
+    elif response_part.get("type") == "feedback" and "transcript_index" in response_part:
+        slot = st.session_state.feedback_slots.pop(response_part["transcript_index"], None)
+        if slot is not None:
+            st.session_state.messages[slot]["content"] = response_part["content"]
+            if slot < st.session_state.history_cache["count"]:
+                # The message was already folded into the cached history, so rebuild it on the next render.
+                st.session_state.history_cache = {"count": 0, "markdown": ""}
+            return
+    st.session_state.messages.append({"role": "assistant", "content": response_part["content"]})
+
+def render_response_stream(response_generator):
+    """
+    Writes manager responses into the chat as they arrive.
+    `<type>_delta` events are appended to a live message that the complete `<type>` event then replaces.
+    """
+    live_messages = {}
+    for response_part in response_generator:
+        response_type = response_part.get("type", "")
+        if response_type == "error":
+            st.error(response_part["content"])
+        elif response_type.endswith("_delta"):
+            base_type = response_type[:-len("_delta")]
+            if base_type not in live_messages:
+                with st.chat_message("assistant"):
+                    live_messages[base_type] = [st.empty(), ""]
+            live_messages[base_type][1] += response_part["content"]
+            live_messages[base_type][0].markdown(live_messages[base_type][1] + "▌")
+        elif response_part.get("content"):
+            add_response_message(response_part)
+            if response_type in live_messages:
+                placeholder, _ = live_messages.pop(response_type)
+                placeholder.markdown(response_part["content"])
+            else:
+                with st.chat_message("assistant"):
+                    st.markdown(response_part["content"])
+
+def render_live_metrics(stats):
+    """Renders running answer metrics in the sidebar. They are updated per answer, without any LLM calls."""
+    with st.sidebar:
+        st.subheader("Live Metrics")
+        cols = st.columns(2)
+        cols[0].metric("Answers", stats.answer_count)
+        cols[1].metric("Avg. Words", f"{stats.avg_answer_length:.0f}")
+        cols = st.columns(2)
+        cols[0].metric("Filler Words", stats.filler_count)
+        cols[1].metric("Keyword Coverage", f"{stats.keyword_coverage:.0%}")
+        if stats.per_interviewer:
+            st.caption("By interviewer")
+            st.table([
+                {"Interviewer": name, "Answers": split["answers"], "Words": split["words"], "Filler Words": split["filler_words"]}
+                for name, split in stats.per_interviewer.items()
+            ])
+
+def render_debug_panel():
+    """When tracing is on (TRACING=1), shows where recent time went and the span tree of the last turn."""
+    if not tracing_enabled():
+        return
+    spans = get_tracer().recent_spans()
+    with st.sidebar.expander("Debug: traces"):
+        if not spans:
+            st.caption("No spans recorded yet.")
+            return
+        st.caption(f"Last {len(spans)} spans, slowest first. Full traces: {get_tracer().path}")
+        st.dataframe(summarize_spans(spans), hide_index=True)
+
+        turns = [record for record in spans if record["name"] == "ui.turn"]
+        if turns:
+            last_turn = turns[-1]
+            tree = [record for record in spans if record["trace_id"] == last_turn["trace_id"]]
+            depth = {last_turn["span_id"]: 0}
+            lines = []
+            for record in sorted(tree, key=lambda r: r["start_time"]):
+                level = depth.setdefault(record["span_id"], depth.get(record["parent_id"], 0) + 1)
+                label = record["attributes"].get("agent") or record["attributes"].get("stage") or ""
+                error = " ⚠️" if record["error"] else ""
+                lines.append(f"{'  ' * level}{record['name']} {label} {record['duration_ms']:.0f} ms{error}")
+            st.caption("Last turn")
+            st.code("\n".join(lines), language=None)
+
+def is_config_complete(config_data):
+    """Returns True when the inputs are filled in well enough to start generating questions."""
+    return (
+        bool(config_data["job_description"]) and config_data["job_description"] != DEFAULT_JOB_DESC
+        and bool(config_data["interviewers"])
+        and all(all(interviewer.values()) for interviewer in config_data["interviewers"])
+    )
+
+def reset_chat():
+    """Clears the chat history and everything derived from it."""
+    st.session_state.messages = []
+    st.session_state.feedback_slots = {}
+    st.session_state.history_cache = {"count": 0, "markdown": ""}
+
+def collapsed_history_markdown(messages):
+    """
+    Returns one markdown block for `messages`. The block is cached in the session and only the
+    messages added since the last rerun are converted, so the cost doesn't grow with the interview.
+    """
+    cache = st.session_state.history_cache
+    if cache["count"] > len(messages):
+        cache = {"count": 0, "markdown": ""}
+    parts = [cache["markdown"]]
+    for message in messages[cache["count"]:]:
+        speaker = "You" if message["role"] == "user" else "Interviewer"
+        parts.append(f"**{speaker}:** {message['content']}\n\n---\n\n")
+    st.session_state.history_cache = {"count": len(messages), "markdown": "".join(parts)}
+    return st.session_state.history_cache["markdown"]
+
+def render_chat_history():
+    """Renders the latest messages as chat bubbles and the rest as a collapsed, cached transcript."""
+    messages = st.session_state.messages
+    older = max(0, len(messages) - RECENT_MESSAGES)
+    if older:
+        # Older turns are only sent to the browser when asked for.
+        if st.checkbox(f"Show {older} earlier messages", key="show_history"):
+            with st.container(border=True):
+                st.markdown(collapsed_history_markdown(messages[:older]))
+    for message in messages[older:]:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+
 def render_simulation_section():
     """Renders the chat interface for the interview simulation."""
     st.header("2. Interview Simulation")
+    render_live_metrics(st.session_state.manager.stats)
+    render_debug_panel()
 
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
+    for feedback_event in st.session_state.manager.collect_feedback():
+        add_response_message(feedback_event)
+
+    render_chat_history()
+
+    if st.session_state.manager.has_pending_feedback():
+        st.caption("Feedback on your earlier answers is still being prepared.")
+        if st.button("Refresh Feedback"):
+            st.rerun()
 
     if prompt := st.chat_input("Your Answer..."):
         st.session_state.messages.append({"role": "user", "content": prompt})
         with st.chat_message("user"):
             st.markdown(prompt)
 
-        with st.spinner("Thinking..."):
-            response_generator = st.session_state.manager.ask_next_question(prompt)
-            for response_part in response_generator:
-                if response_part.get("type") == "error":
-                    st.error(response_part["content"])
-                else:
-                    content = response_part.get("content", "")
-                    st.session_state.messages.append({"role": "assistant", "content": content})
-                    with st.chat_message("assistant"):
-                        st.markdown(content)
+        try:
+            turn = st.session_state.manager.stats.answer_count + 1
+            with st.spinner("Thinking..."), span("ui.turn", turn=turn, answer_chars=len(prompt)):
+                render_response_stream(st.session_state.manager.ask_next_question(prompt))
+        except PoolBusyError as e:
+            st.session_state.messages.pop()
+            st.warning(str(e))
+            return
         st.rerun()
 
+def resume_interview(session_id):
+    """
+    Picks an interview back up from its checkpoint after the browser session was lost or the worker
+    was recycled, rebuilding the chat from the transcript and asking the pending question again.
+    """
+    worker_pool = get_worker_pool()
+    try:
+        if worker_pool is not None:
+            manager = RemoteSimulation.resume(worker_pool, session_id)
+        else:
+            manager = SimulationManager.resume(session_id)
+    except (PoolBusyError, ValueError) as e:
+        st.warning(f"Could not resume the interview: {e}")
+        return False
+    if manager is None:
+        del st.query_params["session"]
+        return False
+
+    st.session_state.manager = manager
+    reset_chat()
+    for entry in manager.transcript:
+        st.session_state.messages.append({"role": "assistant", "content": f"{entry.get('interviewer', 'Interviewer')}: {entry['question']}"})
+        st.session_state.messages.append({"role": "user", "content": entry["answer"]})
+        if "feedback" in entry:
+            st.session_state.messages.append({"role": "assistant", "content": f"--- FEEDBACK ---\n{entry['feedback']}\n"})
+    for response_part in manager.ask_next_question():
+        if response_part.get("content") and not response_part.get("type", "").endswith("_delta"):
+            add_response_message(response_part)
+    st.session_state.interview_started = True
+    return True
+
 # --- Main Application ---
 def main():
     """Main function to run the Streamlit application."""
@@ -106,31 +316,58 @@ def main():
     st.write("Welcome! Configure your interview details below and start the simulation.")
 
     initialize_session_state()
-    
+    if not st.session_state.interview_started and "session" in st.query_params:
+        resume_interview(st.query_params["session"])
+    if os.getenv("WARMUP_IMPORTS", "1") == "1":
+        # Load crewai and the agents while the user is still filling in the form.
+        start_background_import("crewai", "langchain_google_genai", *AGENT_MODULES)
+
     company_name, job_role, job_description = render_config_section()
     render_interviewer_profiles()
+    feedback_mode, feedback_batch_size = render_feedback_mode_selector()
+
+    config_data = {
+        "company_name": company_name,
+        "job_role": job_role,
+        "job_description": job_description,
+        "interviewers": [dict(interviewer) for interviewer in st.session_state.interviewers]
+    }
+    if not st.session_state.interview_started and is_config_complete(config_data):
+        # Start generating questions while the user is still looking over the form.
+        st.session_state.question_prefetch.update(config_data)
 
     if st.button("Start Interview Simulation"):
         if validate_inputs(job_description, st.session_state.interviewers):
-            config_data = {
-                "company_name": company_name,
-                "job_role": job_role,
-                "job_description": job_description,
-                "interviewers": st.session_state.interviewers
-            }
-            save_config(config_data)
-            st.success("Configuration saved! Starting simulation...")
-
-            st.session_state.manager = SimulationManager()
-            st.session_state.messages = []
-            st.session_state.interview_started = True
-
-            st.session_state.manager.start_simulation(
-                on_question=lambda msg, is_intro: st.session_state.messages.append({"role": "assistant", "content": msg}),
-                on_feedback=lambda msg: st.session_state.messages.append({"role": "assistant", "content": msg}),
-                on_finish=lambda msg: st.session_state.messages.append({"role": "assistant", "content": msg})
-            )
-            st.rerun()
+            st.success("Starting simulation...")
+
+            if st.session_state.manager is not None:
+                st.session_state.manager.close()
+            worker_pool = get_worker_pool()
+            if worker_pool is not None:
+                st.session_state.manager = RemoteSimulation(worker_pool, config_data, feedback_mode=feedback_mode, feedback_batch_size=feedback_batch_size)
+            else:
+                st.session_state.manager = SimulationManager(config=config_data, feedback_mode=feedback_mode, feedback_batch_size=feedback_batch_size)
+            reset_chat()
+
+            # Waits for a prefetch that is already running; otherwise start_simulation generates the questions.
+            prefetched_questions = st.session_state.question_prefetch.result_for(config_data)
+            if prefetched_questions:
+                st.session_state.manager.adopt_questions(prefetched_questions)
+
+            try:
+                with span("ui.start"):
+                    st.session_state.manager.start_simulation(
+                        on_question=lambda msg, is_intro: st.session_state.messages.append({"role": "assistant", "content": msg}),
+                        on_feedback=lambda msg: st.session_state.messages.append({"role": "assistant", "content": msg}),
+                        on_finish=lambda msg: st.session_state.messages.append({"role": "assistant", "content": msg})
+                    )
+            except PoolBusyError as e:
+                st.warning(str(e))
+            else:
+                st.session_state.interview_started = True
+                # Keeping the session in the URL lets a reload resume the interview from its checkpoint.
+                st.query_params["session"] = st.session_state.manager.session_id
+                st.rerun()
 
     if st.session_state.interview_started:
         render_simulation_section()
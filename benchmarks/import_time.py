@@ -0,0 +1,73 @@
+"""
+Reports how much import time each module adds, using `python -X importtime`.
+
+Usage:
+    python benchmarks/import_time.py                       # app entry points
+    python benchmarks/import_time.py src.simulation_manager --top 15
+    python benchmarks/import_time.py --max-ms 300          # fail if any target is slower
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_TARGETS = ["src.simulation_manager", "src.utils.warmup", "crewai", "langchain_google_genai"]
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def _run_importtime(statement):
+    """Runs a statement under `-X importtime` and returns [(module, self_ms, cumulative_ms)]."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    modules = []
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules.append((name, int(self_us) / 1000, int(cumulative_us) / 1000))
+    return modules
+
+def measure(module_name, startup_modules=()):
+    """
+    Imports a module in a fresh interpreter and returns (total_ms, [(module, self_ms, cumulative_ms)]).
+    Modules the interpreter loads at startup are left out of the breakdown.
+    """
+    modules = [m for m in _run_importtime(f"import {module_name}") if m[0] not in startup_modules]
+    total_ms = next((cumulative for name, _, cumulative in modules if name == module_name), 0.0)
+    return total_ms, [m for m in modules if m[0] != module_name]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS, help="Modules to measure.")
+    parser.add_argument("--top", type=int, default=10, help="How many of the slowest dependencies to list per target.")
+    parser.add_argument("--max-ms", type=float, help="Exit with status 1 if any target takes longer than this.")
+    args = parser.parse_args()
+
+    startup_modules = {name for name, _, _ in _run_importtime("pass")}
+    regressions = []
+    for target in args.targets:
+        try:
+            total_ms, modules = measure(target, startup_modules)
+        except RuntimeError as e:
+            print(f"{target}: could not be imported ({e})\n")
+            continue
+
+        print(f"{target}: {total_ms:.1f} ms")
+        for name, self_ms, cumulative_ms in sorted(modules, key=lambda m: m[2], reverse=True)[:args.top]:
+            print(f"  {cumulative_ms:9.1f} ms cumulative  {self_ms:8.1f} ms self  {name}")
+        print()
+        if args.max_ms is not None and total_ms > args.max_ms:
+            regressions.append(target)
+
+    if regressions:
+        print(f"Over the {args.max_ms} ms budget: {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
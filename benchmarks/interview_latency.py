@@ -0,0 +1,316 @@
+"""
+Drives a full interview through SimulationManager against a deterministic fake LLM and reports
+per-turn latency, total wall clock, LLM call counts and prompt sizes. Runs offline.
+
+Usage:
+    python benchmarks/interview_latency.py                              # 10 questions, 50 ms per call
+    python benchmarks/interview_latency.py --latency 0.2 --tokens 200 --feedback-mode batch
+    python benchmarks/interview_latency.py --save-baseline              # record the current numbers
+    python benchmarks/interview_latency.py --compare --max-regression 0.2   # fail on a >20% regression
+"""
+import argparse
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baselines", "interview_latency.json")
+FAKE_MODEL = "fake-llm"
+FILLERS = ("um", "uh")
+WORDS = ("project", "team", "design", "deliver", "customer", "improve", "measure", "lead", "system", "data")
+
+
+class FakeLLM:
+    """
+    A deterministic stand-in for the model. Each call sleeps for `latency` seconds plus `token_delay`
+    per output token, streams its tokens like the real client and records the prompt size.
+    """
+    def __init__(self, latency=0.05, tokens=80, token_delay=0.0, jitter=0.0, seed=0):
+        self.latency = latency
+        self.tokens = tokens
+        self.token_delay = token_delay
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = []
+
+    def _text(self, words):
+        with self._lock:
+            return " ".join(self._random.choice(WORDS) for _ in range(words))
+
+    def _output(self, role, prompt):
+        if role == "question_generator":
+            match = re.search(r"list of (\d+)", prompt)
+            count = int(match.group(1)) if match else 10
+            return repr([f"Question {i + 1}: how would you {self._text(6)}?" for i in range(count)])
+        if role == "feedback_analyst" and "Answer 1:" in prompt:
+            count = len(re.findall(r"^Answer \d+:", prompt, re.MULTILINE))
+            per_answer = max(1, self.tokens // max(1, count))
+            return json.dumps([{"answer": i + 1, "feedback": self._text(per_answer)} for i in range(count)])
+        if role == "reporting":
+            return "Report saved to: (benchmark, not written)"
+        return self._text(self.tokens)
+
+    def complete(self, role, prompt, stream):
+        """Returns the fake output for one call, emitting it token by token when `stream` is set."""
+        from src.utils.token_stream import emit_token
+        started = time.perf_counter()
+        with self._lock:
+            delay = self.latency * (1 + self._random.uniform(-self.jitter, self.jitter))
+        time.sleep(max(0.0, delay))
+        output = self._output(role, prompt)
+        for token in output.split(" "):
+            if self.token_delay:
+                time.sleep(self.token_delay)
+            if stream:
+                emit_token(token + " ")
+        with self._lock:
+            self.calls.append({"role": role, "prompt_chars": len(prompt), "seconds": time.perf_counter() - started})
+        return output
+
+
+class FakeAgent:
+    """Just enough of a CrewAI agent for SimulationManager: a role and a model name."""
+    def __init__(self, role, llm):
+        self.role = role
+        self.llm = llm
+        self.model = FAKE_MODEL
+
+    def copy(self):
+        return FakeAgent(self.role, self.llm)
+
+
+class FakeTask:
+    """Keeps the task fields SimulationManager sets so the prompt size can be measured."""
+    def __init__(self, description="", agent=None, expected_output="", inputs=None, **kwargs):
+        self.description = description
+        self.agent = agent
+        self.expected_output = expected_output
+        self.inputs = inputs
+
+    def prompt(self):
+        inputs = json.dumps(self.inputs, default=str) if self.inputs else ""
+        return f"{self.description}\n{self.expected_output}\n{inputs}"
+
+
+class FakeCrew:
+    """Runs its single task against the fake LLM."""
+    def __init__(self, agent, fake_llm):
+        self.agents = [agent]
+        self.tasks = []
+        self.fake_llm = fake_llm
+
+    def kickoff(self):
+        task = self.tasks[0]
+        return self.fake_llm.complete(task.agent.role, task.prompt(), stream=True)
+
+
+def _load_manager_class():
+    from src.simulation_manager import SimulationManager
+
+    class BenchmarkSimulationManager(SimulationManager):
+        """SimulationManager with every crew backed by the fake LLM; everything else is the real code path."""
+        def __init__(self, fake_llm, **kwargs):
+            self.fake_llm = fake_llm
+            super().__init__(**kwargs)
+
+        def _initialize_crews(self):
+            for name in ("question_generator", "feedback_analyst", "performance_analysis",
+                         "improvement_recommender", "reporting", "learning_path"):
+                setattr(self, f"{name}_agent", FakeAgent(name, self.fake_llm))
+            self.question_crew = self._new_crew(self.question_generator_agent)
+            self.feedback_crew = self._new_crew(self.feedback_analyst_agent)
+            self.performance_crew = self._new_crew(self.performance_analysis_agent)
+            self.recommendation_crew = self._new_crew(self.improvement_recommender_agent)
+            self.reporting_crew = self._new_crew(self.reporting_agent)
+            self.learning_path_crew = self._new_crew(self.learning_path_agent)
+
+        def _new_crew(self, agent):
+            return FakeCrew(agent, self.fake_llm)
+
+        def _new_task(self, **kwargs):
+            return FakeTask(**kwargs)
+
+        @staticmethod
+        def _model_name(task):
+            return FAKE_MODEL
+
+    return BenchmarkSimulationManager
+
+
+BENCHMARK_CONFIG = {
+    "company_name": "Benchmark Corp",
+    "job_role": "Software Engineer",
+    "job_description": "Design, build and operate data-intensive systems with a small team.",
+    "interviewers": [
+        {"name": "Alice", "role": "Hiring Manager", "linkedin": "https://www.linkedin.com/in/alice/"},
+        {"name": "Bob", "role": "Senior Engineer", "linkedin": "https://www.linkedin.com/in/bob/"},
+    ],
+}
+
+def lift_request_quota():
+    """
+    Raises the per-model request quota so the benchmark measures the app rather than the rate limiter.
+    Must be called before the first LLM call in the process, when the fake model's guard is created.
+    """
+    os.environ.setdefault("LLM_REQUESTS_PER_MINUTE", "1000000")
+    os.environ.setdefault("LLM_BURST", "1000")
+
+def make_answer(rng, words):
+    """A deterministic answer with the occasional filler word."""
+    return " ".join(rng.choice(FILLERS) if rng.random() < 0.05 else rng.choice(WORDS) for _ in range(words))
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+def run_interview(fake_llm, feedback_mode="sync", answer_words=60, seed=0):
+    """Runs one complete interview and returns its turn latencies, finalisation time and total time."""
+    manager_class = _load_manager_class()
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    manager = manager_class(
+        fake_llm, config=BENCHMARK_CONFIG, feedback_mode=feedback_mode, use_cache=False,
+        use_question_bank=False, record_session=False, checkpoint=False,
+    )
+    noop = lambda *args, **kwargs: None
+    manager.start_simulation(on_question=noop, on_feedback=noop, on_finish=noop)
+    list(manager.ask_next_question())
+
+    turns = []
+    finalize_seconds = None
+    while not manager.interview_finished:
+        last_question = manager.current_question_index >= len(manager.questions)
+        turn_started = time.perf_counter()
+        first_event = None
+        for _ in manager.ask_next_question(make_answer(rng, answer_words)):
+            if first_event is None:
+                first_event = time.perf_counter() - turn_started
+        elapsed = time.perf_counter() - turn_started
+        if last_question:
+            finalize_seconds = elapsed
+        else:
+            turns.append({"seconds": elapsed, "first_event_seconds": first_event or elapsed})
+    manager.close()
+    return {"turns": turns, "finalize_seconds": finalize_seconds, "total_seconds": time.perf_counter() - started}
+
+def summarize(runs, calls):
+    """Aggregates several interview runs and the fake LLM's call log into the reported metrics."""
+    turn_seconds = [turn["seconds"] for run in runs for turn in run["turns"]]
+    first_event = [turn["first_event_seconds"] for run in runs for turn in run["turns"]]
+    by_role = defaultdict(lambda: {"calls": 0, "prompt_chars": 0, "max_prompt_chars": 0})
+    for call in calls:
+        role = by_role[call["role"]]
+        role["calls"] += 1
+        role["prompt_chars"] += call["prompt_chars"]
+        role["max_prompt_chars"] = max(role["max_prompt_chars"], call["prompt_chars"])
+    return {
+        "runs": len(runs),
+        "turn_p50": percentile(turn_seconds, 0.50) if turn_seconds else 0.0,
+        "turn_p95": percentile(turn_seconds, 0.95) if turn_seconds else 0.0,
+        "first_event_p50": percentile(first_event, 0.50) if first_event else 0.0,
+        "first_event_p95": percentile(first_event, 0.95) if first_event else 0.0,
+        "finalize_mean": sum(run["finalize_seconds"] or 0.0 for run in runs) / len(runs),
+        "total_mean": sum(run["total_seconds"] for run in runs) / len(runs),
+        "llm_calls_per_run": len(calls) / len(runs),
+        "prompt_chars_per_run": sum(call["prompt_chars"] for call in calls) / len(runs),
+        "by_role": {role: dict(values) for role, values in sorted(by_role.items())},
+    }
+
+def print_report(results, baseline=None):
+    def line(label, key, unit="ms", scale=1000):
+        value = results[key] * scale
+        text = f"  {label:<24}{value:10.1f} {unit}"
+        if baseline and key in baseline and baseline[key]:
+            change = (results[key] - baseline[key]) / baseline[key]
+            text += f"   ({change:+.1%} vs. baseline {baseline[key] * scale:.1f} {unit})"
+        print(text)
+
+    print(f"Interview latency over {results['runs']} run(s):")
+    line("turn p50", "turn_p50")
+    line("turn p95", "turn_p95")
+    line("first event p50", "first_event_p50")
+    line("first event p95", "first_event_p95")
+    line("finalize", "finalize_mean")
+    line("total wall clock", "total_mean")
+    line("LLM calls per run", "llm_calls_per_run", unit="", scale=1)
+    line("prompt chars per run", "prompt_chars_per_run", unit="", scale=1)
+    print("\n  calls by agent:")
+    for role, values in results["by_role"].items():
+        mean = values["prompt_chars"] / values["calls"]
+        print(f"    {role:<26}{values['calls'] / results['runs']:6.1f} calls/run   {mean:8.0f} avg chars   {values['max_prompt_chars']:8d} max chars")
+
+# Metrics where a higher value is a regression.
+COMPARED_METRICS = ("turn_p50", "turn_p95", "finalize_mean", "total_mean", "llm_calls_per_run", "prompt_chars_per_run")
+
+def regressions(results, baseline, max_regression):
+    """Returns the metrics that got worse than the baseline by more than `max_regression` (a fraction)."""
+    return [
+        key for key in COMPARED_METRICS
+        if baseline.get(key) and (results[key] - baseline[key]) / baseline[key] > max_regression
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="How many complete interviews to run.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake LLM base latency per call, in seconds.")
+    parser.add_argument("--tokens", type=int, default=80, help="Output tokens per fake LLM call.")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="Extra seconds per output token.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- fraction applied to the latency.")
+    parser.add_argument("--answer-words", type=int, default=60, help="Words per simulated answer.")
+    parser.add_argument("--feedback-mode", default="sync", help="Feedback mode to benchmark (sync, async, batch, exam).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--real-limits", action="store_true", help="Keep the configured LLM request quota instead of lifting it.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline file to save to or compare against.")
+    parser.add_argument("--save-baseline", action="store_true", help="Write these results to the baseline file.")
+    parser.add_argument("--compare", action="store_true", help="Compare against the baseline file.")
+    parser.add_argument("--max-regression", type=float, help="With --compare, exit with status 1 if a metric is this much worse (e.g. 0.2).")
+    args = parser.parse_args()
+
+    if not args.real_limits:
+        lift_request_quota()
+    # After lifting the quota: values already in the environment win over .env.
+    from src.utils.llm_registry import load_env
+    load_env()
+
+    fake_llm = FakeLLM(args.latency, args.tokens, args.token_delay, args.jitter, args.seed)
+    runs = [run_interview(fake_llm, args.feedback_mode, args.answer_words, seed=args.seed + i) for i in range(args.runs)]
+    results = summarize(runs, fake_llm.calls)
+    results["settings"] = {k: getattr(args, k) for k in ("latency", "tokens", "token_delay", "jitter", "answer_words", "feedback_mode")}
+
+    baseline = None
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; run with --save-baseline first.")
+            sys.exit(2)
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("settings") != results["settings"]:
+            print(f"Warning: baseline was recorded with different settings: {baseline.get('settings')}\n")
+
+    print_report(results, baseline)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+
+    if baseline and args.max_regression is not None:
+        worse = regressions(results, baseline, args.max_regression)
+        if worse:
+            print(f"\nRegressed by more than {args.max_regression:.0%}: {', '.join(worse)}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
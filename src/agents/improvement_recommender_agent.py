@@ -1,12 +1,8 @@
 from crewai import Agent
+from src.utils.llm_registry import get_llm
 from src.tools.skill_gap_analyzer_tool import SkillGapAnalyzerTool
-from langchain_google_genai import ChatGoogleGenerativeAI
-import os
-from dotenv import load_dotenv
 
-load_dotenv()
-
-llm = ChatGoogleGenerativeAI(model="gemini-pro", google_api_key=os.getenv("GOOGLE_API_KEY"))
+llm = get_llm(agent="improvement_recommender")
 
 skill_gap_analyzer_tool = SkillGapAnalyzerTool()
 
@@ -1,12 +1,8 @@
 from crewai import Agent
+from src.utils.llm_registry import get_llm
 from src.tools.resource_finder_tool import ResourceFinderTool
-from langchain_google_genai import ChatGoogleGenerativeAI
-import os
-from dotenv import load_dotenv
 
-load_dotenv()
-
-llm = ChatGoogleGenerativeAI(model="gemini-pro", google_api_key=os.getenv("GOOGLE_API_KEY"))
+llm = get_llm(agent="learning_path")
 
 resource_finder_tool = ResourceFinderTool()
 
@@ -1,25 +1,23 @@
 from crewai import Agent
+from src.utils.llm_registry import get_llm
 from src.tools.session_saver_tool import SessionSaverTool
-from langchain_google_genai import ChatGoogleGenerativeAI
-import os
-from dotenv import load_dotenv
+from src.tools.progress_tool import ProgressTool
 
-load_dotenv()
-
-llm = ChatGoogleGenerativeAI(model="gemini-pro", google_api_key=os.getenv("GOOGLE_API_KEY"))
+llm = get_llm(agent="progress_tracker")
 
 session_saver_tool = SessionSaverTool()
+progress_tool = ProgressTool()
 
 progress_tracker_agent = Agent(
     role="Progress Tracker Agent",
-    goal="Save the user's interview performance data to track progress over time.",
+    goal="Save the user's interview performance data and report how they are progressing over time.",
     backstory=(
         "As a meticulous archivist and data manager, you are responsible for maintaining a record of all "
         "interview simulations. You ensure that every session's performance summary and recommendations "
         "are saved correctly, creating a valuable history for users to review their journey and "
-        "see how they've improved."
+        "see how they've improved. You use precomputed progress trends rather than re-reading old sessions."
     ),
-    tools=[session_saver_tool],
+    tools=[session_saver_tool, progress_tool],
     allow_delegation=False,
     verbose=True,
     llm=llm
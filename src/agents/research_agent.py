@@ -1,13 +1,9 @@
 from crewai import Agent
-from dotenv import load_dotenv
-from langchain_google_genai import ChatGoogleGenerativeAI
-import os
+from ..utils.llm_registry import get_llm
 from ..tools.web_search_tool import search_company_info
 from ..tools.job_description_analyzer import analyze_job_description
 
-load_dotenv()
-
-llm = ChatGoogleGenerativeAI(model="gemini-pro", google_api_key=os.getenv("GOOGLE_API_KEY"))
+llm = get_llm(agent="research")
 
 research_agent = Agent(
     role='Company Research Specialist',
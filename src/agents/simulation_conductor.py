@@ -1,12 +1,8 @@
 from crewai import Agent
+from ..utils.llm_registry import get_llm
 from ..tools.personality_simulator_tool import personality_simulator_tool
-from langchain_google_genai import ChatGoogleGenerativeAI
-import os
-from dotenv import load_dotenv
 
-load_dotenv()
-
-llm = ChatGoogleGenerativeAI(model="gemini-pro", google_api_key=os.getenv("GOOGLE_API_KEY"))
+llm = get_llm(agent="simulation_conductor")
 
 simulation_conductor = Agent(
     role="Simulation Conductor",
@@ -1,9 +1,49 @@
+import copy
 import json
+import os
+import threading
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
-def load_interview_config():
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+
+class InterviewerConfig(BaseModel):
+    """One interviewer on the panel."""
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
+    name: str
+    role: str = ""
+    linkedin: str = ""
+
+class InterviewConfig(BaseModel):
+    """The settings for one interview session, validated in memory."""
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
+    company_name: str
+    job_role: str
+    job_description: str = ""
+    interviewers: List[InterviewerConfig] = Field(default_factory=list)
+    user_id: Optional[str] = None
+
+def to_config_dict(config):
+    """Validates an InterviewConfig or a plain mapping and returns it as a plain dict."""
+    if not isinstance(config, InterviewConfig):
+        config = InterviewConfig.model_validate(config)
+    return config.model_dump(exclude_none=True)
+
+_file_cache = {}
+_file_cache_lock = threading.Lock()
+
+def load_interview_config(path=CONFIG_PATH):
     """
-    Loads the interview configuration from the config.json file.
+    Loads the interview configuration from the config.json file. The parsed file is cached and only
+    re-read when its modification time changes; each caller gets its own copy.
     """
-    with open('src/config/config.json', 'r') as f:
-        config = json.load(f)
-    return config
+    mtime = os.path.getmtime(path)
+    with _file_cache_lock:
+        cached = _file_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, 'r') as f:
+                cached = (mtime, json.load(f))
+            _file_cache[path] = cached
+    return copy.deepcopy(cached[1])
@@ -1,4 +1,11 @@
 from crewai import Crew, Task
+from ..utils.stage_executor import StageExecutor
+from ..utils.llm_cache import get_llm_cache, make_cache_key
+from ..utils.llm_registry import get_guard
+from ..utils.text_metrics import estimate_tokens
+from ..utils.interviewer_profiles import profile_interviewers
+from ..utils.tracing import span
+from ..utils.context_builder import fit_text, task_budget
 from ..agents.research_agent import research_agent
 from ..agents.interviewer_profiler import interviewer_profiler
 from ..agents.question_generator import question_generator
@@ -18,7 +25,8 @@ interviewer_profiling_task = Task(
 question_generation_task = Task(
     description = 'Generate relevant interview questions for {job_role} position at {company_name} based on company research',
     agent = question_generator,
-    expected_output = 'List of tailored interview questions'
+    expected_output = 'List of tailored interview questions',
+    context = [company_research_task, interviewer_profiling_task]
 )
 
 
@@ -26,4 +34,117 @@ interview_prep_crew = Crew(
     agents = [research_agent, interviewer_profiler, question_generator],
     tasks = [company_research_task, interviewer_profiling_task, question_generation_task],
     verbose = True
-)
\ No newline at end of file
+)
+
+
+def _new_task(description, expected_output, agent):
+    """
+    Builds a fresh task for one run. crewai updates a task while it runs, so the module-level tasks
+    above are only used as templates and never kicked off directly. The agent is copied as well: its
+    executor state is also updated on every run, and the profiling stage runs several tasks at once.
+    """
+    return Task(description=description, expected_output=expected_output, agent=agent.copy())
+
+def _from_template(template, inputs):
+    """A fresh task with the template's placeholders filled in from `inputs`."""
+    return _new_task(template.description.format_map(inputs), template.expected_output, template.agent)
+
+def _run_task(task, task_type="default", budget=None, use_cache=True):
+    """
+    Runs a single task in its own crew so independent tasks can execute concurrently. The call goes
+    through the model's guard (rate limit, retries, circuit breaker and in-flight slot), the LLM cache
+    and, when a SessionBudget is given, the session's token budget.
+    """
+    llm = getattr(task.agent, "llm", None)
+    model = getattr(llm, "model", None) or getattr(llm, "model_name", None)
+    cache = get_llm_cache() if use_cache else None
+    cache_key = make_cache_key(task.agent.role, model, task.description, task.expected_output) if cache is not None else None
+    with span("crew.run", agent=task.agent.role, task_type=task_type) as run_span:
+        if cache is not None:
+            cached_result = cache.get(cache_key)
+            run_span.set(cache_hit=cached_result is not None)
+            if cached_result is not None:
+                return cached_result
+
+        prompt_tokens = estimate_tokens(f"{task.description}\n{task.expected_output}")
+        if budget is not None:
+            budget.check(prompt_tokens)
+
+        def kickoff():
+            if budget is not None:
+                budget.charge(prompt_tokens)
+            return str(Crew(agents=[task.agent], tasks=[task], verbose=True).kickoff())
+
+        result = get_guard(model).call(kickoff)
+        if budget is not None:
+            budget.charge(estimate_tokens(result))
+        if cache is not None:
+            cache.set(cache_key, result, task_type)
+        return result
+
+def _profile_interviewer(inputs, interviewer, budget=None):
+    """Profiles a single interviewer in its own sub-task."""
+    task = _new_task(
+        (
+            f"Research the professional background, career path, expertise areas, and management style of "
+            f"{interviewer.get('name')}, {interviewer.get('role')} at {inputs.get('company_name')} "
+            f"(LinkedIn: {interviewer.get('linkedin') or 'not provided'}). Based on their role and experience, "
+            f"predict specific types of questions they are likely to ask"
+        ),
+        'A detailed interviewer profile with predicted questions this interviewer is likely to ask',
+        interviewer_profiler
+    )
+    # Profiles are cached per interviewer by `profile_interviewers`.
+    return _run_task(task, task_type="interviewer_profile", budget=budget, use_cache=False)
+
+def _profile_interviewers(inputs, budget=None, use_cache=True):
+    """
+    Profiles each interviewer in parallel when `inputs` lists them under "interviewers", reusing
+    cached profiles; otherwise falls back to the single combined profiling task.
+    """
+    interviewers = inputs.get("interviewers")
+    if not interviewers:
+        return _run_task(_from_template(interviewer_profiling_task, inputs), "interviewer_profile", budget, use_cache)
+    profiles = profile_interviewers(
+        interviewers,
+        lambda interviewer: _profile_interviewer(inputs, interviewer, budget),
+        company_name=inputs.get("company_name", ""),
+        cache=get_llm_cache() if use_cache else None
+    )
+    return "\n\n".join(
+        f"{interviewer.get('name')} ({interviewer.get('role')}):\n{profile}"
+        for interviewer, profile in zip(interviewers, profiles)
+    )
+
+def _generate_questions(inputs, company_research, interviewer_profiles, budget=None, use_cache=True):
+    """
+    Runs question generation with both research outputs passed in as explicit context, each cut to
+    half of the question task's token budget.
+    """
+    context_budget = task_budget("questions") // 2
+    description = (
+        question_generation_task.description.format_map(inputs)
+        + f"\n\nCompany research:\n{fit_text(company_research, context_budget)}"
+        + f"\n\nInterviewer profiles:\n{fit_text(interviewer_profiles, context_budget)}"
+    )
+    task = _new_task(description, question_generation_task.expected_output, question_generator)
+    return _run_task(task, "questions", budget, use_cache)
+
+def run_interview_prep(inputs, budget=None, use_cache=True):
+    """
+    Runs the prep pipeline with company research and interviewer profiling in parallel,
+    then generates questions from both. Pass the interviewer dicts under "interviewers" to profile
+    each one separately, and a SessionBudget to count the calls against a session's token limit.
+    Returns the three outputs and wall-clock timings per task and for the whole run.
+    """
+    executor = StageExecutor(max_workers=2)
+    executor.add_stage("company_research", lambda: _run_task(_from_template(company_research_task, inputs), "research", budget, use_cache))
+    executor.add_stage("interviewer_profiles", lambda: _profile_interviewers(inputs, budget, use_cache))
+    executor.add_stage(
+        "questions",
+        lambda company_research, interviewer_profiles: _generate_questions(inputs, company_research, interviewer_profiles, budget, use_cache),
+        depends_on=("company_research", "interviewer_profiles")
+    )
+    results = dict(executor.run())
+    results["timings"] = executor.timings
+    return results
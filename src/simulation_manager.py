@@ -1,47 +1,185 @@
 import random
 import ast
-from crewai import Task, Crew
-from src.config.config import load_interview_config
-from src.agents.feedback_analyst import feedback_analyst_agent
-from src.agents.question_generator import question_generator as question_generator_agent
-from src.agents.performance_analysis_agent import performance_analysis_agent
-from src.agents.improvement_recommender_agent import improvement_recommender_agent
-from src.agents.reporting_agent import reporting_agent
-from src.agents.learning_path_agent import learning_path_agent
+import contextvars
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.config.config import load_interview_config, to_config_dict
+from src.utils.stage_executor import StageExecutor
+from src.utils.llm_cache import get_llm_cache, make_cache_key
+from src.utils.llm_registry import get_guard
+from src.utils.resilience import LLMError
+from src.utils.token_stream import capture_tokens, stream_tokens
+from src.utils.transcript_stats import TranscriptStats
+from src.utils.question_bank import get_question_bank, extract_skills
+from src.utils.report_writer import new_session_id, session_scope
+from src.utils.session_store import get_session_store
+from src.utils.checkpoint import get_checkpoint_store
+from src.utils.tracing import span
+from src.utils.context_builder import SessionBudget, TranscriptDigest, compact_interviewers, fit_text, session_token_limit, task_budget
+from src.utils.text_metrics import estimate_tokens, readiness_score
+
+FEEDBACK_MODES = ("sync", "async", "batch", "exam")
+QUESTION_COUNT = 10
+
+# crewai, langchain and the agent modules are slow to import, so they are only loaded when the
+# first SimulationManager is created. `app.py` can warm them up in the background.
+AGENT_MODULES = (
+    "src.agents.question_generator",
+    "src.agents.feedback_analyst",
+    "src.agents.performance_analysis_agent",
+    "src.agents.improvement_recommender_agent",
+    "src.agents.reporting_agent",
+    "src.agents.learning_path_agent",
+)
 
 class SimulationManager:
     """
     Manages the entire interview simulation, from question generation to final reporting.
+
+    In "sync" feedback mode each answer is evaluated before the next question is returned.
+    In "async" mode the evaluation runs on a background worker pool and the next question is
+    returned immediately; finished feedback is picked up with `collect_feedback()`.
+    In "batch" mode answers are graded `feedback_batch_size` at a time in a single LLM call, and in
+    "exam" mode all answers are graded together once the last question has been answered.
     """
-    def __init__(self):
-        """Initializes the SimulationManager, loading configuration and setting up all necessary crews."""
-        self.config = load_interview_config()
+    def __init__(self, config=None, feedback_mode="sync", feedback_workers=2, use_cache=True, stream_output=True, feedback_batch_size=3, use_question_bank=True, record_session=True, session_id=None, checkpoint=True):
+        """
+        Initializes the SimulationManager and sets up all necessary crews.
+        `config` is an InterviewConfig or an equivalent dict; the config file is only read when it is omitted.
+        """
+        if feedback_mode not in FEEDBACK_MODES:
+            raise ValueError(f"Unknown feedback mode '{feedback_mode}'. Expected one of {FEEDBACK_MODES}.")
+        self.config = to_config_dict(config if config is not None else load_interview_config())
+        self.session_id = session_id or new_session_id()
         self.interview_finished = False
         self.interviewers = self.config.get("interviewers", [])
         self.current_interviewer_index = 0
         self.questions = []
         self.current_question_index = 0
         self.transcript = []
+        self.stats = TranscriptStats()
+        self.digest = TranscriptDigest()
+        self.budget = SessionBudget(session_token_limit())
+        self.last_interviewer = None
+        self.stage_timings = {}
+        self.feedback_mode = feedback_mode
+        self.feedback_workers = feedback_workers
+        self._feedback_pool = None
+        self._pending_feedback = {}
+        self._feedback_lock = threading.Lock()
+        self.feedback_batch_size = max(1, feedback_batch_size)
+        self._feedback_queue = []
+        self.cache = get_llm_cache() if use_cache else None
+        self.question_bank = get_question_bank() if use_question_bank else None
+        self.session_store = get_session_store() if record_session else None
+        self.checkpoints = get_checkpoint_store() if checkpoint else None
+        self.stream_output = stream_output
         self._initialize_crews()
 
     def _initialize_crews(self):
         """Initializes all the CrewAI crews with their respective agents."""
-        self.question_crew = Crew(agents=[question_generator_agent], tasks=[], verbose=2)
-        self.feedback_crew = Crew(agents=[feedback_analyst_agent], tasks=[], verbose=2)
-        self.performance_crew = Crew(agents=[performance_analysis_agent], tasks=[], verbose=2)
-        self.recommendation_crew = Crew(agents=[improvement_recommender_agent], tasks=[], verbose=2)
-        self.reporting_crew = Crew(agents=[reporting_agent], tasks=[], verbose=2)
-        self.learning_path_crew = Crew(agents=[learning_path_agent], tasks=[], verbose=2)
-
-    def _run_crew(self, crew, task):
-        """A generic method to run a task on a given crew with error handling."""
-        try:
-            crew.tasks = [task]
-            result = crew.kickoff()
+        from src.agents.feedback_analyst import feedback_analyst_agent
+        from src.agents.question_generator import question_generator as question_generator_agent
+        from src.agents.performance_analysis_agent import performance_analysis_agent
+        from src.agents.improvement_recommender_agent import improvement_recommender_agent
+        from src.agents.reporting_agent import reporting_agent
+        from src.agents.learning_path_agent import learning_path_agent
+
+        self.question_generator_agent = question_generator_agent
+        self.feedback_analyst_agent = feedback_analyst_agent
+        self.performance_analysis_agent = performance_analysis_agent
+        self.improvement_recommender_agent = improvement_recommender_agent
+        self.reporting_agent = reporting_agent
+        self.learning_path_agent = learning_path_agent
+
+        self.question_crew = self._new_crew(question_generator_agent)
+        self.feedback_crew = self._new_crew(feedback_analyst_agent)
+        self.performance_crew = self._new_crew(performance_analysis_agent)
+        self.recommendation_crew = self._new_crew(improvement_recommender_agent)
+        self.reporting_crew = self._new_crew(reporting_agent)
+        self.learning_path_crew = self._new_crew(learning_path_agent)
+
+    def _new_crew(self, agent):
+        """Creates an empty single-agent crew."""
+        from crewai import Crew
+        return Crew(agents=[agent], tasks=[], verbose=2)
+
+    def _new_task(self, **kwargs):
+        """Creates a CrewAI task."""
+        from crewai import Task
+        return Task(**kwargs)
+
+    @staticmethod
+    def _model_name(task):
+        """Returns the model name used by a task's agent, if it can be determined."""
+        llm = getattr(task.agent, "llm", None)
+        return getattr(llm, "model", None) or getattr(llm, "model_name", None)
+
+    @staticmethod
+    def _prompt_text(task):
+        """The text a task sends to the model, for size accounting."""
+        inputs = getattr(task, "inputs", None)
+        return f"{task.description}\n{task.expected_output}\n{json.dumps(inputs, default=str) if inputs else ''}"
+
+    def _cache_key(self, task):
+        """Builds the result-cache key for a task from its agent, model, prompt and inputs."""
+        return make_cache_key(task.agent.role, self._model_name(task), task.description, task.expected_output, getattr(task, "inputs", None))
+
+    @staticmethod
+    def _has_side_effects(task):
+        """True if the task's agent has a tool that must not run twice, such as one that writes a file."""
+        return any(getattr(tool, "has_side_effects", False) for tool in getattr(task.agent, "tools", None) or [])
+
+    def _run_crew(self, crew, task, task_type="default", use_cache=True, on_token=None):
+        """
+        A generic method to run a task on a given crew.
+        Calls go through the model's shared rate limiter, retry policy and circuit breaker, and raise an
+        LLMError subclass if the task cannot be completed. Tasks whose agent has side-effecting tools are
+        not retried, since a retry re-runs the whole kickoff.
+        Successful results are cached by content; pass `use_cache=False` to bypass the cache for a call.
+        If `on_token` is given, it is called with each output token as the model streams it.
+        Every attempt is charged to the session's token budget, and BudgetExceededError is raised
+        without calling the model once the budget is spent. Cache hits are free.
+        """
+        with span("crew.run", agent=task.agent.role, task_type=task_type) as run_span:
+            prompt_tokens = estimate_tokens(self._prompt_text(task))
+            run_span.set(prompt_tokens_est=prompt_tokens)
+            cache = self.cache if use_cache else None
+            cache_key = self._cache_key(task) if cache is not None else None
+            if cache is not None:
+                cached_result = cache.get(cache_key)
+                run_span.set(cache_hit=cached_result is not None)
+                if cached_result is not None:
+                    if on_token is not None:
+                        on_token(cached_result)
+                    return cached_result
+
+            self.budget.check(prompt_tokens)
+            attempts = []
+            def kickoff():
+                attempts.append(1)
+                self.budget.charge(prompt_tokens)
+                with span("task", agent=task.agent.role, attempt=len(attempts)):
+                    crew.tasks = [task]
+                    if on_token is None:
+                        return str(crew.kickoff())
+                    with capture_tokens(on_token):
+                        return str(crew.kickoff())
+
+            try:
+                result = get_guard(self._model_name(task)).call(kickoff, retryable=not self._has_side_effects(task))
+            except LLMError as e:
+                print(f"An error occurred in {crew.__class__.__name__}: {e}")
+                raise
+            finally:
+                run_span.set(attempts=len(attempts))
+            response_tokens = estimate_tokens(result)
+            self.budget.charge(response_tokens)
+            run_span.set(response_tokens_est=response_tokens)
+            if cache is not None:
+                cache.set(cache_key, result, task_type)
             return result
-        except Exception as e:
-            print(f"An error occurred in {crew.__class__.__name__}: {e}")
-            return f"Could not complete the task due to an error: {e}"
 
     def get_current_interviewer(self):
         """Gets the current interviewer based on a round-robin index."""
@@ -54,45 +192,99 @@ class SimulationManager:
         if self.interviewers:
             self.current_interviewer_index = (self.current_interviewer_index + 1) % len(self.interviewers)
 
-    def _generate_questions(self):
-        """Generates a list of interview questions using the question generation crew."""
+    def _generate_questions(self, mark_used=True):
+        """
+        Builds the question list, serving stored questions from the question bank first and
+        asking the question generation crew only for the shortfall. When the bank covers the whole
+        list, any fresh questions the bank's policy asks for are generated in the background.
+        """
         print("Generating interview questions...")
+        company = self.config.get('company_name', '')
+        role = self.config.get('job_role', '')
+        skills = extract_skills(self.config.get('job_description', ''))
+        user_id = self.config.get('user_id')
+
+        banked = self.question_bank.select(company, role, skills, QUESTION_COUNT, user_id=user_id) if self.question_bank else []
+        generated = []
+        shortfall = QUESTION_COUNT - len(banked)
+        if shortfall > 0:
+            generated = self._request_questions(shortfall, avoid=banked)
+            if self.question_bank and generated:
+                self.question_bank.add_questions(generated, company, role, skills)
+        elif self.question_bank and self.question_bank.freshness_policy.fresh_count(QUESTION_COUNT):
+            context = contextvars.copy_context()
+            threading.Thread(
+                target=context.run, args=(self._top_up_question_bank, company, role, skills, banked),
+                name="question-bank-top-up", daemon=True
+            ).start()
+
+        self.questions = banked + generated[:shortfall]
+        random.shuffle(self.questions)
+        if mark_used and self.question_bank and self.questions:
+            self.question_bank.mark_used(self.questions, user_id=user_id)
+        print(f"Prepared {len(self.questions)} questions ({len(banked)} from the question bank).")
+
+    def _top_up_question_bank(self, company, role, skills, avoid):
+        """Generates the policy's share of new questions and stores them for later sessions."""
+        generated = self._request_questions(self.question_bank.freshness_policy.fresh_count(QUESTION_COUNT), avoid=avoid)
+        if generated:
+            added = self.question_bank.add_questions(generated, company, role, skills)
+            print(f"Added {added} new questions to the question bank.")
+
+    def _request_questions(self, count, avoid=()):
+        """Asks the question generation crew for `count` new questions and parses its output."""
+        avoid_text = f"\n                    Do not repeat any of these questions: {list(avoid)}" if avoid else ""
         try:
-            task = Task(
+            task = self._new_task(
                 description=f"""
-                    Generate a list of 10 interview questions based on the following details:
+                    Generate a list of {count} interview questions based on the following details:
                     - Company: {self.config.get('company_name')}
                     - Job Role: {self.config.get('job_role')}
-                    - Job Description: {self.config.get('job_description')}
-                    - Interviewers: {self.interviewers}
-                    The questions should be diverse, covering technical, behavioral, and situational topics.
+                    - Job Description: {fit_text(self.config.get('job_description'), task_budget('questions'))}
+                    - Interviewers: {compact_interviewers(self.interviewers)}
+                    The questions should be diverse, covering technical, behavioral, and situational topics.{avoid_text}
                     Return ONLY the list of questions as a Python list of strings.
                 """,
-                agent=question_generator_agent,
-                expected_output="A Python list of 10 string questions."
+                agent=self.question_generator_agent,
+                expected_output=f"A Python list of {count} string questions."
             )
-            question_list_str = self._run_crew(self.question_crew, task)
-            
+            # With a question bank, repeated sessions should get new questions rather than a cached list.
+            question_list_str = self._run_crew(self.question_crew, task, task_type="questions", use_cache=self.question_bank is None)
+        except Exception as e:
+            print(f"An unexpected error occurred during question generation: {e}")
+            return []
+        return self._parse_question_list(question_list_str)
+
+    @staticmethod
+    def _parse_question_list(question_list_str):
+        """Parses the crew's output, which should be a Python list literal, falling back to one question per line."""
+        try:
             # The output might be a string representation of a list, so we parse it safely.
-            self.questions = ast.literal_eval(question_list_str)
-            print("Questions generated successfully.")
+            questions = ast.literal_eval(question_list_str)
+            if isinstance(questions, (list, tuple)):
+                return [str(q).strip() for q in questions if str(q).strip()]
         except (ValueError, SyntaxError, TypeError) as e:
             print(f"Error parsing generated questions: {e}. Using fallback split.")
-            self.questions = [q.strip() for q in str(question_list_str).split('\n') if q.strip()]
-        except Exception as e:
-            print(f"An unexpected error occurred during question generation: {e}")
-            self.questions = []
+        return [q.strip() for q in str(question_list_str).split('\n') if q.strip()]
+
+    def adopt_questions(self, questions):
+        """Uses questions generated ahead of time (e.g. speculatively) instead of generating them at start."""
+        self.questions = list(questions)
+        if self.question_bank and self.questions:
+            self.question_bank.mark_used(self.questions, user_id=self.config.get('user_id'))
 
     def start_simulation(self, on_question, on_feedback, on_finish):
-        """Starts the interview simulation, generates questions, and sends the intro message."""
+        """Starts the interview simulation, generates questions unless they were adopted, and sends the intro message."""
         print("🚀 Starting Interview Simulation...")
         on_finish("🚀 Starting Interview Simulation...")
 
-        self._generate_questions()
+        if not self.questions:
+            self._generate_questions()
 
         if not self.questions:
             on_finish("Could not generate questions due to an error. Please check the logs. Aborting simulation.")
             return
+        self._save_checkpoint()
 
         interviewer = self.get_current_interviewer()
         intro = f"{interviewer['name']} ({interviewer['role']}): Hello, thank you for coming in today. Let's start with a few questions."
@@ -105,7 +297,12 @@ class SimulationManager:
         try:
             if user_response:
                 self._process_user_response(user_response)
-                yield from self._get_feedback(user_response)
+                if self.feedback_mode == "async":
+                    yield self._submit_feedback(len(self.transcript) - 1)
+                elif self.feedback_mode in ("batch", "exam"):
+                    yield from self._queue_feedback(len(self.transcript) - 1)
+                else:
+                    yield from self._get_feedback(user_response)
 
             if self.current_question_index < len(self.questions):
                 yield self._get_next_question()
@@ -116,88 +313,408 @@ class SimulationManager:
             yield {"type": "error", "content": f"Sorry, an unexpected error occurred: {e}"}
 
     def _process_user_response(self, user_response):
-        """Adds the last question and user's response to the transcript."""
+        """Adds the last question and user's response to the transcript and updates the running stats."""
         last_question = self.questions[self.current_question_index - 1]
-        self.transcript.append({"question": last_question, "answer": user_response})
+        interviewer_name = (self.last_interviewer or self.get_current_interviewer())["name"]
+        self.transcript.append({"question": last_question, "answer": user_response, "interviewer": interviewer_name})
+        self.stats.add(user_response, interviewer_name)
+        self.digest.add(self.transcript[-1])
+        self._log_checkpoint({
+            "type": "answer",
+            "entry": self.transcript[-1],
+            "current_question_index": self.current_question_index,
+            "current_interviewer_index": self.current_interviewer_index,
+            "tokens_used": self.budget.used,
+        })
 
-    def _get_feedback(self, user_response):
-        """Generates and yields feedback for the user's response."""
-        last_question = self.transcript[-1]["question"]
-        task = Task(
-            description=f"Evaluate the user's answer: '{user_response}' for the question: '{last_question}'.",
-            agent=feedback_analyst_agent,
+    def _evaluate_answer(self, transcript_index, crew=None, on_token=None, agent=None):
+        """
+        Runs the feedback crew for one transcript entry and stores the result on that entry.
+        Background evaluations pass their own crew and agent.
+        """
+        entry = self.transcript[transcript_index]
+        task = self._new_task(
+            description=f"Evaluate the user's answer: '{fit_text(entry['answer'], task_budget('feedback'))}' for the question: '{entry['question']}'.",
+            agent=agent or self.feedback_analyst_agent,
             expected_output="Constructive feedback on the user's response."
         )
-        feedback_result = self._run_crew(self.feedback_crew, task)
+        feedback_result = self._run_crew(crew or self.feedback_crew, task, task_type="feedback", on_token=on_token)
+        entry["feedback"] = str(feedback_result)
+        self._log_checkpoint({"type": "feedback", "index": transcript_index, "feedback": entry["feedback"]})
+        return entry["feedback"]
+
+    def _get_feedback(self, user_response):
+        """Generates and yields feedback for the user's response, streaming it as `feedback_delta` events."""
+        transcript_index = len(self.transcript) - 1
+        try:
+            if not self.stream_output:
+                feedback_result = self._evaluate_answer(transcript_index)
+            else:
+                for kind, value in stream_tokens(self._evaluate_answer, transcript_index):
+                    if kind == "token":
+                        yield {"type": "feedback_delta", "content": value}
+                    else:
+                        feedback_result = value
+        except LLMError as e:
+            # The interview carries on without feedback for this answer.
+            feedback_result = f"Feedback is unavailable for this answer: {e}"
         yield {"type": "feedback", "content": f"--- FEEDBACK ---\n{feedback_result}\n"}
 
+    def _queue_feedback(self, transcript_index):
+        """Queues an answer for batched grading and grades the queue once it reaches the batch size."""
+        self._feedback_queue.append(transcript_index)
+        when = "at the end of the interview" if self.feedback_mode == "exam" else "after a few more answers"
+        yield {
+            "type": "feedback_pending",
+            "transcript_index": transcript_index,
+            "content": f"--- FEEDBACK ---\n_Feedback on this answer will be given {when}._\n"
+        }
+        if self.feedback_mode == "batch" and len(self._feedback_queue) >= self.feedback_batch_size:
+            yield from self._flush_feedback_queue()
+
+    def _flush_feedback_queue(self):
+        """Grades every queued answer in one LLM call and yields a feedback event per answer."""
+        indices, self._feedback_queue = self._feedback_queue, []
+        if not indices:
+            return
+        feedback_by_index = self._evaluate_answers(indices)
+        for transcript_index in indices:
+            yield {
+                "type": "feedback",
+                "transcript_index": transcript_index,
+                "content": f"--- FEEDBACK ---\n{feedback_by_index[transcript_index]}\n"
+            }
+
+    def _evaluate_answers(self, indices):
+        """Runs the feedback crew once for several transcript entries and stores each result on its entry."""
+        answer_budget = task_budget("feedback") // len(indices)
+        answers = "\n".join(
+            f"Answer {number}:\n- Question: {self.transcript[i]['question']}\n- Answer: {fit_text(self.transcript[i]['answer'], answer_budget)}"
+            for number, i in enumerate(indices, start=1)
+        )
+        task = self._new_task(
+            description=(
+                "Evaluate each of the following interview answers independently.\n"
+                f"{answers}\n"
+                'Return ONLY a JSON list with one object per answer, in the same order, shaped like '
+                '{"answer": <answer number>, "feedback": "<constructive feedback>"}.'
+            ),
+            agent=self.feedback_analyst_agent,
+            expected_output=f"A JSON list of {len(indices)} objects with 'answer' and 'feedback' keys."
+        )
+        try:
+            batch_result = self._run_crew(self.feedback_crew, task, task_type="feedback")
+        except LLMError as e:
+            unavailable = f"Feedback is unavailable for this answer: {e}"
+            return {transcript_index: unavailable for transcript_index in indices}
+        feedback_by_number = self._parse_batch_feedback(batch_result)
+
+        feedback_by_index = {}
+        for number, transcript_index in enumerate(indices, start=1):
+            feedback = feedback_by_number.get(number)
+            if feedback is None:
+                # The model didn't return structured feedback for this answer, so show what it did say.
+                feedback = batch_result if not feedback_by_number else "No feedback was returned for this answer."
+            self.transcript[transcript_index]["feedback"] = feedback
+            self._log_checkpoint({"type": "feedback", "index": transcript_index, "feedback": feedback})
+            feedback_by_index[transcript_index] = feedback
+        return feedback_by_index
+
+    @staticmethod
+    def _parse_batch_feedback(batch_result):
+        """Extracts {answer_number: feedback} from the JSON list returned for a batch of answers."""
+        text = str(batch_result)
+        start, end = text.find("["), text.rfind("]")
+        if start == -1 or end <= start:
+            return {}
+        try:
+            items = json.loads(text[start:end + 1])
+        except ValueError:
+            return {}
+        feedback_by_number = {}
+        for position, item in enumerate(items, start=1):
+            if isinstance(item, dict) and item.get("feedback"):
+                try:
+                    number = int(item.get("answer", position))
+                except (TypeError, ValueError):
+                    number = position
+                feedback_by_number[number] = str(item["feedback"])
+        return feedback_by_number
+
+    def _submit_feedback(self, transcript_index):
+        """Queues feedback for a transcript entry on the worker pool, at most once per answer."""
+        with self._feedback_lock:
+            if transcript_index not in self._pending_feedback and "feedback" not in self.transcript[transcript_index]:
+                if self._feedback_pool is None:
+                    self._feedback_pool = ThreadPoolExecutor(max_workers=self.feedback_workers, thread_name_prefix="feedback")
+                # Each background evaluation gets its own crew and its own copy of the agent: crewai updates
+                # both while a task runs, so concurrent evaluations must not share them.
+                agent = self.feedback_analyst_agent.copy()
+                crew = self._new_crew(agent)
+                # Run in a copy of the caller's context so the evaluation's spans nest under the current turn.
+                context = contextvars.copy_context()
+                self._pending_feedback[transcript_index] = self._feedback_pool.submit(
+                    context.run, self._evaluate_answer, transcript_index, crew, agent=agent
+                )
+        return {
+            "type": "feedback_pending",
+            "transcript_index": transcript_index,
+            "content": "--- FEEDBACK ---\n_Feedback on this answer is being prepared..._\n"
+        }
+
+    def _feedback_event(self, transcript_index, future):
+        """Builds the feedback event for a finished background evaluation."""
+        try:
+            feedback_result = future.result()
+        except Exception as e:
+            print(f"An error occurred while generating feedback: {e}")
+            feedback_result = f"Could not generate feedback for this answer: {e}"
+        return {"type": "feedback", "transcript_index": transcript_index, "content": f"--- FEEDBACK ---\n{feedback_result}\n"}
+
+    def has_pending_feedback(self):
+        """Returns True while background feedback is still being generated."""
+        with self._feedback_lock:
+            return bool(self._pending_feedback)
+
+    def collect_feedback(self, wait=False):
+        """
+        Returns feedback events for background evaluations that have finished, in transcript order.
+        With `wait=True` it blocks until every queued evaluation is done.
+        """
+        with self._feedback_lock:
+            pending = sorted(self._pending_feedback.items())
+        events = []
+        for transcript_index, future in pending:
+            if not wait and not future.done():
+                continue
+            events.append(self._feedback_event(transcript_index, future))
+            with self._feedback_lock:
+                self._pending_feedback.pop(transcript_index, None)
+        return events
+
+    def close(self):
+        """Shuts down the background feedback pool, if one was started."""
+        if self._feedback_pool is not None:
+            self._feedback_pool.shutdown(wait=False, cancel_futures=True)
+            self._feedback_pool = None
+
+    def checkpoint_state(self):
+        """Returns the resumable interview state as a plain JSON-serialisable dict."""
+        return {
+            "session_id": self.session_id,
+            "config": self.config,
+            "feedback_mode": self.feedback_mode,
+            "feedback_batch_size": self.feedback_batch_size,
+            "questions": self.questions,
+            "current_question_index": self.current_question_index,
+            "current_interviewer_index": self.current_interviewer_index,
+            "transcript": self.transcript,
+            "tokens_used": self.budget.used,
+        }
+
+    @staticmethod
+    def _apply_checkpoint_event(state, event):
+        """Replays one logged checkpoint event onto a state dict."""
+        if event["type"] == "answer":
+            state["transcript"].append(event["entry"])
+            state["current_question_index"] = event["current_question_index"]
+            state["current_interviewer_index"] = event["current_interviewer_index"]
+            state["tokens_used"] = event.get("tokens_used", state.get("tokens_used", 0))
+        elif event["type"] == "feedback":
+            state["transcript"][event["index"]]["feedback"] = event["feedback"]
+
+    def _save_checkpoint(self):
+        """Writes a full snapshot of the interview state."""
+        if self.checkpoints is None:
+            return
+        try:
+            self.checkpoints.save(self.session_id, self.checkpoint_state())
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Could not save checkpoint: {e}")
+
+    def _log_checkpoint(self, event):
+        """Appends one event to the checkpoint log; much cheaper than a full snapshot."""
+        if self.checkpoints is None:
+            return
+        try:
+            self.checkpoints.append(self.session_id, event)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Could not update checkpoint: {e}")
+
+    def _discard_checkpoint(self):
+        if self.checkpoints is None:
+            return
+        try:
+            self.checkpoints.delete(self.session_id)
+        except OSError as e:
+            print(f"Could not remove checkpoint: {e}")
+
+    @classmethod
+    def resume(cls, session_id, **options):
+        """
+        Rebuilds a manager from its checkpoint, or returns None if there is none. The question that was
+        on screen is asked again, so call `ask_next_question()` without an answer to continue.
+        """
+        store = get_checkpoint_store()
+        state = store.load(session_id, cls._apply_checkpoint_event) if store is not None else None
+        if state is None:
+            return None
+        options.setdefault("feedback_mode", state["feedback_mode"])
+        options.setdefault("feedback_batch_size", state["feedback_batch_size"])
+        manager = cls(config=state["config"], session_id=session_id, **options)
+        manager.questions = state["questions"]
+        manager.current_question_index = state["current_question_index"]
+        manager.current_interviewer_index = state["current_interviewer_index"]
+        manager.transcript = state["transcript"]
+        manager.stats = TranscriptStats.from_transcript(manager.transcript)
+        manager.digest = TranscriptDigest.from_transcript(manager.transcript)
+        manager.budget.used = state.get("tokens_used", 0)
+
+        # Answers whose feedback was still pending when the checkpoint was taken are graded again.
+        ungraded = [i for i, entry in enumerate(manager.transcript) if "feedback" not in entry]
+        if manager.feedback_mode in ("batch", "exam"):
+            manager._feedback_queue = ungraded
+        elif manager.feedback_mode == "async":
+            for transcript_index in ungraded:
+                manager._submit_feedback(transcript_index)
+        return manager
+
     def _get_next_question(self):
         """Formats and returns the next question in the queue."""
         question = self.questions[self.current_question_index]
         self.current_question_index += 1
         interviewer = self.get_current_interviewer()
+        self.last_interviewer = interviewer
         self.next_interviewer()
         return {"type": "question", "content": f"{interviewer['name']} ({interviewer['role']}): {question}"}
 
+    @staticmethod
+    def _unavailable_on_error(stage, what):
+        """Wraps an analysis stage so an LLM failure produces a short notice instead of aborting the analysis."""
+        def run_stage(**kwargs):
+            try:
+                return stage(**kwargs)
+            except LLMError as e:
+                return f"The {what} is unavailable right now: {e}"
+        return run_stage
+
     def _finalize_interview(self):
-        """Runs all post-interview analysis and yields the final results."""
+        """
+        Runs all post-interview analysis and yields partial results as each stage completes.
+        The report and the learning path only depend on the summary and recommendations, so they run in parallel.
+        """
         self.interview_finished = True
+        # The analysis should see every answer's feedback, so wait for any still running in the background.
+        yield from self.collect_feedback(wait=True)
+        yield from self._flush_feedback_queue()
         yield {"type": "analysis_started", "content": "AI Interviewer: That was the last question. Thank you. Analyzing your performance..."}
-        
-        summary = self._run_performance_analysis()
-        recommendations = self._run_improvement_recommendations(summary)
-        report_result = self._generate_report(summary, recommendations)
-        learning_path = self._generate_learning_path(recommendations)
 
+        streams = self.stream_output
+        executor = StageExecutor(max_workers=2)
+        executor.add_stage("summary", self._unavailable_on_error(self._run_performance_analysis, "performance summary"), streams=streams)
+        executor.add_stage("recommendations", self._unavailable_on_error(self._run_improvement_recommendations, "list of recommendations"), depends_on=["summary"], streams=streams)
+        executor.add_stage("report", self._unavailable_on_error(self._generate_report, "report"), depends_on=["summary", "recommendations"])
+        executor.add_stage("learning_path", self._unavailable_on_error(self._generate_learning_path, "learning path"), depends_on=["recommendations"], streams=streams)
+
+        headings = {
+            "summary": "--- PERFORMANCE SUMMARY ---",
+            "recommendations": "--- RECOMMENDATIONS ---",
+            "learning_path": "--- LEARNING PATH ---",
+        }
+        for kind, stage_name, value in executor.stream():
+            if kind == "token":
+                yield {"type": f"{stage_name}_delta", "content": value}
+            elif stage_name in headings:
+                yield {"type": stage_name, "content": f"{headings[stage_name]}\n{value}\n"}
+
+        results = executor.results
+        self.stage_timings = executor.timings
+        report_result = str(results["report"])
         report_path = report_result.split("Report saved to:")[-1].strip() if "Report saved to:" in report_result else None
+        self._record_session(results, report_path)
+        self._discard_checkpoint()
 
         yield {
             "type": "final_results",
             "report_path": report_path,
-            "learning_path": learning_path,
-            "summary": summary
+            "learning_path": results["learning_path"],
+            "summary": results["summary"],
+            "metrics": self.stats.snapshot(),
+            "timings": self.stage_timings,
+            "token_usage": self.budget.snapshot()
         }
 
-    def _run_performance_analysis(self):
+    def _record_session(self, results, report_path):
+        """Appends the finished session to the session history store."""
+        if self.session_store is None:
+            return
+        metrics = self.stats.snapshot()
+        try:
+            self.session_store.add({
+                "session_id": self.session_id,
+                "user_id": self.config.get("user_id"),
+                "company": self.config.get("company_name"),
+                "role": self.config.get("job_role"),
+                "readiness_score": readiness_score(str(results["summary"]), metrics["filler_count"]),
+                "summary": str(results["summary"]),
+                "recommendations": str(results["recommendations"]),
+                "learning_path": str(results["learning_path"]),
+                "report_path": report_path,
+                "metrics": metrics,
+                "transcript": self.transcript,
+            })
+        except Exception as e:
+            print(f"Could not record the session: {e}")
+
+    def _run_performance_analysis(self, on_token=None):
         """Runs the performance analysis crew."""
         if not self.transcript: return "No transcript recorded."
-        task = Task(
-            description="Analyze the interview transcript and provide a holistic performance summary.",
-            agent=performance_analysis_agent,
+        task = self._new_task(
+            description="Analyze the interview transcript digest and provide a holistic performance summary.",
+            agent=self.performance_analysis_agent,
             expected_output="A comprehensive performance review.",
-            inputs={'transcript': self.transcript}
+            inputs={'transcript_digest': self.digest.render(task_budget("analysis")), 'metrics': self.stats.snapshot()}
         )
-        return self._run_crew(self.performance_crew, task)
+        return self._run_crew(self.performance_crew, task, task_type="analysis", on_token=on_token)
 
-    def _run_improvement_recommendations(self, summary: str):
+    def _run_improvement_recommendations(self, summary: str, on_token=None):
         """Runs the improvement recommendation crew."""
-        task = Task(
+        task = self._new_task(
             description="Generate personalized recommendations based on the performance summary.",
-            agent=improvement_recommender_agent,
+            agent=self.improvement_recommender_agent,
             expected_output="A list of actionable recommendations.",
             inputs={'performance_summary': summary}
         )
-        return self._run_crew(self.recommendation_crew, task)
+        return self._run_crew(self.recommendation_crew, task, task_type="analysis", on_token=on_token)
 
     def _generate_report(self, summary: str, recommendations: str):
         """Generates a detailed interview report."""
-        task = Task(
+        task = self._new_task(
             description="Generate a comprehensive report from the summary and recommendations.",
-            agent=reporting_agent,
+            agent=self.reporting_agent,
             expected_output="A confirmation message with the path to the saved report file.",
-            inputs={'performance_summary': summary, 'recommendations': recommendations, 'transcript': self.transcript}
+            inputs={'performance_summary': summary, 'recommendations': recommendations, 'transcript_digest': self.digest.render(task_budget("report")), 'metrics': self.stats.snapshot()}
         )
-        return self._run_crew(self.reporting_crew, task)
+        # The reporting agent queues the report file, so it always has to run. The session scope names the
+        # file and hands the full transcript to the report tool without putting it in the prompt.
+        with session_scope(self.session_id, transcript=self.transcript):
+            return self._run_crew(self.reporting_crew, task, task_type="report", use_cache=False)
 
-    def _generate_learning_path(self, recommendations: str):
+    def _generate_learning_path(self, recommendations: str, on_token=None):
         """Generates a learning path with resources."""
-        task = Task(
+        task = self._new_task(
             description="Generate a learning path based on the provided recommendations.",
-            agent=learning_path_agent,
+            agent=self.learning_path_agent,
             expected_output="A markdown-formatted learning path with relevant resources.",
             inputs={'recommendations': recommendations}
         )
-        return self._run_crew(self.learning_path_crew, task)
+        return self._run_crew(self.learning_path_crew, task, task_type="analysis", on_token=on_token)
+
+def prefetch_questions(config):
+    """Generates questions for a config without starting a simulation, so they can be adopted later."""
+    manager = SimulationManager(config=config, stream_output=False, record_session=False, checkpoint=False)
+    manager._generate_questions(mark_used=False)
+    return manager.questions
 
 if __name__ == '__main__':
     # This part is for testing purposes and won't be executed by the Streamlit app.
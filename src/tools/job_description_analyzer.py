@@ -1,6 +1,8 @@
 from crewai.tools import tool
+from src.utils.tracing import traced
 
 @tool
+@traced("tool.analyze_job_description")
 def analyze_job_description(job_description: str):
     """Analyze job description to extract key requirements, skills, and responsibilities"""
     lines = job_description.split('\n')
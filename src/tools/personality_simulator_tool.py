@@ -1,10 +1,12 @@
 from crewai.tools.base_tool import BaseTool
 import random
+from src.utils.tracing import traced
 
 class PersonalitySimulatorTool(BaseTool):
     name: str = "Interviewer Personality Simulator"
     description: str = "Simulates a personality for an interviewer based on their role."
 
+    @traced("tool.personality_simulator")
     def _run(self, interviewer_role: str) -> str:
         personalities = {
             "HR Manager": [
@@ -0,0 +1,37 @@
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+from typing import Type
+from src.utils.progress_rollups import get_progress_rollups
+from src.utils.tracing import traced
+
+class ProgressToolSchema(BaseModel):
+    """Input schema for ProgressTool."""
+    user_id: str = Field("anonymous", description="The user whose progress should be summarised.")
+
+class ProgressTool(BaseTool):
+    name: str = "Progress Tool"
+    description: str = "Summarises a user's progress across past interview sessions from precomputed rollups."
+    args_schema: Type[BaseModel] = ProgressToolSchema
+
+    @traced("tool.progress")
+    def _run(self, user_id: str = "anonymous") -> str:
+        """
+        Reports readiness score, filler-word and answer-length trends and the most common weak topics.
+        """
+        progress = get_progress_rollups().summary(user_id)
+        if not progress["sessions"]:
+            return f"No past sessions recorded for {user_id}."
+
+        report = f"Progress for {user_id} over {progress['sessions']} session(s):\n\n"
+        if progress["latest_score"] is not None:
+            report += f"- Readiness score went from {progress['first_score']:.0f} to {progress['latest_score']:.0f}"
+            report += f" (recent average {progress['rolling_score']:.0f}).\n"
+        if progress["filler_rate_change"] is not None:
+            direction = "down" if progress["filler_rate_change"] <= 0 else "up"
+            report += f"- Filler words per 100 words are {direction} by {abs(progress['filler_rate_change'])} compared to the first sessions.\n"
+        if progress["answer_length_change"] is not None:
+            report += f"- Average answer length changed by {progress['answer_length_change']:+} words.\n"
+        if progress["weak_topics"]:
+            topics = ", ".join(f"{t['topic']} ({t['weak_count']})" for t in progress["weak_topics"])
+            report += f"- Topics with the most weak answers: {topics}.\n"
+        return report
@@ -1,6 +1,8 @@
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from typing import Type
+from src.utils.text_metrics import analyze_text
+from src.utils.tracing import traced
 
 class ResourceFinderToolSchema(BaseModel):
     """Input schema for ResourceFinderTool."""
@@ -11,6 +13,7 @@ class ResourceFinderTool(BaseTool):
     description: str = "Finds relevant learning resources (articles, videos) based on improvement recommendations."
     args_schema: Type[BaseModel] = ResourceFinderToolSchema
 
+    @traced("tool.resource_finder")
     def _run(self, recommendations: str) -> str:
         """
         Finds learning resources based on the provided recommendations.
@@ -18,18 +21,19 @@ class ResourceFinderTool(BaseTool):
         (like Google Search, YouTube Search, etc.) to find actual resources.
         """
         learning_path = "### Personalized Learning Path\n\n"
+        metrics = analyze_text(recommendations)
 
-        if "STAR method" in recommendations:
+        if metrics.mentions("star method"):
             learning_path += "**Topic: Mastering the STAR Method**\n"
             learning_path += "- **Article:** [How to Use the STAR Interview Response Technique](https://www.thebalancecareers.com/what-is-the-star-interview-response-technique-2061629)\n"
             learning_path += "- **Video:** [The STAR Method by CareerVidz](https://www.youtube.com/watch?v=g_a0d9K9g6k)\n\n"
 
-        if "concise" in recommendations.lower() or "direct" in recommendations.lower():
+        if metrics.mentions("concise", "direct"):
             learning_path += "**Topic: Improving Conciseness**\n"
             learning_path += "- **Article:** [How to Be More Concise in Your Professional Communication](https://hbr.org/2018/07/how-to-be-more-concise)\n"
             learning_path += "- **Video:** [Think Fast, Talk Smart: Communication Techniques](https://www.youtube.com/watch?v=HAnw168huqA)\n\n"
 
-        if "filler words" in recommendations.lower():
+        if metrics.mentions("filler words"):
             learning_path += "**Topic: Eliminating Filler Words**\n"
             learning_path += "- **Article:** [7 Ways to Stop Using Filler Words Like 'Um' and 'Ah'](https://www.inc.com/carmine-gallo/7-ways-to-stop-using-filler-words-like-um-and-ah.html)\n"
             learning_path += "- **Video:** [How to Stop Saying 'Um' and 'Ah' When You Speak](https://www.youtube.com/watch?v=Fw7_p2rV3j8)\n\n"
@@ -1,6 +1,8 @@
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from typing import Type
+from src.utils.text_metrics import analyze_text, EXPERIENCE_KEYWORDS
+from src.utils.tracing import traced
 
 class ResponseEvaluatorToolSchema(BaseModel):
     """Input schema for ResponseEvaluatorTool."""
@@ -12,6 +14,7 @@ class ResponseEvaluatorTool(BaseTool):
     description: str = "Evaluates a user's answer to an interview question and provides feedback."
     args_schema: Type[BaseModel] = ResponseEvaluatorToolSchema
 
+    @traced("tool.response_evaluator")
     def _run(self, question: str, answer: str) -> str:
         """
         Evaluates the user's response to a given interview question.
@@ -20,12 +23,13 @@ class ResponseEvaluatorTool(BaseTool):
         clarity, relevance, and completeness.
         """
         # Placeholder logic for evaluation
+        metrics = analyze_text(answer)
         feedback = f"Feedback for your answer to '{question}':\n"
-        if len(answer.split()) < 20:
+        if metrics.word_count < 20:
             feedback += "- Your answer is a bit short. Consider elaborating further.\n"
-        if "um" in answer.lower() or "uh" in answer.lower():
+        if metrics.filler_count:
             feedback += "- You used filler words like 'um' or 'uh'. Try to speak more confidently.\n"
-        if not any(keyword in answer.lower() for keyword in ["experience", "project", "skill", "team"]):
+        if not metrics.mentions(*EXPERIENCE_KEYWORDS):
              feedback += "- Consider linking your answer back to your specific experiences, projects, or skills.\n"
 
         if feedback == f"Feedback for your answer to '{question}':\n":
@@ -1,8 +1,9 @@
-import os
-from datetime import datetime
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from typing import Type
+from src.utils.report_writer import current_session_id
+from src.utils.session_store import get_session_store
+from src.utils.tracing import traced
 
 class SessionSaverToolSchema(BaseModel):
     """Input schema for SessionSaverTool."""
@@ -11,29 +12,23 @@ class SessionSaverToolSchema(BaseModel):
 
 class SessionSaverTool(BaseTool):
     name: str = "Session Saver Tool"
-    description: str = "Saves the interview performance summary and recommendations to a file."
+    description: str = "Saves the interview performance summary and recommendations to the session history."
     args_schema: Type[BaseModel] = SessionSaverToolSchema
+    has_side_effects: bool = True
 
+    @traced("tool.session_saver")
     def _run(self, performance_summary: str, recommendations: str) -> str:
         """
-        Saves the session summary and recommendations to a timestamped markdown file.
+        Records the session summary and recommendations in the session store.
+        A markdown copy can be exported from the store on demand.
         """
-        sessions_dir = "data/sessions"
-        os.makedirs(sessions_dir, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = os.path.join(sessions_dir, f"interview_session_{timestamp}.md")
-
+        store = get_session_store()
+        if store is None:
+            return "Session history is disabled; nothing was saved."
+        session_id = current_session_id()
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write("# Interview Session Summary\n\n")
-                f.write(f"**Session Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write("## Overall Performance Analysis\n")
-                f.write(performance_summary)
-                f.write("\n\n")
-                f.write("## Personalized Recommendations\n")
-                f.write(recommendations)
-
-            return f"Session successfully saved to {filename}"
+            if store.add({"session_id": session_id, "summary": performance_summary, "recommendations": recommendations}):
+                return f"Session successfully saved with ID {session_id}"
+            return f"Session {session_id} was already saved"
         except Exception as e:
             return f"Error saving session: {e}"
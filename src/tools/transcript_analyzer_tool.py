@@ -1,17 +1,21 @@
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-from typing import Type, List, Dict
+from typing import Type, List, Dict, Any, Optional
+from src.utils.text_metrics import analyze_transcript
+from src.utils.tracing import traced
 
 class TranscriptAnalyzerToolSchema(BaseModel):
     """Input schema for TranscriptAnalyzerTool."""
-    transcript: List[Dict[str, str]] = Field(..., description="The full transcript of the interview, with each entry being a dictionary containing a 'question' and 'answer'.")
+    transcript: Optional[List[Dict[str, str]]] = Field(None, description="The full transcript of the interview, with each entry being a dictionary containing a 'question' and 'answer'. Not needed when metrics are provided.")
+    metrics: Optional[Dict[str, Any]] = Field(None, description="Running metrics already computed for the transcript (answer_count, avg_answer_length, filler_count). When provided, the transcript is not re-scanned.")
 
 class TranscriptAnalyzerTool(BaseTool):
     name: str = "Transcript Analyzer Tool"
     description: str = "Analyzes a full interview transcript and provides a summary of performance."
     args_schema: Type[BaseModel] = TranscriptAnalyzerToolSchema
 
-    def _run(self, transcript: List[Dict[str, str]]) -> str:
+    @traced("tool.transcript_analyzer")
+    def _run(self, transcript: Optional[List[Dict[str, str]]] = None, metrics: Optional[Dict[str, Any]] = None) -> str:
         """
         Analyzes the interview transcript to provide a holistic performance summary.
         This is a placeholder. A real implementation would use an LLM to analyze
@@ -19,20 +23,20 @@ class TranscriptAnalyzerTool(BaseTool):
         """
         summary = "Overall Interview Performance Summary:\n\n"
         
-        num_questions = len(transcript)
+        if metrics is None:
+            transcript_metrics = analyze_transcript(transcript or [])
+            metrics = {
+                "answer_count": transcript_metrics.answer_count,
+                "avg_answer_length": transcript_metrics.avg_answer_length,
+                "filler_count": transcript_metrics.filler_count,
+            }
+
+        num_questions = metrics["answer_count"]
         if num_questions == 0:
             return "The transcript is empty. No analysis can be provided."
 
-        total_answer_length = 0
-        filler_words_count = 0
-        
-        for entry in transcript:
-            answer = entry.get("answer", "")
-            total_answer_length += len(answer.split())
-            filler_words_count += answer.lower().count("um")
-            filler_words_count += answer.lower().count("uh")
-
-        avg_answer_length = total_answer_length / num_questions if num_questions > 0 else 0
+        avg_answer_length = metrics["avg_answer_length"]
+        filler_words_count = metrics["filler_count"]
 
         summary += f"- You answered {num_questions} questions.\n"
         summary += f"- Average answer length was approximately {int(avg_answer_length)} words.\n"
@@ -1,20 +1,31 @@
+import os
+from urllib.parse import quote_plus
 from crewai.tools import tool
-import requests
 from bs4 import BeautifulSoup
+from ..utils.http_fetch import get_fetcher
+from ..utils.tracing import traced
+
+SEARCH_URL = os.getenv("COMPANY_SEARCH_URL", "https://www.google.com/search?q={query}")
+SEARCH_TOPICS = ["company information", "company culture and values", "company recent news"]
+
+def extract_snippets(html, limit=3):
+    """Pulls the result snippets out of a search results page."""
+    soup = BeautifulSoup(html, 'html.parser')
+    snippets = soup.find_all('span', class_='aCOpRe')
+    if not snippets: snippets = soup.find_all('div', class_='VwiC3b')
+    return [snippet.get_text() for snippet in snippets[:limit]]
 
 @tool
+@traced("tool.search_company_info")
 def search_company_info(company_name: str):
     """Search for basic information about a company"""
-    search_query = f"{company_name} company information"
-    search_url = f"https://www.google.com/search?q={search_query}"
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+    urls = [SEARCH_URL.format(query=quote_plus(f"{company_name} {topic}")) for topic in SEARCH_TOPICS]
+    pages = get_fetcher().fetch_many(urls)
 
-    try:
-        response = requests.get(search_url, headers=headers)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        snippets = soup.find_all('span', class_='aCOpRe')
-        if not snippets: snippets = soup.find_all('div', class_='VwiC3b')
-        info = ' '.join([snippet.get_text() for snippet in snippets[:3]])
-        return f"Company: {company_name}. Information found: {info}"
-    except:
-        return f"Could not fetch Information for {company_name}. Please Check mannually." 
+    info = []
+    for url in urls:
+        if pages[url]:
+            info.extend(extract_snippets(pages[url]))
+    if not info and not any(pages.values()):
+        return f"Could not fetch Information for {company_name}. Please Check mannually."
+    return f"Company: {company_name}. Information found: {' '.join(info)}"
@@ -0,0 +1,105 @@
+import json
+import os
+import re
+import threading
+from .report_writer import atomic_write
+
+CHECKPOINT_VERSION = 1
+DEFAULT_CHECKPOINT_DIR = os.path.join("data", "checkpoints")
+
+# Once the event log has this many lines, loading folds it into a new base snapshot.
+COMPACT_AFTER = 50
+
+
+class CheckpointVersionError(ValueError):
+    """Raised when a checkpoint was written by an incompatible version."""
+
+
+class CheckpointStore:
+    """
+    Saves interview state as plain JSON: a base snapshot per session plus an append-only JSONL log of
+    the events since, so checkpointing an answer only appends one line. Loading replays the log onto
+    the snapshot; any process that can read the directory can resume the session.
+    """
+    def __init__(self, directory=DEFAULT_CHECKPOINT_DIR, compact_after=COMPACT_AFTER):
+        self.directory = directory
+        self.compact_after = compact_after
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, session_id):
+        if not re.fullmatch(r"[A-Za-z0-9_-]+", session_id or ""):
+            raise ValueError(f"Invalid session id {session_id!r}.")
+        base = os.path.join(self.directory, session_id)
+        return base + ".json", base + ".jsonl"
+
+    def save(self, session_id, state):
+        """Writes a full snapshot of `state` and starts a new, empty event log."""
+        snapshot_path, log_path = self._paths(session_id)
+        content = json.dumps({"version": CHECKPOINT_VERSION, "state": state}, separators=(",", ":"))
+        with self._lock:
+            atomic_write(snapshot_path, content)
+            if os.path.exists(log_path):
+                os.remove(log_path)
+
+    def append(self, session_id, event):
+        """Appends one event (a JSON-serialisable dict with a "type") to the session's log."""
+        _, log_path = self._paths(session_id)
+        line = json.dumps(event, separators=(",", ":")) + "\n"
+        with self._lock:
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+
+    def load(self, session_id, apply_event):
+        """
+        Returns the session's state with every logged event replayed through `apply_event(state, event)`,
+        or None if there is no checkpoint. Lines torn by a crash mid-write are skipped.
+        """
+        snapshot_path, log_path = self._paths(session_id)
+        with self._lock:
+            if not os.path.exists(snapshot_path):
+                return None
+            with open(snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            lines = []
+            if os.path.exists(log_path):
+                with open(log_path, encoding="utf-8") as f:
+                    lines = f.readlines()
+        if snapshot.get("version") != CHECKPOINT_VERSION:
+            raise CheckpointVersionError(f"Checkpoint version {snapshot.get('version')} is not supported.")
+
+        state = snapshot["state"]
+        for line in lines:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            apply_event(state, event)
+        if len(lines) >= self.compact_after:
+            self.save(session_id, state)
+        return state
+
+    def delete(self, session_id):
+        """Removes a session's checkpoint, e.g. once the interview is finished."""
+        with self._lock:
+            for path in self._paths(session_id):
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+_shared_store = None
+_shared_store_lock = threading.Lock()
+
+def get_checkpoint_store():
+    """
+    Returns the process-wide checkpoint store, or None when it is disabled with CHECKPOINTS_DISABLED=1.
+    The location can be changed with CHECKPOINT_DIR; share it between workers to resume anywhere.
+    """
+    global _shared_store
+    if os.getenv("CHECKPOINTS_DISABLED") == "1":
+        return None
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = CheckpointStore(os.getenv("CHECKPOINT_DIR", DEFAULT_CHECKPOINT_DIR))
+        return _shared_store
@@ -0,0 +1,199 @@
+import os
+import re
+import threading
+from collections import OrderedDict, deque
+from .question_bank import classify_question
+from .resilience import LLMError
+from .text_metrics import analyze_text, estimate_tokens
+
+# How many estimated tokens of context each kind of task may receive. Override with CONTEXT_BUDGET_<TASK_TYPE>.
+DEFAULT_TASK_BUDGETS = {
+    "questions": 1200,
+    "feedback": 1000,
+    "analysis": 2500,
+    "report": 1500,
+    "default": 2000,
+}
+
+DIGEST_LINES = 12
+RECENT_EXCERPTS = 2
+FLAGGED_EXCERPTS = 3
+
+# An answer this short, or with filler words, is quoted verbatim in the digest.
+WEAK_ANSWER_WORDS = 20
+
+TRUNCATION_MARK = " [...]"
+SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+class BudgetExceededError(LLMError):
+    """Raised instead of calling the model once a session has used up its token limit."""
+
+
+def task_budget(task_type):
+    """The context budget, in estimated tokens, for a task type."""
+    override = os.getenv(f"CONTEXT_BUDGET_{task_type.upper()}")
+    if override:
+        return int(override)
+    return DEFAULT_TASK_BUDGETS.get(task_type, DEFAULT_TASK_BUDGETS["default"])
+
+def fit_text(text, budget):
+    """Cuts `text` to at most `budget` estimated tokens, at a sentence or word boundary, and marks the cut."""
+    text = str(text or "")
+    if estimate_tokens(text) <= budget:
+        return text
+    limit = max(0, budget * 4 - len(TRUNCATION_MARK))
+    cut = text[:limit]
+    boundary = max(cut.rfind(". "), cut.rfind("\n"))
+    if boundary < limit // 2:
+        boundary = cut.rfind(" ")
+    if boundary > 0:
+        cut = cut[:boundary + 1]
+    return cut.rstrip() + TRUNCATION_MARK
+
+def first_sentence(text, budget=40):
+    """The first sentence of `text`, cut to `budget` tokens."""
+    text = " ".join(str(text or "").split())
+    return fit_text(SENTENCE_END.split(text, 1)[0], budget)
+
+def compact_interviewers(interviewers):
+    """Names and roles only; the full interviewer dicts carry nothing the question prompt needs."""
+    return "; ".join(f"{i.get('name', 'Interviewer')} ({i.get('role', 'unknown role')})" for i in interviewers or [])
+
+
+class TranscriptDigest:
+    """
+    A rolling summary of the answers so far, updated once per answer. The latest `max_lines` answers
+    keep a one-line gist each and older ones are folded into per-topic totals, so the digest stays the
+    same size however long the interview runs. The most recent and the weakest answers are also kept
+    for verbatim excerpts, which `render()` fits into whatever budget remains.
+    """
+    def __init__(self, max_lines=DIGEST_LINES, recent=RECENT_EXCERPTS, flagged=FLAGGED_EXCERPTS):
+        self.max_lines = max_lines
+        self.answer_count = 0
+        self._gists = OrderedDict()
+        self._folded = {}
+        self._recent = deque(maxlen=recent)
+        self._flagged = deque(maxlen=flagged)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_transcript(cls, transcript, **options):
+        """Builds the digest for an existing transcript, e.g. after resuming a session."""
+        digest = cls(**options)
+        for entry in transcript:
+            digest.add(entry)
+        return digest
+
+    def add(self, entry):
+        """
+        Folds one transcript entry into the digest. The entry is kept by reference, so feedback
+        stored on it later still shows up.
+        """
+        metrics = analyze_text(entry.get("answer", ""))
+        gist = {
+            "number": self.answer_count + 1,
+            "topic": classify_question(entry.get("question", "")),
+            "words": metrics.word_count,
+            "fillers": metrics.filler_count,
+            "weak": metrics.word_count < WEAK_ANSWER_WORDS or metrics.filler_count > 0,
+            "entry": entry,
+        }
+        with self._lock:
+            self.answer_count += 1
+            self._gists[gist["number"]] = gist
+            while len(self._gists) > self.max_lines:
+                _, oldest = self._gists.popitem(last=False)
+                totals = self._folded.setdefault(oldest["topic"], {"answers": 0, "words": 0, "weak": 0})
+                totals["answers"] += 1
+                totals["words"] += oldest["words"]
+                totals["weak"] += oldest["weak"]
+            self._recent.append(gist)
+            if gist["weak"]:
+                self._flagged.append(gist)
+
+    @staticmethod
+    def _gist_line(gist):
+        entry = gist["entry"]
+        line = (
+            f"Q{gist['number']} [{gist['topic']}] {first_sentence(entry.get('question'), 30)} "
+            f"- {gist['words']} words, {gist['fillers']} filler words{', weak' if gist['weak'] else ''}"
+        )
+        if entry.get("feedback"):
+            line += f". Feedback: {first_sentence(entry['feedback'])}"
+        return line
+
+    @staticmethod
+    def _excerpt(gist, budget):
+        entry = gist["entry"]
+        return fit_text(f"Q{gist['number']}: {entry.get('question', '')}\nAnswer: {entry.get('answer', '')}", budget)
+
+    def render(self, budget):
+        """
+        Returns the digest as text of at most about `budget` estimated tokens: the folded totals and
+        per-answer gists first, then verbatim excerpts of weak and recent answers while room remains.
+        """
+        with self._lock:
+            folded = {topic: dict(totals) for topic, totals in self._folded.items()}
+            gists = list(self._gists.values())
+            flagged = list(self._flagged)
+            flagged_numbers = {gist["number"] for gist in flagged}
+            excerpts = flagged + [gist for gist in reversed(self._recent) if gist["number"] not in flagged_numbers]
+            answer_count = self.answer_count
+
+        lines = [f"{answer_count} answers given."]
+        for topic, totals in sorted(folded.items()):
+            lines.append(
+                f"Earlier {topic} answers: {totals['answers']}, averaging {totals['words'] // totals['answers']} words, "
+                f"{totals['weak']} weak."
+            )
+        lines.extend(self._gist_line(gist) for gist in gists)
+        summary = fit_text("\n".join(lines), budget)
+
+        parts = [summary]
+        remaining = budget - estimate_tokens(summary)
+        if excerpts and remaining > 20:
+            parts.append("Verbatim excerpts:")
+            remaining -= 5
+            for gist in excerpts:
+                if remaining <= 20:
+                    break
+                excerpt = self._excerpt(gist, remaining)
+                parts.append(excerpt)
+                remaining -= estimate_tokens(excerpt) + 1
+        return "\n".join(parts)
+
+
+class SessionBudget:
+    """
+    Counts the estimated tokens a session has sent to and received from the model, and enforces an
+    optional hard limit: once a call would go over it, `check()` raises BudgetExceededError.
+    """
+    def __init__(self, limit=None, used=0):
+        self.limit = limit
+        self.used = used
+        self._lock = threading.Lock()
+
+    def check(self, prompt_tokens):
+        with self._lock:
+            if self.limit is not None and self.used + prompt_tokens > self.limit:
+                raise BudgetExceededError(
+                    f"This session has used {self.used} of its {self.limit} token budget; "
+                    f"a further ~{prompt_tokens} token prompt was not sent."
+                )
+
+    def charge(self, tokens):
+        with self._lock:
+            self.used += tokens
+
+    @property
+    def remaining(self):
+        return None if self.limit is None else max(0, self.limit - self.used)
+
+    def snapshot(self):
+        return {"used_tokens": self.used, "limit": self.limit}
+
+def session_token_limit():
+    """The per-session token limit from SESSION_TOKEN_LIMIT, or None (no limit) when unset or 0."""
+    limit = int(os.getenv("SESSION_TOKEN_LIMIT", "0") or 0)
+    return limit or None
@@ -0,0 +1,161 @@
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_CACHE_PATH = os.path.join("data", "cache", "http_cache.sqlite3")
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# A cached response is served as-is for `ttl` seconds, then served stale for up to
+# `stale_ttl` more seconds while a background refresh fetches a new copy.
+DEFAULT_TTL = 24 * 3600
+DEFAULT_STALE_TTL = 7 * 24 * 3600
+
+class FetchError(Exception):
+    """Raised when a URL cannot be fetched and no usable cached copy exists."""
+
+
+class ResponseCache:
+    """A persistent cache of response bodies keyed by URL, backed by SQLite."""
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, body TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, url):
+        """Returns (body, age_in_seconds) for `url`, or None if it was never cached."""
+        with self._lock:
+            row = self._conn.execute("SELECT body, fetched_at FROM responses WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        return row[0], time.time() - row[1]
+
+    def set(self, url, body):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, fetched_at) VALUES (?, ?, ?)",
+                (url, body, time.time()),
+            )
+            self._conn.commit()
+
+    def purge(self, max_age):
+        """Deletes responses older than `max_age` seconds."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE fetched_at < ?", (time.time() - max_age,))
+            self._conn.commit()
+
+
+class HTTPFetcher:
+    """
+    Fetches pages over a pooled keep-alive session with connect/read timeouts,
+    caching bodies on disk and refreshing stale entries in the background.
+    """
+    def __init__(self, cache=None, ttl=DEFAULT_TTL, stale_ttl=DEFAULT_STALE_TTL,
+                 connect_timeout=3.05, read_timeout=10, max_workers=4, headers=None):
+        self.cache = cache
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": DEFAULT_USER_AGENT, **(headers or {})})
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="http-fetch")
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+
+    def _download(self, url):
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise FetchError(f"Failed to fetch {url}: {e}") from e
+        body = response.text
+        if self.cache is not None:
+            self.cache.set(url, body)
+        return body
+
+    def _refresh(self, url):
+        try:
+            self._download(url)
+        except FetchError as e:
+            print(f"Background refresh failed: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(url)
+
+    def _schedule_refresh(self, url):
+        with self._refresh_lock:
+            if url in self._refreshing:
+                return None
+            self._refreshing.add(url)
+        return self._executor.submit(self._refresh, url)
+
+    def fetch(self, url):
+        """
+        Returns the body of `url`. Fresh cached copies are returned directly; stale ones are
+        returned immediately while a refresh runs in the background. Raises FetchError on failure.
+        """
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached is not None:
+            body, age = cached
+            if age < self.ttl:
+                return body
+            if age < self.ttl + self.stale_ttl:
+                self._schedule_refresh(url)
+                return body
+        try:
+            return self._download(url)
+        except FetchError:
+            # An expired copy is still better than nothing when the site is unreachable.
+            if cached is not None:
+                return cached[0]
+            raise
+
+    def fetch_many(self, urls):
+        """Fetches several URLs concurrently. Returns {url: body}, with None for failed URLs."""
+        def fetch_or_none(url):
+            try:
+                return self.fetch(url)
+            except FetchError as e:
+                print(e)
+                return None
+        return dict(zip(urls, self._executor.map(fetch_or_none, urls)))
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+
+_shared_fetcher = None
+_shared_fetcher_lock = threading.Lock()
+
+def get_fetcher():
+    """
+    Returns the process-wide HTTP fetcher. The response cache can be disabled with
+    HTTP_CACHE_DISABLED=1 or moved with HTTP_CACHE_PATH; HTTP_CONNECT_TIMEOUT and
+    HTTP_READ_TIMEOUT bound each request in seconds.
+    """
+    global _shared_fetcher
+    with _shared_fetcher_lock:
+        if _shared_fetcher is None:
+            cache = None
+            if os.getenv("HTTP_CACHE_DISABLED") != "1":
+                cache = ResponseCache(os.getenv("HTTP_CACHE_PATH", DEFAULT_CACHE_PATH))
+            _shared_fetcher = HTTPFetcher(
+                cache=cache,
+                connect_timeout=float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05")),
+                read_timeout=float(os.getenv("HTTP_READ_TIMEOUT", "10")),
+            )
+        return _shared_fetcher
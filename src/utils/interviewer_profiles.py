@@ -0,0 +1,62 @@
+import contextvars
+import hashlib
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+PROFILE_TASK_TYPE = "interviewer_profile"
+DEFAULT_MAX_WORKERS = 3
+
+def normalize_linkedin_url(url):
+    """
+    Reduces a profile URL to a canonical form so the same person always maps to the same key,
+    e.g. "https://uk.linkedin.com/in/Alice/?trk=x" -> "linkedin.com/in/alice".
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+    host = parts.netloc.lower().split(":")[0]
+    if host == "linkedin.com" or host.endswith(".linkedin.com"):
+        host = "linkedin.com"
+    path = re.sub(r"/+", "/", parts.path).rstrip("/").lower()
+    return host + path
+
+def profile_cache_key(interviewer, company_name=""):
+    """
+    Cache key for an interviewer's profile: their normalised LinkedIn URL plus role. Without a URL
+    the name and company are used instead, which is less reliable but still avoids repeat work.
+    """
+    role = " ".join((interviewer.get("role") or "").lower().split())
+    identity = normalize_linkedin_url(interviewer.get("linkedin"))
+    if not identity:
+        identity = " ".join(f"{interviewer.get('name', '')} {company_name}".lower().split())
+    return hashlib.sha256(f"{PROFILE_TASK_TYPE}|{identity}|{role}".encode("utf-8")).hexdigest()
+
+def profile_interviewers(interviewers, profile_fn, company_name="", cache=None, max_workers=None):
+    """
+    Profiles each interviewer with `profile_fn(interviewer)` in parallel, at most `max_workers` at a time,
+    reusing cached profiles. Returns the profiles in the same order as `interviewers`.
+    """
+    if max_workers is None:
+        max_workers = int(os.getenv("INTERVIEWER_PROFILE_WORKERS", DEFAULT_MAX_WORKERS))
+    keys = [profile_cache_key(interviewer, company_name) for interviewer in interviewers]
+    profiles = [cache.get(key) if cache is not None else None for key in keys]
+
+    def build(index):
+        profile = profile_fn(interviewers[index])
+        if cache is not None and profile:
+            cache.set(keys[index], profile, task_type=PROFILE_TASK_TYPE)
+        return profile
+
+    missing = [i for i, profile in enumerate(profiles) if profile is None]
+    if missing:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as pool:
+            # Each profile runs in a copy of the caller's context so its tracing spans nest under the caller.
+            futures = [pool.submit(contextvars.copy_context().run, build, index) for index in missing]
+            for index, future in zip(missing, futures):
+                profiles[index] = future.result()
+    return profiles
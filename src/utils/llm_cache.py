@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = os.path.join("data", "cache", "llm_cache.sqlite3")
+DEFAULT_MAX_ENTRIES = 2000
+
+# Time-to-live in seconds for each kind of task. Anything not listed uses "default".
+DEFAULT_TTLS = {
+    "questions": 7 * 24 * 3600,
+    "feedback": 30 * 24 * 3600,
+    "analysis": 24 * 3600,
+    "interviewer_profile": 30 * 24 * 3600,
+    "default": 24 * 3600,
+}
+
+def make_cache_key(agent_role, model, description, expected_output, inputs=None):
+    """Builds a stable content hash for an LLM call from everything that influences its output."""
+    payload = json.dumps(
+        {
+            "agent_role": agent_role,
+            "model": model,
+            "description": description,
+            "expected_output": expected_output,
+            "inputs": inputs,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    A persistent, size-bounded LRU cache of LLM results backed by SQLite.
+    Entries expire according to a per-task-type TTL.
+    """
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES, ttls=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, task_type TEXT NOT NULL, "
+            "created_at REAL NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)")
+        self._conn.commit()
+
+    def get(self, key):
+        """Returns the cached value for `key`, or None if it is missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or row[1] <= now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key, value, task_type="default"):
+        """Stores a value and evicts the least recently used entries beyond `max_entries`."""
+        now = time.time()
+        ttl = self.ttls.get(task_type, self.ttls["default"])
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, task_type, created_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value, task_type, now, now + ttl, now),
+            )
+            overflow = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,),
+                )
+            self._conn.commit()
+
+    def clear(self):
+        """Removes every entry and resets the hit/miss counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Returns hit/miss counters and the current number of entries."""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": size,
+        }
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+def get_llm_cache():
+    """
+    Returns the process-wide LLM cache, or None when caching is disabled with LLM_CACHE_DISABLED=1.
+    The location can be changed with LLM_CACHE_PATH.
+    """
+    global _shared_cache
+    if os.getenv("LLM_CACHE_DISABLED") == "1":
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMCache(os.getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH))
+        return _shared_cache
@@ -0,0 +1,122 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dotenv import load_dotenv
+from src.utils.token_stream import token_router
+from src.utils.resilience import AdaptiveLimiter, CircuitBreaker, LLMGuard, TokenBucket, is_retryable
+
+DEFAULT_MODEL = "gemini-pro"
+DEFAULT_MAX_INFLIGHT = 4
+
+_clients = {}
+_limiters = {}
+_guards = {}
+_global_limit = None
+_lock = threading.Lock()
+_env_loaded = False
+
+def load_env():
+    """
+    Loads the .env file once per process. Entry points (the app, worker processes, the benchmark) call
+    this before reading any setting, so every module sees the values from .env.
+    """
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+def model_for(agent=None):
+    """
+    Resolves the model name for an agent.
+    `<AGENT>_MODEL` (e.g. FEEDBACK_ANALYST_MODEL) wins over GEMINI_MODEL, which wins over the default.
+    """
+    load_env()
+    if agent:
+        agent_model = os.getenv(f"{agent.upper()}_MODEL")
+        if agent_model:
+            return agent_model
+    return os.getenv("GEMINI_MODEL", DEFAULT_MODEL)
+
+def get_llm(model=None, agent=None):
+    """
+    Returns the shared chat client for a model, building it on first use.
+    Every agent that uses the same model shares one client and its underlying HTTP transport.
+    Clients stream their output; tokens are forwarded to any `capture_tokens` block active in the calling context.
+    """
+    model = model or model_for(agent)
+    with _lock:
+        if model not in _clients:
+            from langchain_google_genai import ChatGoogleGenerativeAI
+            _clients[model] = ChatGoogleGenerativeAI(
+                model=model,
+                google_api_key=os.getenv("GOOGLE_API_KEY"),
+                streaming=True,
+                callbacks=[token_router()]
+            )
+        return _clients[model]
+
+def max_inflight(model):
+    """Returns the cap on concurrent requests for a model (LLM_MAX_INFLIGHT, overridable per model)."""
+    load_env()
+    per_model = os.getenv(f"LLM_MAX_INFLIGHT_{model.upper().replace('-', '_').replace('.', '_')}")
+    return int(per_model or os.getenv("LLM_MAX_INFLIGHT", DEFAULT_MAX_INFLIGHT))
+
+def set_global_limit(semaphore):
+    """
+    Installs a semaphore that every LLM call must also hold, e.g. a multiprocessing semaphore
+    shared by all simulation worker processes to cap concurrent calls across the whole server.
+    """
+    global _global_limit
+    _global_limit = semaphore
+
+def _limiter(model):
+    """Returns the adaptive concurrency limiter for a model, capped at `max_inflight(model)`."""
+    with _lock:
+        if model not in _limiters:
+            _limiters[model] = AdaptiveLimiter(max_inflight(model), target_latency=float(os.getenv("LLM_TARGET_LATENCY", "30")))
+        return _limiters[model]
+
+@contextmanager
+def llm_slot(model=None):
+    """
+    Holds one of the in-flight request slots for a model (and the global slot, if set) while the block runs.
+    The number of slots adapts to observed latency and overload errors, up to `max_inflight(model)`.
+    """
+    limiter = _limiter(model or model_for())
+    limiter.acquire()
+    start = time.perf_counter()
+    ok, overloaded = False, False
+    try:
+        if _global_limit is None:
+            yield
+        else:
+            with _global_limit:
+                yield
+        ok = True
+    except Exception as e:
+        overloaded = is_retryable(e)
+        raise
+    finally:
+        limiter.release(time.perf_counter() - start, ok, overloaded)
+
+def get_guard(model=None):
+    """
+    Returns the shared rate limiter, retry policy and circuit breaker for a model.
+    The token bucket is sized by LLM_REQUESTS_PER_MINUTE and LLM_BURST.
+    """
+    load_env()
+    model = model or model_for()
+    with _lock:
+        if model not in _guards:
+            requests_per_minute = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "60"))
+            _guards[model] = LLMGuard(
+                bucket=TokenBucket(requests_per_minute / 60, int(os.getenv("LLM_BURST", "10"))),
+                breaker=CircuitBreaker(
+                    failure_threshold=int(os.getenv("LLM_BREAKER_THRESHOLD", "5")),
+                    reset_timeout=float(os.getenv("LLM_BREAKER_RESET", "30"))
+                ),
+                slot=lambda: llm_slot(model),
+                max_attempts=int(os.getenv("LLM_MAX_ATTEMPTS", "4"))
+            )
+        return _guards[model]
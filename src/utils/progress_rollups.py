@@ -0,0 +1,209 @@
+import glob
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+import pandas as pd
+from .question_bank import classify_question
+from .report_writer import atomic_write
+from .text_metrics import analyze_text
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_ROLLUP_DIR = os.path.join("data", "progress")
+DEFAULT_WINDOW = 3
+
+# How many of a user's first and latest sessions the aggregates keep for trend summaries.
+SUMMARY_ROWS = 10
+
+# An answer this short, or with filler words, counts against its question's topic.
+WEAK_ANSWER_WORDS = 20
+
+SESSION_COLUMNS = [
+    "session_id", "created_at", "company", "role", "readiness_score", "readiness_rolling",
+    "filler_rate", "avg_answer_length", "answer_count",
+]
+TOPIC_COLUMNS = ["topic", "weak_count", "last_seen"]
+FLOAT_COLUMNS = ("readiness_score", "readiness_rolling", "filler_rate", "avg_answer_length", "answer_count")
+
+def weak_topics(transcript):
+    """Returns the topic of every answer that was too short or used filler words."""
+    topics = []
+    for entry in transcript or []:
+        metrics = analyze_text(entry.get("answer", ""))
+        if metrics.word_count < WEAK_ANSWER_WORDS or metrics.filler_count:
+            topics.append(classify_question(entry.get("question", "")))
+    return topics
+
+@contextmanager
+def _file_lock(path):
+    """Holds an exclusive lock on `path` across processes, e.g. the simulation worker processes."""
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _empty_state():
+    return {"sessions": 0, "recent_scores": [], "earliest": [], "latest": [], "topics": {}}
+
+
+class ProgressRollups:
+    """
+    Per-user progress trends. Each saved session is written once as its own small parquet part file,
+    and a per-user JSON file keeps running aggregates: the latest scores for the rolling average, the
+    first and latest sessions for trends, and weak-topic counts. A save therefore costs the same however
+    long the user's history is, and summaries only read the aggregates. Updates take a file lock, so
+    several processes can share the directory.
+    """
+    def __init__(self, directory=DEFAULT_ROLLUP_DIR, window=DEFAULT_WINDOW):
+        self.directory = directory
+        self.window = window
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _user_dir(self, user_id):
+        safe = re.sub(r"[^A-Za-z0-9_-]+", "_", user_id)[:40]
+        digest = hashlib.sha1(user_id.encode("utf-8")).hexdigest()[:8]
+        return os.path.join(self.directory, f"{safe}_{digest}")
+
+    def _part_path(self, user_id, session_id):
+        digest = hashlib.sha1(session_id.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._user_dir(user_id), "sessions", f"{digest}.parquet")
+
+    def _read_state(self, user_id):
+        path = os.path.join(self._user_dir(user_id), "state.json")
+        if not os.path.exists(path):
+            return _empty_state()
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_part(frame, path):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".parquet.tmp")
+        os.close(fd)
+        try:
+            frame.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def sessions(self, user_id):
+        """One row per session for `user_id`, oldest first. Reads every part file, so use it for exports."""
+        parts = glob.glob(os.path.join(self._user_dir(user_id), "sessions", "*.parquet"))
+        if not parts:
+            return pd.DataFrame(columns=SESSION_COLUMNS)
+        sessions = pd.concat([pd.read_parquet(part) for part in parts], ignore_index=True)
+        return sessions.sort_values(["created_at", "session_id"], ignore_index=True)[SESSION_COLUMNS]
+
+    def topics(self, user_id):
+        """Weak-topic counts for `user_id`, most frequent first."""
+        rows = [
+            {"topic": topic, "weak_count": counts["weak_count"], "last_seen": pd.Timestamp(counts["last_seen"], unit="s")}
+            for topic, counts in self._read_state(user_id)["topics"].items()
+        ]
+        topics = pd.DataFrame(rows, columns=TOPIC_COLUMNS)
+        return topics.sort_values(["weak_count", "topic"], ascending=[False, True], ignore_index=True)
+
+    def update(self, record):
+        """Folds one saved session record (as stored by SessionStore) into its user's rollups."""
+        user_id = record.get("user_id") or "anonymous"
+        metrics = record.get("metrics") or {}
+        created_at = float(record.get("created_at") or pd.Timestamp.now().timestamp())
+        part_path = self._part_path(user_id, record["session_id"])
+        os.makedirs(os.path.dirname(part_path), exist_ok=True)
+
+        with self._lock, _file_lock(os.path.join(self._user_dir(user_id), ".lock")):
+            if os.path.exists(part_path):
+                return False
+            state = self._read_state(user_id)
+            score = record.get("readiness_score")
+            recent = state["recent_scores"][-(self.window - 1):] if self.window > 1 else []
+            if score is not None:
+                recent.append(score)
+            row = {
+                "session_id": record["session_id"],
+                "created_at": created_at,
+                "company": record.get("company") or "",
+                "role": record.get("role") or "",
+                "readiness_score": score,
+                "readiness_rolling": sum(recent) / len(recent) if recent else None,
+                "filler_rate": metrics.get("filler_rate"),
+                "avg_answer_length": metrics.get("avg_answer_length"),
+                "answer_count": metrics.get("answer_count"),
+            }
+            frame = pd.DataFrame([row], columns=SESSION_COLUMNS).astype({column: "float64" for column in FLOAT_COLUMNS})
+            frame["created_at"] = pd.to_datetime(frame["created_at"], unit="s")
+            self._write_part(frame, part_path)
+
+            state["sessions"] += 1
+            state["recent_scores"] = recent
+            if len(state["earliest"]) < SUMMARY_ROWS:
+                state["earliest"].append(row)
+            state["latest"] = (state["latest"] + [row])[-SUMMARY_ROWS:]
+            for topic in weak_topics(record.get("transcript")):
+                counts = state["topics"].setdefault(topic, {"weak_count": 0, "last_seen": created_at})
+                counts["weak_count"] += 1
+                counts["last_seen"] = max(counts["last_seen"], created_at)
+            atomic_write(os.path.join(self._user_dir(user_id), "state.json"), json.dumps(state))
+        return True
+
+    def summary(self, user_id, recent=DEFAULT_WINDOW):
+        """A compact progress summary: first vs. latest scores and the most common weak topics."""
+        state = self._read_state(user_id)
+        if not state["sessions"]:
+            return {"user_id": user_id, "sessions": 0}
+        if recent <= SUMMARY_ROWS:
+            earliest = pd.DataFrame(state["earliest"], columns=SESSION_COLUMNS).head(recent)
+            latest = pd.DataFrame(state["latest"], columns=SESSION_COLUMNS).tail(recent)
+            history = pd.DataFrame(state["earliest"] + state["latest"], columns=SESSION_COLUMNS)
+        else:
+            history = self.sessions(user_id)
+            earliest, latest = history.head(recent), history.tail(recent)
+        scores = history.astype({"readiness_score": "float64"})["readiness_score"].dropna()
+        rolling = pd.DataFrame(state["latest"], columns=SESSION_COLUMNS)["readiness_rolling"].dropna()
+        return {
+            "user_id": user_id,
+            "sessions": state["sessions"],
+            "first_score": float(scores.iloc[0]) if not scores.empty else None,
+            "latest_score": float(scores.iloc[-1]) if not scores.empty else None,
+            "rolling_score": float(rolling.iloc[-1]) if not rolling.empty else None,
+            "filler_rate_change": _mean_change(earliest["filler_rate"], latest["filler_rate"]),
+            "answer_length_change": _mean_change(earliest["avg_answer_length"], latest["avg_answer_length"]),
+            "weak_topics": self.topics(user_id).head(3)[["topic", "weak_count"]].to_dict("records"),
+        }
+
+def _mean_change(before, after):
+    before, after = before.dropna().astype("float64"), after.dropna().astype("float64")
+    if before.empty or after.empty:
+        return None
+    return round(float(after.mean() - before.mean()), 2)
+
+
+_shared_rollups = None
+_shared_rollups_lock = threading.Lock()
+
+def get_progress_rollups():
+    """Returns the process-wide progress rollups. The location can be changed with PROGRESS_ROLLUP_DIR."""
+    global _shared_rollups
+    with _shared_rollups_lock:
+        if _shared_rollups is None:
+            _shared_rollups = ProgressRollups(os.getenv("PROGRESS_ROLLUP_DIR", DEFAULT_ROLLUP_DIR))
+        return _shared_rollups
@@ -0,0 +1,215 @@
+import hashlib
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+DEFAULT_BANK_PATH = os.path.join("data", "question_bank.sqlite3")
+
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being but by can could do does for from has have
+having he her his how i if in into is it its it's me more most my no not of on or our out over own she should
+so some such than that the their them then there these they this those through to too under up very was we
+were what when where which while who whom why will with would you your you'll we're able ability across
+candidate closely ideal including must opportunities opportunity responsible role strong work working years
+""".split())
+
+BEHAVIORAL_MARKERS = ("tell me about a time", "describe a time", "describe a situation", "give an example", "give me an example")
+SITUATIONAL_MARKERS = ("what would you do", "how would you", "imagine", "suppose", "if you were")
+
+def normalize_text(text):
+    """Lowercases text and collapses whitespace and punctuation, for matching and de-duplication."""
+    return " ".join(re.findall(r"[a-z0-9+#]+", (text or "").lower()))
+
+def extract_skills(job_description, limit=8):
+    """Returns the most frequent meaningful terms in a job description, as a rough list of skills."""
+    words = [w for w in normalize_text(job_description).split() if len(w) > 2 and w not in STOPWORDS]
+    return [word for word, _ in Counter(words).most_common(limit)]
+
+def classify_question(question):
+    """Tags a question as behavioral, situational or technical from its wording."""
+    text = normalize_text(question)
+    if any(marker in text for marker in BEHAVIORAL_MARKERS):
+        return "behavioral"
+    if any(marker in text for marker in SITUATIONAL_MARKERS):
+        return "situational"
+    return "technical"
+
+
+def _text_hash(question):
+    return hashlib.sha256(normalize_text(question).encode("utf-8")).hexdigest()
+
+
+class LeastUsedFreshnessPolicy:
+    """
+    Prefers questions that have been served the fewest times, and skips questions the same user was
+    served within `cooldown_seconds`. A non-zero `fresh_ratio` asks for that share of new questions
+    to be generated in the background after each start, so the bank keeps growing.
+    """
+    def __init__(self, cooldown_seconds=24 * 3600, fresh_ratio=0.0, max_uses=None):
+        self.cooldown_seconds = cooldown_seconds
+        self.fresh_ratio = fresh_ratio
+        self.max_uses = max_uses
+
+    def fresh_count(self, limit):
+        """How many new questions to add to the bank for a session of `limit` questions."""
+        return int(limit * self.fresh_ratio)
+
+    def choose(self, candidates, limit, now=None):
+        """
+        Picks up to `limit` of the candidate rows: dicts with use_count, counted across all users, and
+        last_used, the last time this user was served the question (None if never).
+        """
+        now = now or time.time()
+        eligible = [
+            c for c in candidates
+            if (c["last_used"] is None or now - c["last_used"] >= self.cooldown_seconds)
+            and (self.max_uses is None or c["use_count"] < self.max_uses)
+        ]
+        random.shuffle(eligible)
+        eligible.sort(key=lambda c: (c["use_count"], c["last_used"] or 0))
+        return eligible[:limit]
+
+
+class QuestionBank:
+    """
+    A local, indexed store of generated interview questions tagged with company, role, skills and type.
+    Question text and skills are searchable through an SQLite FTS5 index.
+    """
+    def __init__(self, path=DEFAULT_BANK_PATH, freshness_policy=None):
+        self.path = path
+        self.freshness_policy = freshness_policy or LeastUsedFreshnessPolicy()
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS questions (
+                id INTEGER PRIMARY KEY,
+                text TEXT NOT NULL,
+                text_hash TEXT NOT NULL UNIQUE,
+                company TEXT NOT NULL,
+                role TEXT NOT NULL,
+                skills TEXT NOT NULL,
+                question_type TEXT NOT NULL,
+                use_count INTEGER NOT NULL DEFAULT 0,
+                last_used REAL,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_questions_company_role ON questions (company, role);
+            CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5(
+                text, skills, content='questions', content_rowid='id'
+            );
+            CREATE TRIGGER IF NOT EXISTS questions_after_insert AFTER INSERT ON questions BEGIN
+                INSERT INTO questions_fts (rowid, text, skills) VALUES (new.id, new.text, new.skills);
+            END;
+            CREATE TABLE IF NOT EXISTS question_uses (
+                user_id TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (user_id, text_hash)
+            );
+        """)
+        self._conn.commit()
+
+    def add_questions(self, questions, company, role, skills=()):
+        """Stores new questions, skipping duplicates. Returns the number actually added."""
+        now = time.time()
+        skills_text = " ".join(skills)
+        added = 0
+        with self._lock:
+            for question in questions:
+                question = question.strip()
+                if not question:
+                    continue
+                text_hash = _text_hash(question)
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO questions (text, text_hash, company, role, skills, question_type, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (question, text_hash, normalize_text(company), normalize_text(role), skills_text, classify_question(question), now),
+                )
+                added += cursor.rowcount
+            self._conn.commit()
+        return added
+
+    def _candidates(self, company, role, skills, user_id=None):
+        """
+        Questions for this company and role, plus questions for the same role that match the skills.
+        Each row's last_used is when `user_id` was last served it; without a user no cooldown applies.
+        """
+        rows = self._conn.execute(
+            "SELECT * FROM questions WHERE company = ? AND role = ?",
+            (normalize_text(company), normalize_text(role)),
+        ).fetchall()
+        terms = [term for term in (normalize_text(skill) for skill in skills) if term]
+        if terms:
+            match = " OR ".join(f'"{term}"' for term in terms)
+            rows += self._conn.execute(
+                "SELECT q.* FROM questions_fts JOIN questions q ON q.id = questions_fts.rowid "
+                "WHERE questions_fts MATCH ? AND q.role = ? AND q.company != ? ORDER BY bm25(questions_fts) LIMIT 50",
+                (match, normalize_text(role), normalize_text(company)),
+            ).fetchall()
+        seen = {}
+        if user_id is not None:
+            seen = dict(self._conn.execute(
+                "SELECT text_hash, last_used FROM question_uses WHERE user_id = ?", (user_id,)
+            ).fetchall())
+        return [dict(row, last_used=seen.get(row["text_hash"])) for row in rows]
+
+    def select(self, company, role, skills=(), limit=10, user_id=None):
+        """
+        Returns up to `limit` stored questions for the company and role, chosen by the freshness policy.
+        Questions `user_id` was served recently are left out.
+        """
+        with self._lock:
+            candidates = self._candidates(company, role, skills, user_id)
+        return [row["text"] for row in self.freshness_policy.choose(candidates, limit)]
+
+    def mark_used(self, questions, user_id=None):
+        """Increments use counts for questions that were served in a session, and records them for `user_id`."""
+        now = time.time()
+        hashes = [_text_hash(q) for q in questions]
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE questions SET use_count = use_count + 1, last_used = ? WHERE text_hash = ?",
+                [(now, text_hash) for text_hash in hashes],
+            )
+            if user_id is not None:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO question_uses (user_id, text_hash, last_used) VALUES (?, ?, ?)",
+                    [(user_id, text_hash, now) for text_hash in hashes],
+                )
+            self._conn.commit()
+
+    def count(self, company=None, role=None):
+        """Returns how many questions are stored, optionally for one company and role."""
+        with self._lock:
+            if company is None:
+                return self._conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM questions WHERE company = ? AND role = ?",
+                (normalize_text(company), normalize_text(role)),
+            ).fetchone()[0]
+
+
+_shared_bank = None
+_shared_bank_lock = threading.Lock()
+
+def get_question_bank():
+    """
+    Returns the process-wide question bank, or None when it is disabled with QUESTION_BANK_DISABLED=1.
+    The location can be changed with QUESTION_BANK_PATH, and QUESTION_BANK_FRESH_RATIO sets the share
+    of new questions generated in the background after each start (0 by default).
+    """
+    global _shared_bank
+    if os.getenv("QUESTION_BANK_DISABLED") == "1":
+        return None
+    with _shared_bank_lock:
+        if _shared_bank is None:
+            policy = LeastUsedFreshnessPolicy(fresh_ratio=float(os.getenv("QUESTION_BANK_FRESH_RATIO", "0") or 0))
+            _shared_bank = QuestionBank(os.getenv("QUESTION_BANK_PATH", DEFAULT_BANK_PATH), freshness_policy=policy)
+        return _shared_bank
@@ -0,0 +1,158 @@
+import contextvars
+import html
+import os
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from string import Template
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
+DEFAULT_FORMATS = ("md",)
+
+_session_id = contextvars.ContextVar("report_session_id", default=None)
+_session_transcript = contextvars.ContextVar("report_session_transcript", default=None)
+
+def new_session_id():
+    """Returns a unique, URL- and filename-safe session identifier."""
+    return uuid.uuid4().hex
+
+@contextmanager
+def session_scope(session_id, transcript=None):
+    """
+    Tags every report queued inside the block with `session_id`. A `transcript` given here is what
+    report tools write out when they are not passed one explicitly.
+    """
+    token = _session_id.set(session_id)
+    transcript_token = _session_transcript.set(transcript)
+    try:
+        yield session_id
+    finally:
+        _session_transcript.reset(transcript_token)
+        _session_id.reset(token)
+
+def current_session_id():
+    """The session ID set by `session_scope`, or a fresh one when called outside a session."""
+    return _session_id.get() or new_session_id()
+
+def current_transcript():
+    """The transcript set by `session_scope`, or None."""
+    return _session_transcript.get()
+
+@lru_cache(maxsize=None)
+def load_template(name, fmt):
+    """Reads and compiles a template from src/templates once per process."""
+    with open(os.path.join(TEMPLATE_DIR, f"{name}.{fmt}"), encoding="utf-8") as f:
+        return Template(f.read())
+
+def render(name, fmt, context, entries=None):
+    """
+    Renders template `name` in format `fmt`. Values are HTML-escaped for HTML output. `entries` are
+    rendered with the matching "<name>_entry" template and substituted as $transcript.
+    """
+    escape = html.escape if fmt == "html" else str
+    values = {key: escape(str(value)) for key, value in context.items()}
+    if entries is not None:
+        entry_template = load_template(f"{name}_entry", fmt)
+        values["transcript"] = "".join(
+            entry_template.substitute({key: escape(str(value)) for key, value in entry.items()})
+            for entry in entries
+        )
+    return load_template(name, fmt).substitute(values)
+
+def atomic_write(path, content):
+    """Writes `content` to `path` in one buffered write via a temp file and rename, so readers never see a partial file."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=os.path.splitext(path)[1])
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ReportQueue:
+    """
+    Renders and writes report files on a background thread. `submit` decides the output paths up front
+    and returns them immediately, so callers don't wait for the files to be written.
+    """
+    def __init__(self, max_workers=1):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report-writer")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, name, directory, prefix, context, entries=None, formats=None, session_id=None):
+        """Queues a report and returns {format: path}. Files are named `<prefix>_<timestamp>_<session_id>.<format>`."""
+        formats = tuple(formats or DEFAULT_FORMATS)
+        session_id = session_id or current_session_id()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        paths = {fmt: os.path.join(directory, f"{prefix}_{timestamp}_{session_id}.{fmt}") for fmt in formats}
+        context = dict(context, session_id=session_id)
+
+        def write():
+            for fmt, path in paths.items():
+                atomic_write(path, render(name, fmt, context, entries))
+            return paths
+
+        key = paths[formats[0]]
+        with self._lock:
+            future = self._executor.submit(write)
+            self._jobs[key] = future
+        future.add_done_callback(lambda done: self._on_done(key, done))
+        return paths
+
+    def _on_done(self, key, future):
+        """Forgets successful jobs; failed ones are kept so `wait` can report them."""
+        error = future.exception()
+        if error is not None:
+            print(f"Failed to write report {key}: {error}")
+            return
+        with self._lock:
+            self._jobs.pop(key, None)
+
+    def wait(self, timeout=None):
+        """Blocks until every queued report has been written. Returns the paths that failed."""
+        with self._lock:
+            jobs = list(self._jobs.items())
+        failed = []
+        for path, future in jobs:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                failed.append(path)
+        with self._lock:
+            for path, future in jobs:
+                if future.done():
+                    self._jobs.pop(path, None)
+        return failed
+
+    def pending(self):
+        """Number of reports that are queued or being written."""
+        with self._lock:
+            return sum(1 for future in self._jobs.values() if not future.done())
+
+
+def report_formats():
+    """Output formats from REPORT_FORMATS (comma-separated, e.g. "md,html"), defaulting to markdown."""
+    formats = [fmt.strip() for fmt in os.getenv("REPORT_FORMATS", "").split(",") if fmt.strip()]
+    return tuple(formats) or DEFAULT_FORMATS
+
+_shared_queue = None
+_shared_queue_lock = threading.Lock()
+
+def get_report_queue():
+    """Returns the process-wide report queue."""
+    global _shared_queue
+    with _shared_queue_lock:
+        if _shared_queue is None:
+            _shared_queue = ReportQueue()
+        return _shared_queue
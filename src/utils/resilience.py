@@ -0,0 +1,205 @@
+import random
+import threading
+import time
+
+RETRYABLE_MARKERS = (
+    "429", "503", "quota", "rate limit", "ratelimit", "resource exhausted", "resourceexhausted",
+    "too many requests", "toomanyrequests", "unavailable", "deadline exceeded", "timeout", "timed out",
+    "connection", "temporarily",
+)
+
+
+class LLMError(RuntimeError):
+    """Base class for LLM calls that could not be completed."""
+
+
+class RateLimitedError(LLMError):
+    """Raised when no request budget became available in time."""
+
+
+class CircuitOpenError(LLMError):
+    """Raised without calling the model while the circuit breaker is open after repeated failures."""
+
+
+class LLMCallError(LLMError):
+    """Raised when a call failed and was not retried, or every retry failed."""
+
+
+def is_retryable(error):
+    """
+    Returns True for quota, rate-limit, timeout, connection and availability errors. These are worth
+    retrying, and they are the only errors that count against the circuit breaker.
+    """
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in RETRYABLE_MARKERS)
+
+def backoff_delay(attempt, base=1.0, cap=30.0):
+    """Exponential backoff with full jitter: a random delay up to base * 2^attempt, capped."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average, with bursts of up to `capacity`."""
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """Takes a token if one is available. Returns the seconds to wait otherwise (0.0 on success)."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self, timeout=None):
+        """Blocks until a token is available. Returns False if that would take longer than `timeout`."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire()
+            if wait == 0.0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class AdaptiveLimiter:
+    """
+    A concurrency limit that adjusts itself (additive increase, multiplicative decrease):
+    it grows slowly while calls succeed quickly and halves on overload errors or slow calls.
+    """
+    def __init__(self, max_limit, min_limit=1, target_latency=30.0):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.target_latency = target_latency
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= max(self.min_limit, int(self.limit)):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency, ok=True, overloaded=False):
+        """Frees a slot and adapts the limit to how the call went."""
+        with self._condition:
+            self.in_flight -= 1
+            if overloaded or latency > self.target_latency:
+                self.limit = max(self.min_limit, self.limit / 2)
+            elif ok:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for `reset_timeout` seconds.
+    After that a single trial call is let through; its outcome closes or re-opens the circuit.
+    """
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.reset_timeout else "open"
+
+    def check(self):
+        """Raises CircuitOpenError unless a call may go ahead."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return
+            if state == "half-open" and not self._trial_running:
+                self._trial_running = True
+                return
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            raise CircuitOpenError(f"The language model is unavailable after repeated errors. Try again in {retry_in:.0f}s.")
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def release_trial(self):
+        """Ends a half-open trial whose outcome says nothing about the model's health, e.g. a parsing error."""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class LLMGuard:
+    """
+    Wraps LLM calls for one model with a token bucket, retries with exponential backoff and jitter,
+    and a circuit breaker. `slot` is a context-manager factory that bounds concurrency around each attempt.
+    Only transport, rate-limit and timeout errors are retried or count against the breaker; any other
+    error (a parsing or tool failure, an LLMError raised inside the call) fails the call alone.
+    """
+    def __init__(self, bucket, breaker, slot=None, max_attempts=4, backoff_base=1.0, backoff_cap=30.0, max_wait=60.0):
+        self.bucket = bucket
+        self.breaker = breaker
+        self.slot = slot
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_wait = max_wait
+
+    def call(self, func, retryable=True):
+        """
+        Runs `func()` under the guard and returns its result, or raises an LLMError subclass.
+        Pass `retryable=False` when `func` has side effects that must not be repeated.
+        """
+        max_attempts = self.max_attempts if retryable else 1
+        for attempt in range(max_attempts):
+            self.breaker.check()
+            settled = False
+            try:
+                if not self.bucket.acquire(timeout=self.max_wait):
+                    raise RateLimitedError("The request budget for the language model is exhausted. Please try again shortly.")
+                try:
+                    if self.slot is None:
+                        result = func()
+                    else:
+                        with self.slot():
+                            result = func()
+                except LLMError:
+                    raise
+                except Exception as e:
+                    if not is_retryable(e):
+                        raise LLMCallError(f"{type(e).__name__}: {e}") from e
+                    self.breaker.record_failure()
+                    settled = True
+                    if attempt < max_attempts - 1:
+                        time.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_cap))
+                        continue
+                    raise LLMCallError(f"{type(e).__name__}: {e}") from e
+                self.breaker.record_success()
+                settled = True
+                return result
+            finally:
+                # Any other exit (no request budget, a non-transport error, an interrupt) must not leave
+                # a half-open trial marked as running, or the breaker would reject every later call.
+                if not settled:
+                    self.breaker.release_trial()
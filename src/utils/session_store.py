@@ -0,0 +1,185 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from .report_writer import atomic_write, render
+
+DEFAULT_STORE_PATH = os.path.join("data", "sessions.sqlite3")
+DEFAULT_PAGE_SIZE = 20
+
+# Columns stored as JSON text.
+JSON_FIELDS = ("metrics", "transcript")
+FIELDS = (
+    "session_id", "user_id", "company", "role", "created_at", "readiness_score",
+    "summary", "recommendations", "learning_path", "report_path",
+) + JSON_FIELDS
+
+
+class SessionStore:
+    """
+    An append-only history of finished interview sessions backed by SQLite, indexed by user,
+    company, role and date. Records are never rewritten; markdown is exported on demand.
+    """
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._listeners = []
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL UNIQUE,
+                user_id TEXT NOT NULL,
+                company TEXT NOT NULL,
+                role TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                readiness_score INTEGER,
+                summary TEXT,
+                recommendations TEXT,
+                learning_path TEXT,
+                report_path TEXT,
+                metrics TEXT,
+                transcript TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_sessions_user ON sessions (user_id, created_at);
+            CREATE INDEX IF NOT EXISTS idx_sessions_company ON sessions (company, created_at);
+            CREATE INDEX IF NOT EXISTS idx_sessions_role ON sessions (role, created_at);
+            CREATE INDEX IF NOT EXISTS idx_sessions_created ON sessions (created_at);
+            """
+        )
+        self._conn.commit()
+
+    def add_listener(self, callback):
+        """Registers `callback(record)` to be called after each new record is saved."""
+        self._listeners.append(callback)
+
+    def add(self, record):
+        """
+        Appends a session record (a dict keyed by FIELDS). Returns False if a record with the same
+        session_id already exists, in which case the stored one is kept unchanged.
+        """
+        record = {field: record.get(field) for field in FIELDS}
+        record["user_id"] = record["user_id"] or "anonymous"
+        record["company"] = record["company"] or ""
+        record["role"] = record["role"] or ""
+        record["created_at"] = record["created_at"] or time.time()
+        values = dict(record)
+        for field in JSON_FIELDS:
+            values[field] = json.dumps(values[field]) if values[field] is not None else None
+        placeholders = ", ".join("?" for _ in FIELDS)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"INSERT OR IGNORE INTO sessions ({', '.join(FIELDS)}) VALUES ({placeholders})",
+                [values[field] for field in FIELDS],
+            )
+            self._conn.commit()
+        if cursor.rowcount != 1:
+            return False
+        for callback in self._listeners:
+            try:
+                callback(record)
+            except Exception as e:
+                print(f"Session listener failed: {e}")
+        return True
+
+    @staticmethod
+    def _to_record(row):
+        record = dict(row)
+        record.pop("id", None)
+        for field in JSON_FIELDS:
+            if field in record and record[field] is not None:
+                record[field] = json.loads(record[field])
+        return record
+
+    def get(self, session_id):
+        """Returns the full record for `session_id`, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        return self._to_record(row) if row is not None else None
+
+    def query(self, user_id=None, company=None, role=None, since=None, until=None,
+              page=1, page_size=DEFAULT_PAGE_SIZE, include_transcript=False):
+        """
+        Returns one page of matching sessions, newest first, as
+        {"items": [...], "total": n, "page": page, "page_size": page_size}.
+        Transcripts are left out unless `include_transcript` is set, to keep listings light.
+        """
+        clauses, params = [], []
+        for column, value in (("user_id", user_id), ("company", company), ("role", role)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        columns = [field for field in FIELDS if include_transcript or field != "transcript"]
+        page = max(1, page)
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM sessions {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT {', '.join(columns)} FROM sessions {where} ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+                params + [page_size, (page - 1) * page_size],
+            ).fetchall()
+        return {"items": [self._to_record(row) for row in rows], "total": total, "page": page, "page_size": page_size}
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def export_markdown(self, session_id, directory=os.path.join("data", "reports")):
+        """Renders a stored session as a markdown report and returns its path."""
+        record = self.get(session_id)
+        if record is None:
+            raise KeyError(f"Unknown session {session_id}.")
+        created = datetime.fromtimestamp(record["created_at"])
+        content = render(
+            "report",
+            "md",
+            {
+                "date": created.strftime("%Y-%m-%d %H:%M:%S"),
+                "session_id": session_id,
+                "readiness_score": record["readiness_score"] if record["readiness_score"] is not None else "N/A",
+                "performance_summary": record["summary"] or "",
+                "recommendations": record["recommendations"] or "",
+            },
+            entries=[
+                {"number": i + 1, "question": entry.get("question", "N/A"), "answer": entry.get("answer", "N/A")}
+                for i, entry in enumerate(record["transcript"] or [])
+            ],
+        )
+        path = os.path.join(directory, f"interview_report_{created.strftime('%Y%m%d_%H%M%S')}_{session_id}.md")
+        atomic_write(path, content)
+        return path
+
+
+_shared_store = None
+_shared_store_lock = threading.Lock()
+
+def get_session_store():
+    """
+    Returns the process-wide session store, or None when it is disabled with SESSION_STORE_DISABLED=1.
+    The location can be changed with SESSION_STORE_PATH. Progress rollups are updated on every save
+    unless PROGRESS_ROLLUPS_DISABLED=1.
+    """
+    global _shared_store
+    if os.getenv("SESSION_STORE_DISABLED") == "1":
+        return None
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = SessionStore(os.getenv("SESSION_STORE_PATH", DEFAULT_STORE_PATH))
+            if os.getenv("PROGRESS_ROLLUPS_DISABLED") != "1":
+                # pandas is slow to import, so the rollups are only loaded once a store is needed.
+                from .progress_rollups import get_progress_rollups
+                _shared_store.add_listener(get_progress_rollups().update)
+        return _shared_store
@@ -0,0 +1,102 @@
+import hashlib
+import json
+import threading
+
+def config_fingerprint(config):
+    """Hashes the parts of an interview config that influence question generation."""
+    relevant = {
+        "company_name": config.get("company_name"),
+        "job_role": config.get("job_role"),
+        "job_description": config.get("job_description"),
+        "interviewers": [(i.get("name"), i.get("role")) for i in config.get("interviewers", [])],
+    }
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class _Job:
+    """One speculative generation for a specific config."""
+    def __init__(self, fingerprint, config):
+        self.fingerprint = fingerprint
+        self.config = config
+        self.started = False
+        self.done = threading.Event()
+        self.result = None
+        self.timer = None
+
+
+class SpeculativeQuestionJob:
+    """
+    Generates questions in the background for the configuration the user is still editing.
+
+    Each `update()` with a changed config restarts a debounce timer; generation only starts once the
+    inputs have been stable for `debounce_seconds`. A newer config cancels the older job. A job that is
+    already talking to the LLM cannot be interrupted, so its result is simply discarded.
+    """
+    def __init__(self, generate, debounce_seconds=1.5):
+        self.generate = generate
+        self.debounce_seconds = debounce_seconds
+        self._lock = threading.Lock()
+        self._job = None
+
+    def update(self, config):
+        """Schedules generation for `config` unless a job for the same inputs already exists."""
+        fingerprint = config_fingerprint(config)
+        with self._lock:
+            if self._job is not None and self._job.fingerprint == fingerprint:
+                return
+            self._cancel_locked()
+            job = _Job(fingerprint, dict(config))
+            job.timer = threading.Timer(self.debounce_seconds, self._start, args=(job,))
+            job.timer.daemon = True
+            self._job = job
+            job.timer.start()
+
+    def _start(self, job):
+        """Runs a job once, unless it has been superseded in the meantime."""
+        with self._lock:
+            if job.started or job is not self._job:
+                return
+            job.started = True
+        try:
+            questions = self.generate(job.config)
+        except Exception as e:
+            print(f"Speculative question generation failed: {e}")
+            questions = None
+        job.result = list(questions) if questions else None
+        job.done.set()
+
+    def _cancel_locked(self):
+        """Cancels the current job. Must be called with the lock held."""
+        if self._job is not None:
+            self._job.timer.cancel()
+            self._job.done.set()
+            self._job = None
+
+    def cancel(self):
+        """Cancels the current job, discarding its result."""
+        with self._lock:
+            self._cancel_locked()
+
+    def result_for(self, config, timeout=None):
+        """
+        Returns pre-generated questions if they were made for `config`, or None if nothing usable is
+        available. A matching job that is already generating is waited for, since starting again would
+        repeat the same LLM calls; its calls are bounded by the model's guard, and `timeout` optionally
+        caps the wait. A job still waiting out its debounce delay is cancelled instead, so the caller can
+        generate the questions itself straight away.
+        """
+        fingerprint = config_fingerprint(config)
+        with self._lock:
+            job = self._job
+            if job is None or job.fingerprint != fingerprint:
+                return None
+            if not job.started:
+                self._cancel_locked()
+                return None
+        if not job.done.wait(timeout):
+            with self._lock:
+                if job is self._job:
+                    self._cancel_locked()
+            return None
+        with self._lock:
+            return list(job.result) if job is self._job and job.result else None
@@ -0,0 +1,95 @@
+import contextvars
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from .tracing import span
+
+
+class Stage:
+    """A named unit of work and the names of the stages it depends on."""
+    def __init__(self, name, func, depends_on=(), streams=False):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.streams = streams
+
+
+class StageExecutor:
+    """
+    Runs a small DAG of stages, starting each one as soon as its dependencies have finished.
+    Independent stages run in parallel on a thread pool and results are yielded as they complete.
+    """
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.stages = {}
+        self.results = {}
+        self.timings = {}
+
+    def add_stage(self, name, func, depends_on=(), streams=False):
+        """
+        Registers a stage. `func` is called with the results of its dependencies as keyword arguments.
+        Streaming stages also receive an `on_token` callback whose tokens are yielded by `stream()`.
+        """
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' is already registered.")
+        for dependency in depends_on:
+            if dependency not in self.stages:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dependency}'.")
+        self.stages[name] = Stage(name, func, depends_on, streams)
+        return self
+
+    def _timed_call(self, stage, kwargs):
+        """Runs a single stage and records its wall-clock duration."""
+        start = time.perf_counter()
+        try:
+            with span("stage", stage=stage.name):
+                return stage.func(**kwargs)
+        finally:
+            self.timings[stage.name] = time.perf_counter() - start
+
+    def run(self):
+        """Executes all stages and yields `(stage_name, result)` pairs in completion order."""
+        for kind, name, value in self.stream():
+            if kind == "result":
+                yield name, value
+
+    def stream(self, poll_interval=0.05):
+        """
+        Executes all stages, yielding ("token", stage_name, text) for tokens from streaming stages as they
+        arrive and ("result", stage_name, result) as each stage completes.
+        """
+        self.results = {}
+        self.timings = {}
+        tokens = queue.Queue()
+        pending = dict(self.stages)
+        running = {}
+        start = time.perf_counter()
+
+        def drain_tokens():
+            while not tokens.empty():
+                name, token = tokens.get_nowait()
+                yield "token", name, token
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            try:
+                while pending or running:
+                    for name, stage in list(pending.items()):
+                        if all(dep in self.results for dep in stage.depends_on):
+                            kwargs = {dep: self.results[dep] for dep in stage.depends_on}
+                            if stage.streams:
+                                kwargs["on_token"] = lambda token, name=name: tokens.put((name, token))
+                            # Each stage runs in a copy of the caller's context so tracing spans nest correctly.
+                            context = contextvars.copy_context()
+                            running[pool.submit(context.run, self._timed_call, stage, kwargs)] = name
+                            del pending[name]
+
+                    done, _ = wait(running, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                    yield from drain_tokens()
+                    for future in done:
+                        name = running.pop(future)
+                        self.results[name] = future.result()
+                        yield "result", name, self.results[name]
+            finally:
+                for future in running:
+                    future.cancel()
+                self.timings["total"] = time.perf_counter() - start
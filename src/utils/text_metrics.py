@@ -0,0 +1,203 @@
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List
+
+FILLER_WORDS = ("um", "umm", "uh", "uhh", "erm")
+
+# Every keyword or phrase the heuristic tools look for. They are all matched in the same pass.
+EXPERIENCE_KEYWORDS = ("experience", "project", "skill", "team")
+ANALYSIS_KEYWORDS = (
+    "concise", "short", "direct", "ramble", "detailed", "strong", "excellent",
+    "filler words", "star method",
+) + EXPERIENCE_KEYWORDS
+
+# Inflections that still count as a keyword hit, e.g. "projects", "rambling", "concisely".
+KEYWORD_SUFFIXES = ("", "s", "es", "d", "ed", "ing", "er", "ly")
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?|[.!?]+")
+
+
+@dataclass
+class TextMetrics:
+    """Counts for a single piece of text. `keyword_hits` only contains keywords that were found."""
+    word_count: int = 0
+    sentence_count: int = 0
+    filler_count: int = 0
+    filler_counts: Dict[str, int] = field(default_factory=dict)
+    keyword_hits: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def avg_sentence_length(self) -> float:
+        return self.word_count / self.sentence_count if self.sentence_count else 0.0
+
+    def mentions(self, *keywords) -> bool:
+        """Returns True if any of the keywords (or their inflections) appear in the text."""
+        return any(self.keyword_hits.get(keyword.lower()) for keyword in keywords)
+
+
+@dataclass
+class TranscriptMetrics:
+    """Per-answer metrics for a transcript plus their totals."""
+    answers: List[TextMetrics] = field(default_factory=list)
+    total_words: int = 0
+    total_sentences: int = 0
+    filler_count: int = 0
+    keyword_hits: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def answer_count(self) -> int:
+        return len(self.answers)
+
+    @property
+    def avg_answer_length(self) -> float:
+        return self.total_words / self.answer_count if self.answer_count else 0.0
+
+
+class MetricsEngine:
+    """
+    Tokenises text once and computes word, sentence, filler-word and keyword counts in the same pass.
+    Filler words and keywords are matched on whole words, so "umbrella" is not an "um".
+    """
+    def __init__(self, filler_words=FILLER_WORDS, keywords=ANALYSIS_KEYWORDS):
+        self.filler_words = frozenset(word.lower() for word in filler_words)
+        self.keywords = tuple(keyword.lower() for keyword in keywords)
+        self._unigrams = {}
+        self._bigrams = {}
+        for keyword in self.keywords:
+            words = keyword.split()
+            if len(words) > 2:
+                raise ValueError(f"Keywords can be at most two words long: '{keyword}'.")
+            target = self._unigrams if len(words) == 1 else self._bigrams
+            for variant in self._inflections(words[-1]):
+                key = variant if len(words) == 1 else (words[0], variant)
+                target[key] = keyword
+
+    @staticmethod
+    def _inflections(word):
+        """Returns the word plus its common inflected forms."""
+        variants = {word + suffix for suffix in KEYWORD_SUFFIXES}
+        if word.endswith("e"):
+            variants.update(word[:-1] + suffix for suffix in ("ing", "ed", "er"))
+        return variants
+
+    def analyze(self, text) -> TextMetrics:
+        """Computes all metrics for one piece of text."""
+        metrics = TextMetrics()
+        previous_word = None
+        words_since_terminator = 0
+        for match in TOKEN_PATTERN.finditer((text or "").lower()):
+            token = match.group()
+            if token[0] in ".!?":
+                if words_since_terminator:
+                    metrics.sentence_count += 1
+                words_since_terminator = 0
+                previous_word = None
+                continue
+
+            metrics.word_count += 1
+            words_since_terminator += 1
+            if token in self.filler_words:
+                metrics.filler_count += 1
+                metrics.filler_counts[token] = metrics.filler_counts.get(token, 0) + 1
+            keyword = self._unigrams.get(token) or self._bigrams.get((previous_word, token))
+            if keyword:
+                metrics.keyword_hits[keyword] = metrics.keyword_hits.get(keyword, 0) + 1
+            previous_word = token
+
+        if words_since_terminator:
+            metrics.sentence_count += 1
+        return metrics
+
+    def analyze_transcript(self, transcript) -> TranscriptMetrics:
+        """Analyzes every answer in a transcript once and totals the results."""
+        return self.aggregate([self.analyze(entry.get("answer", "")) for entry in transcript])
+
+    def analyze_batch(self, transcripts) -> List[TranscriptMetrics]:
+        """
+        Analyzes several transcripts, returning one `TranscriptMetrics` per transcript. Each answer is
+        analyzed once, and the totals for every transcript come from one pandas group-by over all answers.
+        """
+        import pandas as pd  # Only batch analysis needs pandas, so the tools don't pay for importing it.
+
+        answers = [[self.analyze(entry.get("answer", "")) for entry in transcript] for transcript in transcripts]
+        counts = pd.DataFrame(
+            [(index, m.word_count, m.sentence_count, m.filler_count) for index, batch in enumerate(answers) for m in batch],
+            columns=["transcript", "words", "sentences", "fillers"],
+        )
+        totals = counts.groupby("transcript").sum().reindex(range(len(answers)), fill_value=0)
+        hits = pd.DataFrame(
+            [
+                (index, keyword, count)
+                for index, batch in enumerate(answers) for m in batch for keyword, count in m.keyword_hits.items()
+            ],
+            columns=["transcript", "keyword", "count"],
+        )
+        keyword_hits = [{} for _ in answers]
+        for (index, keyword), count in hits.groupby(["transcript", "keyword"])["count"].sum().items():
+            keyword_hits[index][keyword] = int(count)
+        return [
+            TranscriptMetrics(
+                answers=batch,
+                total_words=int(totals.at[index, "words"]),
+                total_sentences=int(totals.at[index, "sentences"]),
+                filler_count=int(totals.at[index, "fillers"]),
+                keyword_hits=keyword_hits[index],
+            )
+            for index, batch in enumerate(answers)
+        ]
+
+    @staticmethod
+    def aggregate(answer_metrics) -> TranscriptMetrics:
+        """Totals a list of per-answer metrics column by column."""
+        answer_metrics = list(answer_metrics)
+        keyword_hits = {}
+        for metrics in answer_metrics:
+            for keyword, count in metrics.keyword_hits.items():
+                keyword_hits[keyword] = keyword_hits.get(keyword, 0) + count
+        return TranscriptMetrics(
+            answers=answer_metrics,
+            total_words=sum(m.word_count for m in answer_metrics),
+            total_sentences=sum(m.sentence_count for m in answer_metrics),
+            filler_count=sum(m.filler_count for m in answer_metrics),
+            keyword_hits=keyword_hits,
+        )
+
+
+default_engine = MetricsEngine()
+
+@lru_cache(maxsize=512)
+def analyze_text(text) -> TextMetrics:
+    """
+    Analyzes text with the shared engine. Results are memoised, so tools that look at the same
+    summary or answer reuse one pass. Treat the returned metrics as read-only.
+    """
+    return default_engine.analyze(text)
+
+def analyze_transcript(transcript) -> TranscriptMetrics:
+    """Analyzes a transcript with the shared engine, reusing memoised per-answer results."""
+    return MetricsEngine.aggregate(analyze_text(entry.get("answer", "")) for entry in transcript)
+
+def readiness_score(summary, filler_count) -> int:
+    """
+    Calculates a 0-100 interview readiness score from the performance summary and filler word count.
+    This is a placeholder heuristic. A real implementation would be more nuanced.
+    """
+    score = 70  # Start with a base score
+    score -= filler_count * 2
+
+    # Adjust based on summary sentiment
+    summary_metrics = analyze_text(summary)
+    if summary_metrics.mentions("concise", "short"):
+        score -= 5
+    if summary_metrics.mentions("ramble"):
+        score -= 10
+    if summary_metrics.mentions("strong", "excellent"):
+        score += 15
+
+    # Ensure score is within bounds
+    return max(0, min(100, score))
+
+def estimate_tokens(text) -> int:
+    """Rough token count for budgeting and accounting: about four characters per token for English text."""
+    return (len(text) + 3) // 4 if text else 0
@@ -0,0 +1,95 @@
+import queue
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+
+_token_sink = ContextVar("token_sink", default=None)
+_DONE = object()
+
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+def emit_token(token):
+    """Sends a token to whoever is capturing tokens in the current context. A no-op otherwise."""
+    sink = _token_sink.get()
+    if sink is not None and token:
+        sink(token)
+
+@contextmanager
+def capture_tokens(on_token):
+    """Routes every token emitted by LLM calls in this context to `on_token` while the block runs."""
+    reset_token = _token_sink.set(on_token)
+    try:
+        yield
+    finally:
+        _token_sink.reset(reset_token)
+
+def stream_tokens(func, *args, **kwargs):
+    """
+    Runs `func(*args, on_token=..., **kwargs)` on a worker thread.
+    Yields ("token", text) for each token as it arrives and finally ("result", return_value).
+    Exceptions raised by `func` are re-raised in the caller.
+    """
+    tokens = queue.Queue()
+    outcome = {}
+
+    def worker():
+        try:
+            outcome["result"] = func(*args, on_token=tokens.put, **kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            tokens.put(_DONE)
+
+    threading.Thread(target=copy_context().run, args=(worker,), name="token-stream", daemon=True).start()
+    while (token := tokens.get()) is not _DONE:
+        yield "token", token
+    if "error" in outcome:
+        raise outcome["error"]
+    yield "result", outcome["result"]
+
+class FinalAnswerFilter:
+    """
+    Passes on only the final answer of one agent step. Agents reason in the ReAct format
+    ("Thought: ... Action: ... Action Input: ..."), and with tools a step may be a tool call; everything
+    up to "Final Answer:" is held back, so the chat never shows the agent's reasoning or tool calls.
+    """
+    def __init__(self, emit):
+        self.emit = emit
+        self._buffer = ""
+        self._answering = False
+
+    def feed(self, token):
+        if self._answering:
+            self.emit(token)
+            return
+        self._buffer += token
+        index = self._buffer.find(FINAL_ANSWER_MARKER)
+        if index >= 0:
+            self._answering = True
+            self.emit(self._buffer[index + len(FINAL_ANSWER_MARKER):].lstrip())
+            self._buffer = ""
+
+def token_router():
+    """
+    Returns a LangChain callback handler that forwards the final-answer tokens of each LLM call to
+    `emit_token`. Calls that run concurrently on the shared client are told apart by their run id.
+    """
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class TokenRouter(BaseCallbackHandler):
+        def __init__(self):
+            self._steps = {}
+
+        def on_llm_new_token(self, token, *, run_id=None, **kwargs):
+            step = self._steps.get(run_id)
+            if step is None:
+                step = self._steps[run_id] = FinalAnswerFilter(emit_token)
+            step.feed(token)
+
+        def on_llm_end(self, response, *, run_id=None, **kwargs):
+            self._steps.pop(run_id, None)
+
+        def on_llm_error(self, error, *, run_id=None, **kwargs):
+            self._steps.pop(run_id, None)
+
+    return TokenRouter()
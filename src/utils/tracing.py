@@ -0,0 +1,182 @@
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextvars import ContextVar
+
+DEFAULT_TRACE_PATH = os.path.join("data", "traces", "spans.jsonl")
+RECENT_SPAN_LIMIT = 500
+
+_current_span = ContextVar("current_span", default=None)
+
+
+class _NoopSpan:
+    """Returned by `span()` while tracing is disabled, so instrumented code pays almost nothing."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attributes):
+        pass
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """A timed, named unit of work with attributes, nested under whichever span was active when it started."""
+    def __init__(self, tracer, name, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        parent = _current_span.get()
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.parent_id = parent.span_id if parent else None
+        self.span_id = uuid.uuid4().hex[:16]
+        self.start_time = None
+        self.duration_ms = None
+        self.error = None
+        self._started = None
+        self._token = None
+
+    def set(self, **attributes):
+        """Adds or updates attributes, e.g. sizes that are only known once the work is done."""
+        self.attributes.update(attributes)
+
+    def __enter__(self):
+        self.start_time = time.time()
+        self._started = time.perf_counter()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration_ms = (time.perf_counter() - self._started) * 1000
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        self.tracer._finish(self)
+        return False
+
+    def to_dict(self):
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration_ms": round(self.duration_ms, 3),
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class Tracer:
+    """
+    Collects finished spans, appends each one as a JSON line to `path` and keeps the most recent
+    ones in memory for the debug panel.
+    """
+    def __init__(self, path=DEFAULT_TRACE_PATH, enabled=True, keep=RECENT_SPAN_LIMIT):
+        self.path = path
+        self.enabled = enabled
+        self._recent = deque(maxlen=keep)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def span(self, name, **attributes):
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, attributes)
+
+    def _finish(self, span):
+        record = span.to_dict()
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            self._recent.append(record)
+            if self.path:
+                if self._file is None:
+                    os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                    self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+                self._file.write(line)
+
+    def recent_spans(self, limit=None):
+        """Returns the most recently finished spans, oldest first."""
+        with self._lock:
+            spans = list(self._recent)
+        return spans[-limit:] if limit else spans
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+def get_tracer():
+    """
+    Returns the process-wide tracer. Tracing is off unless TRACING=1; spans go to TRACE_PATH.
+    The settings are read on first use, so a .env loaded at start-up applies.
+    """
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer(os.getenv("TRACE_PATH", DEFAULT_TRACE_PATH), enabled=os.getenv("TRACING") == "1")
+    return _tracer
+
+def configure(enabled=None, path=None):
+    """Turns tracing on or off, or redirects the export file, at runtime."""
+    global _tracer
+    current = get_tracer()
+    current.close()
+    _tracer = Tracer(
+        path if path is not None else current.path,
+        enabled=current.enabled if enabled is None else enabled,
+    )
+    return _tracer
+
+def tracing_enabled():
+    return get_tracer().enabled
+
+def span(name, **attributes):
+    """
+    Opens a span around a block: `with span("crew.run", agent=role) as s: ...; s.set(cache_hit=True)`.
+    Exceptions are recorded on the span and re-raised.
+    """
+    return get_tracer().span(name, **attributes)
+
+def traced(name, **attributes):
+    """Decorator that wraps every call of a function in a span."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(name, **attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def summarize_spans(spans):
+    """Aggregates spans by name into call counts, total and p95 duration in ms, and error counts."""
+    by_name = {}
+    for record in spans:
+        by_name.setdefault(record["name"], []).append(record)
+    summary = []
+    for name, records in by_name.items():
+        durations = sorted(r["duration_ms"] for r in records)
+        summary.append({
+            "name": name,
+            "count": len(records),
+            "total_ms": round(sum(durations), 1),
+            "p95_ms": round(durations[max(0, -(-len(durations) * 95 // 100) - 1)], 1),
+            "errors": sum(1 for r in records if r["error"]),
+        })
+    return sorted(summary, key=lambda row: row["total_ms"], reverse=True)
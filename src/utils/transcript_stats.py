@@ -0,0 +1,87 @@
+from src.utils.text_metrics import analyze_text, EXPERIENCE_KEYWORDS
+
+
+class TranscriptStats:
+    """
+    Running aggregates over the answers given so far, updated once per answer.
+    Reading any of the figures takes constant time regardless of interview length.
+    """
+    def __init__(self, keywords=EXPERIENCE_KEYWORDS):
+        self.keywords = tuple(keywords)
+        self.answer_count = 0
+        self.total_words = 0
+        self.total_sentences = 0
+        self.filler_count = 0
+        self.filler_counts = {}
+        self.keyword_hits = {}
+        self.per_interviewer = {}
+
+    @classmethod
+    def from_transcript(cls, transcript, keywords=EXPERIENCE_KEYWORDS):
+        """Builds stats for an existing transcript in one pass."""
+        stats = cls(keywords)
+        for entry in transcript:
+            stats.add(entry.get("answer", ""), entry.get("interviewer"))
+        return stats
+
+    @classmethod
+    def from_snapshot(cls, snapshot, keywords=EXPERIENCE_KEYWORDS):
+        """Rebuilds stats from a dict produced by `snapshot()`."""
+        stats = cls(keywords)
+        stats.answer_count = snapshot.get("answer_count", 0)
+        stats.total_words = snapshot.get("total_words", 0)
+        stats.total_sentences = snapshot.get("total_sentences", 0)
+        stats.filler_count = snapshot.get("filler_count", 0)
+        stats.filler_counts = dict(snapshot.get("filler_counts", {}))
+        stats.keyword_hits = dict(snapshot.get("keyword_hits", {}))
+        stats.per_interviewer = {name: dict(split) for name, split in snapshot.get("per_interviewer", {}).items()}
+        return stats
+
+    def add(self, answer, interviewer=None):
+        """Folds one answer into the running totals."""
+        metrics = analyze_text(answer)
+        self.answer_count += 1
+        self.total_words += metrics.word_count
+        self.total_sentences += metrics.sentence_count
+        self.filler_count += metrics.filler_count
+        for word, count in metrics.filler_counts.items():
+            self.filler_counts[word] = self.filler_counts.get(word, 0) + count
+        for keyword, count in metrics.keyword_hits.items():
+            self.keyword_hits[keyword] = self.keyword_hits.get(keyword, 0) + count
+
+        split = self.per_interviewer.setdefault(interviewer or "Interviewer", {"answers": 0, "words": 0, "filler_words": 0})
+        split["answers"] += 1
+        split["words"] += metrics.word_count
+        split["filler_words"] += metrics.filler_count
+        return metrics
+
+    @property
+    def avg_answer_length(self):
+        return self.total_words / self.answer_count if self.answer_count else 0.0
+
+    @property
+    def filler_rate(self):
+        """Filler words per 100 words."""
+        return 100 * self.filler_count / self.total_words if self.total_words else 0.0
+
+    @property
+    def keyword_coverage(self):
+        """Fraction of the tracked keywords mentioned at least once."""
+        if not self.keywords:
+            return 0.0
+        return sum(1 for keyword in self.keywords if self.keyword_hits.get(keyword)) / len(self.keywords)
+
+    def snapshot(self):
+        """Returns the aggregates as a plain, JSON-serialisable dict."""
+        return {
+            "answer_count": self.answer_count,
+            "total_words": self.total_words,
+            "total_sentences": self.total_sentences,
+            "avg_answer_length": round(self.avg_answer_length, 1),
+            "filler_count": self.filler_count,
+            "filler_counts": dict(self.filler_counts),
+            "filler_rate": round(self.filler_rate, 2),
+            "keyword_hits": dict(self.keyword_hits),
+            "keyword_coverage": round(self.keyword_coverage, 2),
+            "per_interviewer": {name: dict(split) for name, split in self.per_interviewer.items()},
+        }
@@ -0,0 +1,29 @@
+import importlib
+import threading
+import time
+
+_warmup_thread = None
+_warmup_lock = threading.Lock()
+import_timings = {}
+
+def _import_all(module_names):
+    """Imports each module in turn, recording how long each one took."""
+    for name in module_names:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"Background import of {name} failed: {e}")
+        import_timings[name] = time.perf_counter() - start
+
+def start_background_import(*module_names):
+    """
+    Starts importing the given modules on a daemon thread so they are loaded by the time they are needed.
+    Only the first call per process starts a thread; later calls return the same one.
+    """
+    global _warmup_thread
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(target=_import_all, args=(module_names,), name="import-warmup", daemon=True)
+            _warmup_thread.start()
+        return _warmup_thread
@@ -0,0 +1,412 @@
+import importlib
+import multiprocessing
+import queue
+import threading
+import time
+import uuid
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from src.utils.transcript_stats import TranscriptStats
+
+DEFAULT_MANAGER_FACTORY = "src.simulation_manager:SimulationManager"
+DEFAULT_PREFETCH_FUNCTION = "src.simulation_manager:prefetch_questions"
+
+# Sessions with no request for this long are dropped from their worker; they resume from their checkpoint.
+DEFAULT_SESSION_IDLE_TTL = 30 * 60
+SWEEP_INTERVAL = 30.0
+
+
+class PoolBusyError(RuntimeError):
+    """Raised when a session's worker already has too many queued requests. The user should wait and retry."""
+
+
+class WorkerError(RuntimeError):
+    """Raised when a worker process fails to handle a request."""
+
+
+def _load_factory(path):
+    """Imports a "module:attribute" path."""
+    module_name, attribute = path.split(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+def _status_event(manager):
+    """Summarises a manager's state so the front end can refresh without another round trip."""
+    return {"type": "status", "stats": manager.stats.snapshot(), "pending_feedback": manager.has_pending_feedback()}
+
+def _handle_request(managers, manager_factory, session_id, command, args):
+    """Runs one command against a session's manager, yielding its events."""
+    if command == "prefetch":
+        # Speculative question generation; runs here so its LLM calls share the pool's limits.
+        prefetch_path, config = args
+        yield {"type": "questions", "questions": _load_factory(prefetch_path)(config)}
+        return
+    if command == "close":
+        manager = managers.pop(session_id, None)
+        if manager is not None:
+            manager.close()
+        return
+    if command == "start":
+        config, options, questions = args
+        previous = managers.pop(session_id, None)
+        if previous is not None:
+            previous.close()
+        manager = manager_factory(config=config, session_id=session_id, **options)
+        managers[session_id] = manager
+        if questions:
+            manager.adopt_questions(questions)
+        events = []
+        manager.start_simulation(
+            on_question=lambda msg, is_intro=False: events.append({"type": "callback", "callback": "question", "content": msg}),
+            on_feedback=lambda msg: events.append({"type": "callback", "callback": "feedback", "content": msg}),
+            on_finish=lambda msg: events.append({"type": "callback", "callback": "finish", "content": msg})
+        )
+        yield from events
+        return
+
+    manager = managers.get(session_id)
+    if manager is None and hasattr(manager_factory, "resume"):
+        # The session may have started on a worker that has since been recycled; pick it up from its checkpoint.
+        options = args[0] if command == "resume" else {}
+        manager = manager_factory.resume(session_id, **options)
+        if manager is not None:
+            managers[session_id] = manager
+    if manager is None:
+        raise KeyError(f"Session {session_id} is not active on this worker.")
+    if command == "resume":
+        yield {"type": "resumed", "transcript": manager.transcript}
+        yield _status_event(manager)
+    elif command == "ask":
+        finished = False
+        for event in manager.ask_next_question(args[0]):
+            finished = finished or event.get("type") == "final_results"
+            yield event
+        yield _status_event(manager)
+        if finished:
+            # Nothing more will be asked of a finished interview, so free it straight away.
+            managers.pop(session_id, None)
+            manager.close()
+    elif command == "collect_feedback":
+        yield from manager.collect_feedback(wait=args[0])
+        yield _status_event(manager)
+    else:
+        raise ValueError(f"Unknown command '{command}'.")
+
+def _run_request(managers, manager_factory, responses, request):
+    """Runs one request and reports its events, any error and its completion."""
+    request_id, session_id, command, args, enqueued_at = request
+    responses.put((request_id, "wait", time.time() - enqueued_at))
+    try:
+        for event in _handle_request(managers, manager_factory, session_id, command, args):
+            responses.put((request_id, "event", event))
+    except Exception as e:
+        responses.put((request_id, "error", f"{type(e).__name__}: {e}"))
+    responses.put((request_id, "done", None))
+
+def _sweep_sessions(managers, executors, last_requests, idle_ttl):
+    """
+    Releases the executors of sessions that are no longer active, and the managers of sessions idle
+    for longer than `idle_ttl` seconds. Only sessions with no request in progress are touched.
+    """
+    now = time.monotonic()
+    for session_id in list(executors):
+        executor, future = executors[session_id]
+        if not future.done():
+            continue
+        if session_id in managers and now - last_requests[session_id] < idle_ttl:
+            continue
+        del executors[session_id]
+        del last_requests[session_id]
+        executor.shutdown(wait=False)
+        manager = managers.pop(session_id, None)
+        if manager is not None:
+            print(f"Session {session_id} was idle for {idle_ttl:.0f}s; releasing it.")
+            manager.close()
+
+def _worker_main(requests, responses, llm_limit, manager_factory_path, idle_ttl=DEFAULT_SESSION_IDLE_TTL):
+    """
+    Entry point of a worker process: owns the managers of its sessions and runs their commands.
+    Each session gets its own single-thread executor, so a session's commands run in order while a
+    slow LLM call in one session does not hold up the other sessions on the worker. Finished, closed
+    and idle sessions are released periodically.
+    """
+    from src.utils.llm_registry import load_env, set_global_limit
+    load_env()
+    set_global_limit(llm_limit)
+    manager_factory = _load_factory(manager_factory_path)
+    managers = {}
+    executors = {}
+    last_requests = {}
+    sweep_every = min(SWEEP_INTERVAL, idle_ttl)
+    last_sweep = time.monotonic()
+
+    while True:
+        try:
+            request = requests.get(timeout=sweep_every)
+        except queue.Empty:
+            pass
+        else:
+            if request is None:
+                break
+            session_id = request[1]
+            executor = executors[session_id][0] if session_id in executors else ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"session-{session_id[:8]}"
+            )
+            executors[session_id] = (executor, executor.submit(_run_request, managers, manager_factory, responses, request))
+            last_requests[session_id] = time.monotonic()
+        if time.monotonic() - last_sweep >= sweep_every:
+            _sweep_sessions(managers, executors, last_requests, idle_ttl)
+            last_sweep = time.monotonic()
+
+    for executor, _ in executors.values():
+        executor.shutdown(wait=True)
+    for manager in managers.values():
+        manager.close()
+
+
+class SimulationWorkerPool:
+    """
+    Runs simulation sessions in separate worker processes so slow LLM calls never block the UI process.
+
+    Every session is pinned to one worker, which keeps its SimulationManager in memory until the interview
+    finishes, is closed or has been idle for `session_idle_ttl` seconds. All workers share a cap on
+    concurrent LLM calls, which also covers speculative question generation (`prefetch_questions`). Each worker accepts at most `max_queue_depth` outstanding requests;
+    beyond that `submit` raises PoolBusyError so the UI can ask the user to wait.
+    """
+    def __init__(self, num_workers=2, max_concurrent_llm_calls=4, max_queue_depth=8, manager_factory=DEFAULT_MANAGER_FACTORY,
+                 prefetch_function=DEFAULT_PREFETCH_FUNCTION, session_idle_ttl=DEFAULT_SESSION_IDLE_TTL):
+        self.num_workers = num_workers
+        self.max_concurrent_llm_calls = max_concurrent_llm_calls
+        self.max_queue_depth = max_queue_depth
+        self.manager_factory = manager_factory
+        self.prefetch_function = prefetch_function
+        self.session_idle_ttl = session_idle_ttl
+        self._lock = threading.Lock()
+        self._context = None
+        self._processes = []
+        self._request_queues = []
+        self._restarts = 0
+        self._responses = None
+        self._llm_limit = None
+        self._inboxes = {}
+        self._depth = [0] * num_workers
+        self._queue_waits = deque(maxlen=1000)
+        self._completed = 0
+        self._rejected = 0
+        self._dispatcher = None
+
+    def start(self):
+        """Starts the worker processes and the thread that routes their responses."""
+        self._context = multiprocessing.get_context("spawn")
+        self._responses = self._context.Queue()
+        # Keep a reference: the semaphore is unlinked if it is garbage-collected before the workers load it.
+        self._llm_limit = self._context.BoundedSemaphore(self.max_concurrent_llm_calls)
+        for _ in range(self.num_workers):
+            requests, process = self._spawn_worker()
+            self._request_queues.append(requests)
+            self._processes.append(process)
+        self._dispatcher = threading.Thread(target=self._dispatch, name="worker-pool-dispatcher", daemon=True)
+        self._dispatcher.start()
+        return self
+
+    def _spawn_worker(self):
+        requests = self._context.Queue()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(requests, self._responses, self._llm_limit, self.manager_factory, self.session_idle_ttl),
+            daemon=True
+        )
+        process.start()
+        return requests, process
+
+    def _restart_worker(self, worker, process):
+        """
+        Replaces a dead worker process. Its outstanding requests fail with WorkerError and its queue depth
+        is reset; its sessions resume from their checkpoints on the new process.
+        """
+        with self._lock:
+            if self._processes[worker] is not process or process.is_alive():
+                return
+            message = f"Worker {worker} exited with code {process.exitcode}."
+            print(f"{message} Restarting it.")
+            for request_id, (inbox, owner) in list(self._inboxes.items()):
+                if owner == worker:
+                    del self._inboxes[request_id]
+                    inbox.put(("error", message))
+            self._depth[worker] = 0
+            self._restarts += 1
+            self._request_queues[worker], self._processes[worker] = self._spawn_worker()
+
+    def shutdown(self, timeout=5):
+        """Stops the workers after they finish their queued requests."""
+        for requests in self._request_queues:
+            requests.put(None)
+        for process in self._processes:
+            process.join(timeout)
+        if self._responses is not None:
+            self._responses.put(None)
+        self._processes = []
+        self._request_queues = []
+
+    def worker_for(self, session_id):
+        """Returns the index of the worker that owns a session."""
+        return zlib.crc32(session_id.encode("utf-8")) % self.num_workers
+
+    def submit(self, session_id, command, *args):
+        """
+        Queues a command for a session and returns an iterator over its events.
+        Raises PoolBusyError immediately if the session's worker queue is full.
+        """
+        worker = self.worker_for(session_id)
+        process = self._processes[worker]
+        if not process.is_alive():
+            self._restart_worker(worker, process)
+        request_id = uuid.uuid4().hex
+        inbox = queue.Queue()
+        with self._lock:
+            if self._depth[worker] >= self.max_queue_depth:
+                self._rejected += 1
+                raise PoolBusyError("All interview workers are busy right now. Please wait a moment and try again.")
+            self._depth[worker] += 1
+            self._inboxes[request_id] = (inbox, worker)
+            self._request_queues[worker].put((request_id, session_id, command, args, time.time()))
+        return self._responses_for(inbox, worker)
+
+    def prefetch_questions(self, config):
+        """Generates questions for `config` on a worker, for use as a SpeculativeQuestionJob's `generate`."""
+        events = list(self.submit(uuid.uuid4().hex, "prefetch", self.prefetch_function, config))
+        return events[0]["questions"] if events else None
+
+    def _responses_for(self, inbox, worker):
+        """Yields a request's events as they arrive. If the worker dies, it is restarted and WorkerError is raised."""
+        while True:
+            try:
+                kind, payload = inbox.get(timeout=1)
+            except queue.Empty:
+                process = self._processes[worker]
+                if not process.is_alive():
+                    self._restart_worker(worker, process)
+                continue
+            if kind == "event":
+                yield payload
+            elif kind == "error":
+                raise WorkerError(payload)
+            elif kind == "done":
+                return
+
+    def _dispatch(self):
+        """Routes worker responses to the inbox of the request they belong to."""
+        while True:
+            item = self._responses.get()
+            if item is None:
+                break
+            request_id, kind, payload = item
+            with self._lock:
+                inbox, worker = self._inboxes.get(request_id, (None, None))
+                if kind == "wait":
+                    self._queue_waits.append(payload)
+                elif kind == "done" and inbox is not None:
+                    del self._inboxes[request_id]
+                    self._depth[worker] -= 1
+                    self._completed += 1
+            if inbox is not None and kind != "wait":
+                inbox.put((kind, payload))
+
+    def metrics(self):
+        """Returns queue depths, rejections and queue-wait percentiles (in seconds)."""
+        with self._lock:
+            waits = sorted(self._queue_waits)
+            depth = list(self._depth)
+            completed, rejected, restarts = self._completed, self._rejected, self._restarts
+
+        def percentile(p):
+            return waits[min(len(waits) - 1, int(p * len(waits)))] if waits else 0.0
+
+        return {
+            "queue_depth": depth,
+            "completed": completed,
+            "rejected": rejected,
+            "restarts": restarts,
+            "queue_wait_p50": percentile(0.50),
+            "queue_wait_p95": percentile(0.95),
+            "queue_wait_max": waits[-1] if waits else 0.0,
+        }
+
+
+class RemoteSimulation:
+    """
+    Front-end handle for a session running in a SimulationWorkerPool.
+    It mirrors the parts of SimulationManager that the Streamlit app uses.
+    """
+    def __init__(self, pool, config, session_id=None, **options):
+        self.pool = pool
+        self.config = config
+        self.options = options
+        self.session_id = session_id or uuid.uuid4().hex
+        self.stats = TranscriptStats()
+        self.transcript = []
+        self._questions = None
+        self._pending_feedback = False
+
+    @classmethod
+    def resume(cls, pool, session_id, **options):
+        """Reattaches to a checkpointed session on whichever worker it maps to, or returns None if it has none."""
+        session = cls(pool, None, session_id=session_id, **options)
+        try:
+            for event in session._events("resume", options):
+                session.transcript = event["transcript"]
+        except WorkerError as e:
+            print(f"Could not resume session {session_id}: {e}")
+            return None
+        return session
+
+    def adopt_questions(self, questions):
+        """Sends pre-generated questions along with the start command."""
+        self._questions = list(questions)
+
+    def start_simulation(self, on_question, on_feedback, on_finish):
+        """Starts the session on its worker and replays the manager's callbacks locally."""
+        callbacks = {
+            "question": lambda msg: on_question(msg, is_intro=True),
+            "feedback": on_feedback,
+            "finish": on_finish,
+        }
+        for event in self.pool.submit(self.session_id, "start", self.config, self.options, self._questions):
+            callbacks[event["callback"]](event["content"])
+
+    def _events(self, command, *args):
+        """Yields a command's events, applying status updates instead of passing them on."""
+        for event in self.pool.submit(self.session_id, command, *args):
+            if event.get("type") == "status":
+                self.stats = TranscriptStats.from_snapshot(event["stats"])
+                self._pending_feedback = event["pending_feedback"]
+            else:
+                yield event
+
+    def ask_next_question(self, user_response=None):
+        """Sends the answer to the worker and yields its events as they are produced."""
+        try:
+            yield from self._events("ask", user_response)
+        except WorkerError as e:
+            yield {"type": "error", "content": f"Sorry, an unexpected error occurred: {e}"}
+
+    def has_pending_feedback(self):
+        return self._pending_feedback
+
+    def collect_feedback(self, wait=False):
+        """Fetches finished background feedback from the worker."""
+        if not self._pending_feedback:
+            return []
+        try:
+            return list(self._events("collect_feedback", wait))
+        except (PoolBusyError, WorkerError) as e:
+            print(f"Could not collect feedback: {e}")
+            return []
+
+    def close(self):
+        """Releases the session on its worker."""
+        try:
+            for _ in self.pool.submit(self.session_id, "close"):
+                pass
+        except (PoolBusyError, WorkerError) as e:
+            print(f"Could not close session {self.session_id}: {e}")
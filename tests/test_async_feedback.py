@@ -0,0 +1,83 @@
+import threading
+import time
+import unittest
+from benchmarks.interview_latency import BENCHMARK_CONFIG, FakeLLM, _load_manager_class, lift_request_quota
+
+class ScriptedLLM(FakeLLM):
+    """Answers containing "slow" take a while to grade and answers containing "explode" make the call fail."""
+    def __init__(self):
+        super().__init__(latency=0.0, tokens=5)
+        self.release = threading.Event()
+
+    def complete(self, role, prompt, stream):
+        if role == "feedback_analyst" and "slow" in prompt:
+            self.release.wait(5)
+        if role == "feedback_analyst" and "explode" in prompt:
+            raise ValueError("model output could not be parsed")
+        return super().complete(role, prompt, stream)
+
+class TestAsyncFeedback(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        lift_request_quota()
+
+    def make_manager(self, questions):
+        self.llm = ScriptedLLM()
+        manager = _load_manager_class()(
+            self.llm, config=BENCHMARK_CONFIG, feedback_mode="async", use_cache=False,
+            use_question_bank=False, record_session=False, checkpoint=False, stream_output=False,
+        )
+        self.addCleanup(manager.close)
+        manager.questions = list(questions)
+        list(manager.ask_next_question())
+        return manager
+
+    def test_answers_get_pending_slots_and_feedback_arrives_in_transcript_order(self):
+        manager = self.make_manager(["Q1", "Q2", "Q3"])
+        first = list(manager.ask_next_question("A slow answer."))
+        list(manager.ask_next_question("A quick answer."))
+        self.assertEqual([event["type"] for event in first], ["feedback_pending", "question"])
+
+        deadline = time.monotonic() + 5
+        while not manager._pending_feedback[1].done() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        ready = manager.collect_feedback()
+        self.assertEqual([event["transcript_index"] for event in ready], [1])
+        self.assertTrue(manager.has_pending_feedback())
+
+        self.llm.release.set()
+        self.assertEqual([event["transcript_index"] for event in manager.collect_feedback(wait=True)], [0])
+        self.assertFalse(manager.has_pending_feedback())
+        self.assertTrue(all("feedback" in entry for entry in manager.transcript))
+
+    def test_concurrent_evaluations_use_their_own_agents(self):
+        manager = self.make_manager(["Q1", "Q2", "Q3"])
+        agents = []
+        new_crew = manager._new_crew
+        manager._new_crew = lambda agent: agents.append(agent) or new_crew(agent)
+        list(manager.ask_next_question("First answer."))
+        list(manager.ask_next_question("Second answer."))
+        manager.collect_feedback(wait=True)
+        self.assertEqual(len(agents), 2)
+        self.assertIsNot(agents[0], agents[1])
+        self.assertNotIn(manager.feedback_analyst_agent, agents)
+
+    def test_finalize_waits_for_pending_feedback(self):
+        manager = self.make_manager(["Q1"])
+        threading.Timer(0.2, self.llm.release.set).start()
+        events = list(manager.ask_next_question("A slow final answer."))
+        types = [event["type"] for event in events]
+        self.assertLess(types.index("feedback"), types.index("analysis_started"))
+        self.assertIn("final_results", types)
+        self.assertIn("feedback", manager.transcript[0])
+
+    def test_failed_evaluation_fills_its_slot_with_an_error(self):
+        manager = self.make_manager(["Q1", "Q2"])
+        list(manager.ask_next_question("This will explode."))
+        events = manager.collect_feedback(wait=True)
+        self.assertEqual(len(events), 1)
+        self.assertIn("Could not generate feedback", events[0]["content"])
+        self.assertFalse(manager.has_pending_feedback())
+
+if __name__ == '__main__':
+    unittest.main()
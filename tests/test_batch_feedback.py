@@ -0,0 +1,21 @@
+import unittest
+from src.simulation_manager import SimulationManager
+
+class TestBatchFeedbackParsing(unittest.TestCase):
+    def test_parses_json_list_inside_surrounding_text(self):
+        result = 'Here you go:\n[{"answer": 1, "feedback": "Add detail."}, {"answer": 2, "feedback": "Great use of STAR."}]'
+        self.assertEqual(
+            SimulationManager._parse_batch_feedback(result),
+            {1: "Add detail.", 2: "Great use of STAR."}
+        )
+
+    def test_missing_answer_numbers_fall_back_to_position(self):
+        result = '[{"feedback": "First"}, {"answer": "two", "feedback": "Second"}]'
+        self.assertEqual(SimulationManager._parse_batch_feedback(result), {1: "First", 2: "Second"})
+
+    def test_unstructured_output_returns_nothing(self):
+        self.assertEqual(SimulationManager._parse_batch_feedback("Both answers were good."), {})
+        self.assertEqual(SimulationManager._parse_batch_feedback("[not json]"), {})
+
+if __name__ == '__main__':
+    unittest.main()
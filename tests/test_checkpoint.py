@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.simulation_manager import SimulationManager
+from src.utils.checkpoint import CheckpointStore, CheckpointVersionError
+
+def apply_event(state, event):
+    state["items"].append(event["item"])
+
+class OfflineSimulationManager(SimulationManager):
+    """A SimulationManager without crews, for exercising state handling only."""
+    def _initialize_crews(self):
+        pass
+
+CONFIG = {
+    "company_name": "Acme",
+    "job_role": "Engineer",
+    "job_description": "Build things.",
+    "interviewers": [{"name": "Alice", "role": "Manager"}, {"name": "Bob", "role": "Engineer"}],
+}
+
+class TestCheckpointStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = CheckpointStore(self.tmp_dir.name, compact_after=3)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_snapshot_plus_log_replay(self):
+        self.assertIsNone(self.store.load("s1", apply_event))
+        self.store.save("s1", {"items": [1]})
+        self.store.append("s1", {"type": "add", "item": 2})
+        with open(os.path.join(self.tmp_dir.name, "s1.jsonl"), "a", encoding="utf-8") as f:
+            f.write('{"type": "add", "it')
+        self.assertEqual(self.store.load("s1", apply_event), {"items": [1, 2]})
+
+    def test_long_logs_are_compacted(self):
+        self.store.save("s1", {"items": []})
+        for item in range(3):
+            self.store.append("s1", {"type": "add", "item": item})
+        self.assertEqual(self.store.load("s1", apply_event), {"items": [0, 1, 2]})
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_dir.name, "s1.jsonl")))
+        self.assertEqual(self.store.load("s1", apply_event), {"items": [0, 1, 2]})
+
+    def test_rejects_other_versions_and_unsafe_ids(self):
+        with open(os.path.join(self.tmp_dir.name, "old.json"), "w", encoding="utf-8") as f:
+            f.write('{"version": 0, "state": {}}')
+        with self.assertRaises(CheckpointVersionError):
+            self.store.load("old", apply_event)
+        with self.assertRaises(ValueError):
+            self.store.save("../escape", {})
+
+class TestManagerResume(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = CheckpointStore(self.tmp_dir.name)
+        patcher = patch("src.simulation_manager.get_checkpoint_store", return_value=self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def make_manager(self, **kwargs):
+        return OfflineSimulationManager(
+            config=CONFIG, feedback_mode="exam", use_cache=False, use_question_bank=False, record_session=False, **kwargs
+        )
+
+    def test_resumes_after_each_answer_without_regenerating_questions(self):
+        manager = self.make_manager()
+        manager.adopt_questions(["Q1", "Q2", "Q3"])
+        manager.start_simulation(lambda msg, is_intro: None, lambda msg: None, lambda msg: None)
+        list(manager.ask_next_question())
+        list(manager.ask_next_question("Um, my first answer."))
+        list(manager.ask_next_question("My second answer."))
+
+        resumed = OfflineSimulationManager.resume(manager.session_id, use_cache=False, use_question_bank=False, record_session=False)
+        self.assertEqual(resumed.questions, ["Q1", "Q2", "Q3"])
+        self.assertEqual(resumed.transcript, manager.transcript)
+        self.assertEqual(resumed.stats.snapshot(), manager.stats.snapshot())
+        self.assertEqual(resumed.feedback_mode, "exam")
+        self.assertEqual(resumed._feedback_queue, [0, 1])
+
+        # The question that was on screen (Q3, asked by Alice) is asked again.
+        events = list(resumed.ask_next_question())
+        self.assertEqual(events, [{"type": "question", "content": "Alice (Manager): Q3"}])
+
+    def test_missing_checkpoint_returns_none(self):
+        self.assertIsNone(OfflineSimulationManager.resume("unknown"))
+
+if __name__ == '__main__':
+    unittest.main()
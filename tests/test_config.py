@@ -0,0 +1,38 @@
+import json
+import os
+import tempfile
+import unittest
+from pydantic import ValidationError
+from src.config.config import InterviewConfig, load_interview_config, to_config_dict
+
+class TestInterviewConfig(unittest.TestCase):
+    def test_validates_and_normalises_plain_dicts(self):
+        config = to_config_dict({
+            "company_name": " Acme ",
+            "job_role": "Engineer",
+            "interviewers": [{"name": "Alice", "role": "Manager", "extra": "ignored"}],
+        })
+        self.assertEqual(config["company_name"], "Acme")
+        self.assertEqual(config["interviewers"], [{"name": "Alice", "role": "Manager", "linkedin": ""}])
+        self.assertNotIn("user_id", config)
+        self.assertEqual(to_config_dict(InterviewConfig(**config)), config)
+
+        with self.assertRaises(ValidationError):
+            to_config_dict({"job_role": "Engineer"})
+
+    def test_file_loader_is_cached_until_the_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "config.json")
+            with open(path, "w") as f:
+                json.dump({"company_name": "Acme"}, f)
+            first = load_interview_config(path)
+            first["company_name"] = "Changed by caller"
+            self.assertEqual(load_interview_config(path)["company_name"], "Acme")
+
+            with open(path, "w") as f:
+                json.dump({"company_name": "Other"}, f)
+            os.utime(path, (os.path.getmtime(path) + 5, os.path.getmtime(path) + 5))
+            self.assertEqual(load_interview_config(path)["company_name"], "Other")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from benchmarks.interview_latency import BENCHMARK_CONFIG, FakeLLM, _load_manager_class, lift_request_quota, run_interview, summarize
+from src.utils.context_builder import BudgetExceededError, SessionBudget, TranscriptDigest, compact_interviewers, fit_text
+from src.utils.text_metrics import estimate_tokens
+
+def entry(number, words=60, filler=False):
+    answer = " ".join(["um"] if filler else []) + " " + " ".join(f"word{number}x{i}" for i in range(words))
+    return {"question": f"Tell me about a time you led project {number}.", "answer": answer.strip() + ".", "interviewer": "Alice"}
+
+class TestContextHelpers(unittest.TestCase):
+    def test_fit_text_respects_budget(self):
+        text = "First sentence here. " * 100
+        fitted = fit_text(text, 50)
+        self.assertLessEqual(estimate_tokens(fitted), 50)
+        self.assertTrue(fitted.endswith("[...]"))
+        self.assertEqual(fit_text("Short.", 50), "Short.")
+
+    def test_compact_interviewers(self):
+        interviewers = [{"name": "Alice", "role": "Manager", "linkedin": "https://example.com/alice"}]
+        self.assertEqual(compact_interviewers(interviewers), "Alice (Manager)")
+
+class TestTranscriptDigest(unittest.TestCase):
+    def test_digest_size_stays_flat_as_the_interview_grows(self):
+        short, long = TranscriptDigest(), TranscriptDigest()
+        for number in range(1, 16):
+            short.add(entry(number))
+        for number in range(1, 201):
+            long.add(entry(number))
+        self.assertLessEqual(estimate_tokens(long.render(800)), 800)
+        self.assertLess(abs(len(long.render(800)) - len(short.render(800))), 200)
+        self.assertIn("Earlier behavioral answers: 188", long.render(800))
+
+    def test_weak_answers_are_quoted_verbatim(self):
+        digest = TranscriptDigest()
+        digest.add(entry(1, words=5))
+        for number in range(2, 8):
+            digest.add(entry(number))
+        rendered = digest.render(2000)
+        self.assertIn("Verbatim excerpts:", rendered)
+        self.assertIn("word1x0", rendered)
+
+    def test_feedback_added_later_is_summarized(self):
+        digest = TranscriptDigest()
+        first = entry(1)
+        digest.add(first)
+        first["feedback"] = "Good structure. Add a measurable result."
+        self.assertIn("Feedback: Good structure.", digest.render(500))
+
+class TestSessionBudget(unittest.TestCase):
+    def test_limit_is_enforced_before_the_call(self):
+        budget = SessionBudget(limit=100)
+        budget.check(60)
+        budget.charge(60)
+        with self.assertRaises(BudgetExceededError):
+            budget.check(50)
+        self.assertEqual(budget.remaining, 40)
+        self.assertEqual(SessionBudget().remaining, None)
+
+class TestManagerContext(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        lift_request_quota()
+
+    def test_analysis_prompt_does_not_grow_with_answer_length(self):
+        sizes = []
+        for answer_words in (50, 1000):
+            fake_llm = FakeLLM(latency=0.0, tokens=5)
+            run = run_interview(fake_llm, "batch", answer_words=answer_words)
+            sizes.append(summarize([run], fake_llm.calls)["by_role"]["performance_analysis"]["max_prompt_chars"])
+        self.assertLess(sizes[1], sizes[0] * 4)
+
+    def test_session_ceiling_stops_model_calls(self):
+        fake_llm = FakeLLM(latency=0.0, tokens=5)
+        manager = _load_manager_class()(
+            fake_llm, config=BENCHMARK_CONFIG, use_cache=False, use_question_bank=False,
+            record_session=False, checkpoint=False,
+        )
+        manager.transcript.append(entry(1))
+        manager.digest.add(manager.transcript[-1])
+        manager.budget = SessionBudget(limit=10)
+        with self.assertRaises(BudgetExceededError):
+            manager._run_performance_analysis()
+        self.assertEqual(fake_llm.calls, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,4 @@
-from src.crews.interview_prep_crew import interview_prep_crew
+from src.crews.interview_prep_crew import run_interview_prep
 from src.config.config import load_interview_config
 
 print("🚀 Starting comprehensive interview preparation...")
@@ -11,11 +11,13 @@ config = load_interview_config()
 # Extract the interviewer names from the config
 interviewer_names = ", ".join([interviewer['name'] for interviewer in config['interviewers']])
 
-result = interview_prep_crew.kickoff(
-    inputs={
-        'company_name': config['company_name'],
-        'interviewer_names': interviewer_names,
-        'job_role': config['job_role'],
-        'job_description': config['job_description']
-    }
-)
+result = run_interview_prep({
+    'company_name': config['company_name'],
+    'interviewer_names': interviewer_names,
+    'job_role': config['job_role'],
+    'job_description': config['job_description'],
+    'interviewers': config['interviewers']
+})
+
+for stage, seconds in result['timings'].items():
+    print(f"{stage}: {seconds:.1f}s")
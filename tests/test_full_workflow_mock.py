@@ -1,6 +1,9 @@
 import unittest
-from unittest.mock import patch
-from src.crews.interview_prep_crew import interview_prep_crew
+from unittest.mock import MagicMock, patch
+from crewai import Task
+from src.agents.interviewer_profiler import interviewer_profiler
+from src.crews.interview_prep_crew import company_research_task, interview_prep_crew, run_interview_prep
+from src.utils.context_builder import BudgetExceededError, SessionBudget
 
 class TestFullWorkflowMock(unittest.TestCase):
     @patch('crewai.Crew.kickoff')
@@ -27,5 +30,60 @@ class TestFullWorkflowMock(unittest.TestCase):
         print("\nSuccessfully tested the full workflow with mock data.")
         print(f"Result: {result}")
 
+    @patch('crewai.Crew.kickoff')
+    def test_parallel_prep_with_mock_data(self, mock_kickoff):
+        mock_kickoff.return_value = "Mocked output"
+        inputs = {
+            'company_name': 'Mock Company',
+            'interviewer_names': 'Mock Interviewer 1, Mock Interviewer 2',
+            'job_role': 'Mock Role'
+        }
+
+        results = run_interview_prep(inputs, use_cache=False)
+
+        self.assertEqual(mock_kickoff.call_count, 3)
+        self.assertEqual(results['questions'], "Mocked output")
+        self.assertIn('company_research', results['timings'])
+        self.assertIn('interviewer_profiles', results['timings'])
+        self.assertIn('total', results['timings'])
+
+    @patch('crewai.Crew.kickoff')
+    def test_prep_calls_go_through_the_guard_on_fresh_tasks(self, mock_kickoff):
+        mock_kickoff.return_value = "Mocked output"
+        guard = MagicMock()
+        guard.call.side_effect = lambda func, **kwargs: func()
+        inputs = {'company_name': 'Mock Company', 'interviewer_names': 'Mock Interviewer', 'job_role': 'Mock Role'}
+
+        with patch('src.crews.interview_prep_crew.get_guard', return_value=guard):
+            budget = SessionBudget()
+            run_interview_prep(inputs, budget=budget, use_cache=False)
+
+        self.assertEqual(guard.call.call_count, 3)
+        self.assertGreater(budget.used, 0)
+        self.assertIn('{company_name}', company_research_task.description)
+
+    @patch('crewai.Crew.kickoff')
+    def test_concurrent_profiles_use_their_own_agents(self, mock_kickoff):
+        mock_kickoff.return_value = "Mocked output"
+        inputs = {
+            'company_name': 'Mock Company',
+            'job_role': 'Mock Role',
+            'interviewers': [{'name': 'Alice', 'role': 'Manager'}, {'name': 'Bob', 'role': 'Engineer'}],
+        }
+        with patch('src.crews.interview_prep_crew.Task', wraps=Task) as task_class:
+            run_interview_prep(inputs, use_cache=False)
+        agents = [call.kwargs['agent'] for call in task_class.call_args_list]
+        profilers = [agent for agent in agents if agent.role == interviewer_profiler.role]
+        self.assertEqual(len(profilers), 2)
+        self.assertIsNot(profilers[0], profilers[1])
+        self.assertTrue(all(agent is not interviewer_profiler for agent in profilers))
+
+    @patch('crewai.Crew.kickoff')
+    def test_prep_respects_the_session_budget(self, mock_kickoff):
+        inputs = {'company_name': 'Mock Company', 'interviewer_names': 'Mock Interviewer', 'job_role': 'Mock Role'}
+        with self.assertRaises(BudgetExceededError):
+            run_interview_prep(inputs, budget=SessionBudget(limit=1), use_cache=False)
+        mock_kickoff.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
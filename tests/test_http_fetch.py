@@ -0,0 +1,91 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.utils.http_fetch import FetchError, HTTPFetcher, ResponseCache
+
+class StubHandler(BaseHTTPRequestHandler):
+    hits = {}
+    version = "v1"
+
+    def do_GET(self):
+        StubHandler.hits[self.path] = StubHandler.hits.get(self.path, 0) + 1
+        if self.path.startswith("/slow"):
+            time.sleep(1)
+        if self.path.startswith("/error"):
+            self.send_response(500)
+            self.end_headers()
+            return
+        body = f"{self.path} {StubHandler.version}".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestHTTPFetcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubHandler.hits.clear()
+        StubHandler.version = "v1"
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(os.path.join(self.tmp_dir.name, "http.sqlite3"))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def make_fetcher(self, **kwargs):
+        fetcher = HTTPFetcher(cache=self.cache, **kwargs)
+        self.addCleanup(fetcher.close)
+        return fetcher
+
+    def test_fresh_responses_are_served_from_cache(self):
+        fetcher = self.make_fetcher()
+        self.assertEqual(fetcher.fetch(self.base + "/a"), "/a v1")
+        self.assertEqual(fetcher.fetch(self.base + "/a"), "/a v1")
+        self.assertEqual(StubHandler.hits["/a"], 1)
+
+    def test_stale_responses_are_served_while_refreshing(self):
+        fetcher = self.make_fetcher(ttl=0, stale_ttl=60)
+        fetcher.fetch(self.base + "/b")
+        StubHandler.version = "v2"
+        self.assertEqual(fetcher.fetch(self.base + "/b"), "/b v1")
+        fetcher._executor.shutdown(wait=True)
+        self.assertEqual(self.cache.get(self.base + "/b")[0], "/b v2")
+
+    def test_read_timeout_raises_fetch_error(self):
+        fetcher = self.make_fetcher(read_timeout=0.2)
+        with self.assertRaises(FetchError):
+            fetcher.fetch(self.base + "/slow")
+
+    def test_expired_copy_is_used_when_refetch_fails(self):
+        url = self.base + "/error"
+        self.cache.set(url, "old body")
+        fetcher = self.make_fetcher(ttl=0, stale_ttl=0)
+        self.assertEqual(fetcher.fetch(url), "old body")
+
+    def test_fetch_many_runs_concurrently(self):
+        fetcher = self.make_fetcher(max_workers=3)
+        urls = [self.base + f"/slow/{i}" for i in range(3)]
+        started = time.perf_counter()
+        results = fetcher.fetch_many(urls + [self.base + "/error/x"])
+        self.assertLess(time.perf_counter() - started, 2.5)
+        self.assertEqual(results[urls[0]], "/slow/0 v1")
+        self.assertIsNone(results[self.base + "/error/x"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from benchmarks.interview_latency import FakeLLM, lift_request_quota, percentile, regressions, run_interview, summarize
+
+class TestInterviewBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        lift_request_quota()
+
+    def run_benchmark(self, feedback_mode):
+        fake_llm = FakeLLM(latency=0.0, tokens=5)
+        runs = [run_interview(fake_llm, feedback_mode, answer_words=10)]
+        return runs[0], summarize(runs, fake_llm.calls)
+
+    def test_sync_interview_makes_one_feedback_call_per_answer(self):
+        run, results = self.run_benchmark("sync")
+        self.assertEqual(len(run["turns"]), 9)
+        self.assertIsNotNone(run["finalize_seconds"])
+        self.assertEqual(results["by_role"]["feedback_analyst"]["calls"], 10)
+        self.assertEqual(results["llm_calls_per_run"], 15)
+        self.assertGreater(results["by_role"]["performance_analysis"]["max_prompt_chars"], 0)
+
+    def test_batch_interview_groups_feedback_calls(self):
+        _, results = self.run_benchmark("batch")
+        self.assertEqual(results["by_role"]["feedback_analyst"]["calls"], 4)
+
+    def test_percentiles_and_regressions(self):
+        self.assertEqual(percentile([1, 2, 3, 4], 0.5), 2)
+        self.assertEqual(percentile(list(range(1, 21)), 0.95), 19)
+        self.assertEqual(regressions({"turn_p95": 1.3, "total_mean": 1.0}, {"turn_p95": 1.0, "total_mean": 1.0}, 0.2), ["turn_p95"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import threading
+import time
+import unittest
+from src.utils.interviewer_profiles import normalize_linkedin_url, profile_cache_key, profile_interviewers
+from src.utils.llm_cache import LLMCache
+
+class TestInterviewerProfiles(unittest.TestCase):
+    def test_linkedin_urls_are_normalised(self):
+        expected = "linkedin.com/in/alice"
+        for url in ["https://www.linkedin.com/in/alice/", "http://uk.linkedin.com/in/Alice?trk=x", "linkedin.com/in/alice#about"]:
+            self.assertEqual(normalize_linkedin_url(url), expected)
+        self.assertEqual(normalize_linkedin_url(""), "")
+
+    def test_cache_key_uses_url_and_role(self):
+        alice = {"name": "Alice", "role": "Hiring Manager", "linkedin": "https://www.linkedin.com/in/alice/"}
+        self.assertEqual(profile_cache_key(alice), profile_cache_key(dict(alice, name="A. Smith", linkedin="linkedin.com/in/alice")))
+        self.assertNotEqual(profile_cache_key(alice), profile_cache_key(dict(alice, role="CTO")))
+
+    def test_profiles_are_cached_and_order_preserved(self):
+        cache = LLMCache(":memory:")
+        interviewers = [
+            {"name": "Alice", "role": "Hiring Manager", "linkedin": "https://www.linkedin.com/in/alice/"},
+            {"name": "Bob", "role": "Engineer", "linkedin": "https://www.linkedin.com/in/bob/"},
+        ]
+        calls = []
+        def profile(interviewer):
+            calls.append(interviewer["name"])
+            return f"profile of {interviewer['name']}"
+
+        self.assertEqual(profile_interviewers(interviewers, profile, cache=cache), ["profile of Alice", "profile of Bob"])
+        self.assertEqual(profile_interviewers(interviewers[::-1], profile, cache=cache), ["profile of Bob", "profile of Alice"])
+        self.assertEqual(sorted(calls), ["Alice", "Bob"])
+
+    def test_concurrency_is_capped(self):
+        active, peak, lock = [0], [0], threading.Lock()
+        def profile(interviewer):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return "profile"
+
+        interviewers = [{"name": f"Person {i}", "role": "Engineer", "linkedin": ""} for i in range(6)]
+        profile_interviewers(interviewers, profile, max_workers=2)
+        self.assertEqual(peak[0], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import time
+import unittest
+from src.utils.llm_cache import LLMCache, make_cache_key
+
+class TestLLMCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "cache.sqlite3")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_key_is_stable_and_content_addressed(self):
+        key = make_cache_key("Role", "gemini-pro", "Describe", "Output", {"b": 1, "a": [1, 2]})
+        self.assertEqual(key, make_cache_key("Role", "gemini-pro", "Describe", "Output", {"a": [1, 2], "b": 1}))
+        self.assertNotEqual(key, make_cache_key("Role", "gemini-pro", "Describe", "Output", {"a": [2, 1], "b": 1}))
+
+    def test_hits_misses_and_persistence(self):
+        cache = LLMCache(self.path)
+        self.assertIsNone(cache.get("k"))
+        cache.set("k", "value")
+        self.assertEqual(cache.get("k"), "value")
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+        self.assertEqual(LLMCache(self.path).get("k"), "value")
+
+    def test_ttl_per_task_type(self):
+        cache = LLMCache(self.path, ttls={"feedback": 0})
+        cache.set("short", "value", task_type="feedback")
+        cache.set("long", "value", task_type="questions")
+        self.assertIsNone(cache.get("short"))
+        self.assertEqual(cache.get("long"), "value")
+
+    def test_lru_eviction(self):
+        cache = LLMCache(self.path, max_entries=2)
+        cache.set("a", "1")
+        time.sleep(0.01)
+        cache.set("b", "2")
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.set("c", "3")
+        self.assertEqual(cache.get("a"), "1")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["entries"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from dotenv import load_dotenv
+from src.utils import llm_registry
+
+class TestLLMRegistry(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.multiple(llm_registry, _guards={}, _limiters={}, _env_loaded=False, _global_limit=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_load_env_reads_dotenv_once_without_overriding(self):
+        with tempfile.TemporaryDirectory() as tmp_dir, patch.dict(os.environ, {"SESSION_TOKEN_LIMIT": "500"}):
+            dotenv_path = os.path.join(tmp_dir, ".env")
+            with open(dotenv_path, "w", encoding="utf-8") as f:
+                f.write("TRACING=1\nSESSION_TOKEN_LIMIT=100\n")
+            os.environ.pop("TRACING", None)
+            with patch.object(llm_registry, "load_dotenv", side_effect=lambda: load_dotenv(dotenv_path)) as loader:
+                llm_registry.load_env()
+                llm_registry.load_env()
+            self.assertEqual(loader.call_count, 1)
+            self.assertEqual(os.environ.pop("TRACING"), "1")
+            self.assertEqual(os.environ["SESSION_TOKEN_LIMIT"], "500")
+
+    def test_model_resolution_order(self):
+        with patch.dict(os.environ, {"GEMINI_MODEL": "gemini-a", "FEEDBACK_ANALYST_MODEL": "gemini-b"}):
+            self.assertEqual(llm_registry.model_for("feedback_analyst"), "gemini-b")
+            self.assertEqual(llm_registry.model_for("reporting"), "gemini-a")
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(llm_registry.model_for(), llm_registry.DEFAULT_MODEL)
+
+    def test_max_inflight_per_model_override(self):
+        with patch.dict(os.environ, {"LLM_MAX_INFLIGHT": "6", "LLM_MAX_INFLIGHT_GEMINI_1_5_PRO": "2"}):
+            self.assertEqual(llm_registry.max_inflight("gemini-1.5-pro"), 2)
+            self.assertEqual(llm_registry.max_inflight("gemini-pro"), 6)
+
+    def test_guards_are_shared_per_model(self):
+        with patch.dict(os.environ, {"LLM_MAX_ATTEMPTS": "2", "LLM_BURST": "3"}):
+            guard = llm_registry.get_guard("model-a")
+            self.assertIs(llm_registry.get_guard("model-a"), guard)
+            self.assertIsNot(llm_registry.get_guard("model-b"), guard)
+            self.assertEqual(guard.max_attempts, 2)
+            self.assertEqual(guard.bucket.capacity, 3)
+
+    def test_slot_holds_the_global_limit(self):
+        limit = threading.BoundedSemaphore(1)
+        llm_registry.set_global_limit(limit)
+        with llm_registry.llm_slot("model-a"):
+            self.assertFalse(limit.acquire(blocking=False))
+        self.assertTrue(limit.acquire(blocking=False))
+        limit.release()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import glob
+import multiprocessing
+import os
+import tempfile
+import unittest
+from src.utils.progress_rollups import ProgressRollups, weak_topics
+from src.utils.session_store import SessionStore
+
+def make_record(session_id, score, filler_rate, created_at, transcript=()):
+    return {
+        "session_id": session_id,
+        "user_id": "u1",
+        "created_at": created_at,
+        "readiness_score": score,
+        "metrics": {"filler_rate": filler_rate, "avg_answer_length": 30.0, "answer_count": len(transcript)},
+        "transcript": list(transcript),
+    }
+
+SHORT_BEHAVIORAL = {"question": "Tell me about a time you failed.", "answer": "Um, once."}
+SHORT_TECHNICAL = {"question": "Explain indexes.", "answer": "They are fast."}
+
+def save_sessions(directory, worker, count):
+    rollups = ProgressRollups(directory)
+    for i in range(count):
+        rollups.update(make_record(f"w{worker}-s{i}", 50 + i, 2.0, 1000 + worker * 100 + i, [SHORT_TECHNICAL]))
+
+class TestProgressRollups(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.rollups = ProgressRollups(os.path.join(self.tmp_dir.name, "progress"), window=2)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_weak_topics_come_from_short_or_filler_answers(self):
+        long_answer = {"question": "How would you scale it?", "answer": " ".join(["word"] * 30)}
+        self.assertEqual(weak_topics([SHORT_BEHAVIORAL, SHORT_TECHNICAL, long_answer]), ["behavioral", "technical"])
+
+    def test_sessions_are_appended_with_rolling_scores(self):
+        self.assertTrue(self.rollups.update(make_record("s1", 60, 4.0, 1000)))
+        self.assertTrue(self.rollups.update(make_record("s2", 70, 3.0, 2000)))
+        self.assertTrue(self.rollups.update(make_record("s3", 90, 1.0, 3000)))
+        self.assertFalse(self.rollups.update(make_record("s3", 90, 1.0, 3000)))
+
+        sessions = self.rollups.sessions("u1")
+        self.assertEqual(list(sessions["session_id"]), ["s1", "s2", "s3"])
+        self.assertEqual(list(sessions["readiness_rolling"]), [60.0, 65.0, 80.0])
+
+        summary = self.rollups.summary("u1", recent=1)
+        self.assertEqual((summary["first_score"], summary["latest_score"]), (60.0, 90.0))
+        self.assertEqual(summary["filler_rate_change"], -3.0)
+        self.assertEqual(self.rollups.summary("nobody"), {"user_id": "nobody", "sessions": 0})
+
+    def test_weak_topic_counts_accumulate(self):
+        self.rollups.update(make_record("s1", 60, 4.0, 1000, [SHORT_BEHAVIORAL, SHORT_TECHNICAL]))
+        self.rollups.update(make_record("s2", 70, 3.0, 2000, [SHORT_BEHAVIORAL]))
+        topics = self.rollups.topics("u1")
+        self.assertEqual(topics.to_dict("records")[0]["topic"], "behavioral")
+        self.assertEqual(dict(zip(topics["topic"], topics["weak_count"])), {"behavioral": 2, "technical": 1})
+
+    def test_store_saves_update_rollups(self):
+        store = SessionStore(":memory:")
+        store.add_listener(self.rollups.update)
+        store.add(make_record("s1", 60, 4.0, 1000, [SHORT_TECHNICAL]))
+        store.add(make_record("s1", 60, 4.0, 1000, [SHORT_TECHNICAL]))
+        self.assertEqual(len(self.rollups.sessions("u1")), 1)
+        self.assertEqual(self.rollups.summary("u1")["weak_topics"], [{"topic": "technical", "weak_count": 1}])
+
+    def test_saves_add_a_part_without_rewriting_history(self):
+        self.rollups.update(make_record("s1", 60, 4.0, 1000))
+        first_part = glob.glob(os.path.join(self.rollups.directory, "*", "sessions", "*.parquet"))[0]
+        written_at = os.stat(first_part).st_mtime_ns
+        for i in range(2, 6):
+            self.rollups.update(make_record(f"s{i}", 60 + i, 3.0, 1000 + i))
+        self.assertEqual(os.stat(first_part).st_mtime_ns, written_at)
+        self.assertEqual(len(glob.glob(os.path.join(self.rollups.directory, "*", "sessions", "*.parquet"))), 5)
+        self.assertEqual(self.rollups.summary("u1")["sessions"], 5)
+
+    def test_concurrent_processes_do_not_lose_updates(self):
+        directory = self.rollups.directory
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=save_sessions, args=(directory, worker, 5)) for worker in range(3)]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(60)
+        self.assertEqual(len(self.rollups.sessions("u1")), 15)
+        self.assertEqual(self.rollups.summary("u1")["sessions"], 15)
+        self.assertEqual(self.rollups.summary("u1")["weak_topics"], [{"topic": "technical", "weak_count": 15}])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import time
+import unittest
+from benchmarks.interview_latency import BENCHMARK_CONFIG, FakeLLM, _load_manager_class, lift_request_quota
+from src.utils.question_bank import QuestionBank, LeastUsedFreshnessPolicy, classify_question, extract_skills
+
+class TestQuestionBank(unittest.TestCase):
+    def setUp(self):
+        self.bank = QuestionBank(":memory:", freshness_policy=LeastUsedFreshnessPolicy(cooldown_seconds=0, fresh_ratio=0))
+
+    def test_duplicates_are_ignored(self):
+        added = self.bank.add_questions(["What is CAD?", "what is cad", "Tell me about a time you failed."], "SAS", "Developer")
+        self.assertEqual(added, 2)
+        self.assertEqual(self.bank.count("SAS", "Developer"), 2)
+
+    def test_select_prefers_least_used_questions(self):
+        self.bank.add_questions(["Q one?", "Q two?", "Q three?"], "SAS", "Developer")
+        self.bank.mark_used(["Q one?", "Q two?"])
+        self.assertEqual(self.bank.select("SAS", "Developer", limit=1), ["Q three?"])
+
+    def test_skill_search_finds_questions_from_other_companies(self):
+        self.bank.add_questions(["How do you automate AutoCAD drawings?"], "Other Co", "Developer", ["autocad"])
+        self.bank.add_questions(["Describe your Java experience."], "Other Co", "Developer", ["java"])
+        self.assertEqual(self.bank.select("SAS", "Developer", ["autocad"], limit=5), ["How do you automate AutoCAD drawings?"])
+
+    def test_freshness_policy_cooldown_and_fresh_share(self):
+        policy = LeastUsedFreshnessPolicy(cooldown_seconds=3600, fresh_ratio=0.2)
+        candidates = [{"use_count": 1, "last_used": time.time()}, {"use_count": 0, "last_used": None}]
+        self.assertEqual(policy.choose(candidates, 10), [candidates[1]])
+        self.assertEqual(policy.fresh_count(10), 2)
+
+    def test_cooldown_applies_per_user(self):
+        bank = QuestionBank(":memory:", freshness_policy=LeastUsedFreshnessPolicy(cooldown_seconds=3600))
+        bank.add_questions(["Q one?", "Q two?"], "SAS", "Developer")
+        bank.mark_used(["Q one?"], user_id="alice")
+        self.assertEqual(bank.select("SAS", "Developer", limit=5, user_id="alice"), ["Q two?"])
+        self.assertEqual(sorted(bank.select("SAS", "Developer", limit=5, user_id="bob")), ["Q one?", "Q two?"])
+        self.assertEqual(len(bank.select("SAS", "Developer", limit=5)), 2)
+
+    def test_full_bank_serves_every_question_by_default(self):
+        bank = QuestionBank(":memory:")
+        bank.add_questions([f"Question {i}?" for i in range(12)], "SAS", "Developer")
+        self.assertEqual(len(bank.select("SAS", "Developer", limit=10)), 10)
+        self.assertEqual(bank.freshness_policy.fresh_count(10), 0)
+
+    def test_tagging_helpers(self):
+        self.assertEqual(classify_question("Tell me about a time you led a team."), "behavioral")
+        self.assertEqual(classify_question("How would you handle a missed deadline?"), "situational")
+        self.assertEqual(classify_question("Explain how a B-tree works."), "technical")
+        self.assertEqual(extract_skills("Python and AutoCAD. Python scripting for AutoCAD and Python tests.", limit=2), ["python", "autocad"])
+
+class TestManagerQuestionBank(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        lift_request_quota()
+
+    def start_with_bank(self, bank):
+        self.llm = FakeLLM(latency=0.0, tokens=5)
+        manager = _load_manager_class()(
+            self.llm, config=dict(BENCHMARK_CONFIG, user_id="alice"), use_cache=False, use_question_bank=False,
+            record_session=False, checkpoint=False, stream_output=False,
+        )
+        self.addCleanup(manager.close)
+        manager.question_bank = bank
+        bank.add_questions([f"Question {i}?" for i in range(10)], BENCHMARK_CONFIG["company_name"], BENCHMARK_CONFIG["job_role"])
+        manager._generate_questions()
+        return manager
+
+    def test_full_bank_starts_without_calling_the_model(self):
+        manager = self.start_with_bank(QuestionBank(":memory:"))
+        self.assertEqual(len(manager.questions), 10)
+        self.assertEqual(self.llm.calls, [])
+
+    def test_fresh_questions_are_added_in_the_background(self):
+        bank = QuestionBank(":memory:", freshness_policy=LeastUsedFreshnessPolicy(fresh_ratio=0.2))
+        manager = self.start_with_bank(bank)
+        self.assertEqual(len(manager.questions), 10)
+        deadline = time.monotonic() + 5
+        while bank.count() < 12 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(bank.count(), 12)
+
+if __name__ == '__main__':
+    unittest.main()
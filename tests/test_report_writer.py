@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from src.utils.report_writer import ReportQueue, atomic_write, render, session_scope
+
+class TestReportWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.queue = ReportQueue()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def submit_report(self, formats=("md",), session_id=None):
+        return self.queue.submit(
+            "report",
+            self.tmp_dir.name,
+            "interview_report",
+            context={"date": "2024-01-01 10:00:00", "readiness_score": 80, "performance_summary": "Strong <answers>", "recommendations": "Practice"},
+            entries=[{"number": 1, "question": "Why us?", "answer": "Because & more"}],
+            formats=formats,
+            session_id=session_id
+        )
+
+    def test_renders_markdown_and_escaped_html(self):
+        paths = self.submit_report(formats=("md", "html"), session_id="abc")
+        self.assertEqual(self.queue.wait(), [])
+        with open(paths["md"], encoding="utf-8") as f:
+            markdown = f.read()
+        with open(paths["html"], encoding="utf-8") as f:
+            page = f.read()
+        self.assertIn("**Interview Readiness Score:** 80/100", markdown)
+        self.assertIn("**Your Answer:** Because & more", markdown)
+        self.assertIn("Strong &lt;answers&gt;", page)
+        self.assertTrue(paths["md"].endswith("_abc.md"))
+
+    def test_reports_in_the_same_second_do_not_collide(self):
+        first = self.submit_report()
+        second = self.submit_report()
+        self.queue.wait()
+        self.assertNotEqual(first["md"], second["md"])
+        self.assertTrue(os.path.exists(first["md"]) and os.path.exists(second["md"]))
+
+    def test_session_scope_names_the_file(self):
+        with session_scope("session42"):
+            paths = self.submit_report()
+        self.queue.wait()
+        self.assertIn("session42", paths["md"])
+
+    def test_failed_writes_are_reported_and_leave_no_temp_files(self):
+        with self.assertRaises(KeyError):
+            render("report", "md", {"date": "today"})
+        paths = self.queue.submit("report", self.tmp_dir.name, "interview_report", context={"date": "today"})
+        self.assertEqual(self.queue.wait(), [paths["md"]])
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_atomic_write_replaces_existing_file(self):
+        path = os.path.join(self.tmp_dir.name, "nested", "report.md")
+        atomic_write(path, "old")
+        atomic_write(path, "new")
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "new")
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["report.md"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import patch
+from src.utils.resilience import (
+    AdaptiveLimiter, CircuitBreaker, CircuitOpenError, LLMCallError, LLMGuard, RateLimitedError, TokenBucket, is_retryable
+)
+
+class QuotaError(Exception):
+    pass
+
+class TestResilience(unittest.TestCase):
+    def make_guard(self, **kwargs):
+        options = {"bucket": TokenBucket(rate=1000, capacity=100), "breaker": CircuitBreaker(failure_threshold=3, reset_timeout=60)}
+        options.update(kwargs)
+        return LLMGuard(**options)
+
+    def test_retryable_errors(self):
+        self.assertTrue(is_retryable(QuotaError("429 Resource has been exhausted (e.g. check quota).")))
+        self.assertTrue(is_retryable(TimeoutError("read timed out")))
+        self.assertFalse(is_retryable(ValueError("API key not valid")))
+
+    @patch("src.utils.resilience.time.sleep")
+    def test_retries_retryable_errors_then_succeeds(self, _sleep):
+        outcomes = [QuotaError("429"), QuotaError("429"), "ok"]
+        def call():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        self.assertEqual(self.make_guard().call(call), "ok")
+
+    def test_non_retryable_errors_fail_immediately_with_typed_error(self):
+        calls = []
+        def call():
+            calls.append(1)
+            raise ValueError("API key not valid")
+        with self.assertRaises(LLMCallError):
+            self.make_guard().call(call)
+        self.assertEqual(len(calls), 1)
+
+    def test_circuit_opens_and_fails_fast(self):
+        guard = self.make_guard(max_attempts=1)
+        def fail():
+            raise QuotaError("503 Service Unavailable")
+        for _ in range(3):
+            with self.assertRaises(LLMCallError):
+                guard.call(fail)
+        with self.assertRaises(CircuitOpenError):
+            guard.call(lambda: "never called")
+
+    def test_other_errors_do_not_open_the_circuit(self):
+        guard = self.make_guard(max_attempts=1)
+        def fail():
+            raise ValueError("Could not parse the model output")
+        for _ in range(5):
+            with self.assertRaises(LLMCallError):
+                guard.call(fail)
+        def over_budget():
+            raise RateLimitedError("over budget")
+        with self.assertRaises(RateLimitedError):
+            guard.call(over_budget)
+        self.assertEqual(guard.breaker.state, "closed")
+        self.assertEqual(guard.call(lambda: "ok"), "ok")
+
+    @patch("src.utils.resilience.time.sleep")
+    def test_side_effecting_calls_are_not_retried(self, _sleep):
+        calls = []
+        def call():
+            calls.append(1)
+            raise QuotaError("429")
+        with self.assertRaises(LLMCallError):
+            self.make_guard().call(call, retryable=False)
+        self.assertEqual(len(calls), 1)
+
+    def test_half_open_trial_closes_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        breaker.check()
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+
+    def test_half_open_trial_is_released_when_the_call_never_reaches_the_model(self):
+        guard = self.make_guard(
+            bucket=TokenBucket(rate=0.01, capacity=1), breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0),
+            max_wait=0.01,
+        )
+        guard.breaker.record_failure()
+        guard.bucket.tokens = 0
+        with self.assertRaises(RateLimitedError):
+            guard.call(lambda: "no budget")
+        def interrupted():
+            raise KeyboardInterrupt
+        guard.bucket.tokens = 1
+        with self.assertRaises(KeyboardInterrupt):
+            guard.call(interrupted)
+        guard.bucket.tokens = 1
+        self.assertEqual(guard.call(lambda: "ok"), "ok")
+        self.assertEqual(guard.breaker.state, "closed")
+
+    def test_token_bucket_gives_up_after_timeout(self):
+        guard = self.make_guard(bucket=TokenBucket(rate=0.01, capacity=1), max_wait=0.01)
+        self.assertEqual(guard.call(lambda: "first"), "first")
+        with self.assertRaises(RateLimitedError):
+            guard.call(lambda: "second")
+
+    def test_adaptive_limiter_backs_off_and_recovers(self):
+        limiter = AdaptiveLimiter(max_limit=8, target_latency=10)
+        limiter.acquire()
+        limiter.release(latency=1, ok=False, overloaded=True)
+        self.assertEqual(limiter.limit, 4)
+        limiter.acquire()
+        limiter.release(latency=1, ok=True)
+        self.assertEqual(limiter.limit, 4.25)
+        limiter.acquire()
+        limiter.release(latency=20, ok=True)
+        self.assertEqual(limiter.limit, 2.125)
+
+if __name__ == '__main__':
+    unittest.main()
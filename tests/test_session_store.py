@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+from src.utils.session_store import SessionStore
+
+class TestSessionStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = SessionStore(os.path.join(self.tmp_dir.name, "sessions.sqlite3"))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def add_session(self, session_id, user_id="u1", company="Acme", role="Engineer", created_at=1000.0):
+        return self.store.add({
+            "session_id": session_id,
+            "user_id": user_id,
+            "company": company,
+            "role": role,
+            "created_at": created_at,
+            "readiness_score": 75,
+            "summary": "Strong answers.",
+            "recommendations": "Use the STAR method.",
+            "metrics": {"filler_count": 2},
+            "transcript": [{"question": "Why us?", "answer": "Because."}],
+        })
+
+    def test_records_round_trip_and_are_append_only(self):
+        self.assertTrue(self.add_session("s1"))
+        self.assertFalse(self.add_session("s1", company="Other"))
+        record = self.store.get("s1")
+        self.assertEqual(record["company"], "Acme")
+        self.assertEqual(record["metrics"], {"filler_count": 2})
+        self.assertEqual(record["transcript"][0]["answer"], "Because.")
+        self.assertIsNone(self.store.get("missing"))
+
+    def test_filtered_paginated_queries_newest_first(self):
+        for i in range(5):
+            self.add_session(f"s{i}", created_at=1000.0 + i)
+        self.add_session("other", user_id="u2", created_at=2000.0)
+
+        first = self.store.query(user_id="u1", page=1, page_size=2)
+        self.assertEqual(first["total"], 5)
+        self.assertEqual([item["session_id"] for item in first["items"]], ["s4", "s3"])
+        self.assertNotIn("transcript", first["items"][0])
+        last = self.store.query(user_id="u1", page=3, page_size=2)
+        self.assertEqual([item["session_id"] for item in last["items"]], ["s0"])
+        self.assertEqual(self.store.query(since=1003.0, until=1500.0)["total"], 2)
+        self.assertEqual(self.store.query(company="Acme", role="Engineer")["total"], 6)
+
+    def test_markdown_is_exported_on_demand(self):
+        self.add_session("s1")
+        path = self.store.export_markdown("s1", directory=self.tmp_dir.name)
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        self.assertIn("**Interview Readiness Score:** 75/100", content)
+        self.assertIn("**Question 1:** Why us?", content)
+        with self.assertRaises(KeyError):
+            self.store.export_markdown("missing", directory=self.tmp_dir.name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import threading
+import time
+import unittest
+from src.utils.speculative import SpeculativeQuestionJob
+
+def config(company):
+    return {"company_name": company, "job_role": "Developer", "job_description": "Build tools.", "interviewers": []}
+
+class TestSpeculativeQuestionJob(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def generate(self, cfg):
+        self.calls.append(cfg["company_name"])
+        time.sleep(0.05)
+        return [f"Why {cfg['company_name']}?"]
+
+    def wait_until_started(self):
+        deadline = time.monotonic() + 2
+        while not self.calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_newer_inputs_cancel_older_job(self):
+        job = SpeculativeQuestionJob(self.generate, debounce_seconds=0.05)
+        job.update(config("A"))
+        job.update(config("B"))
+        self.assertIsNone(job.result_for(config("A")))
+        self.wait_until_started()
+        self.assertEqual(job.result_for(config("B")), ["Why B?"])
+        self.assertEqual(self.calls, ["B"])
+
+    def test_debounced_job_runs_once_in_background(self):
+        job = SpeculativeQuestionJob(self.generate, debounce_seconds=0.01)
+        job.update(config("A"))
+        time.sleep(0.2)
+        job.update(config("A"))
+        self.assertEqual(job.result_for(config("A"), timeout=0), ["Why A?"])
+        self.assertEqual(self.calls, ["A"])
+
+    def test_job_that_has_not_started_is_cancelled_instead_of_waited_for(self):
+        job = SpeculativeQuestionJob(self.generate, debounce_seconds=0.2)
+        job.update(config("A"))
+        self.assertIsNone(job.result_for(config("A")))
+        time.sleep(0.3)
+        self.assertEqual(self.calls, [])
+
+    def test_running_generation_is_waited_for_rather_than_repeated(self):
+        release = threading.Event()
+        def generate(cfg):
+            self.calls.append(cfg["company_name"])
+            release.wait(5)
+            return ["Worth the wait?"]
+        job = SpeculativeQuestionJob(generate, debounce_seconds=0)
+        job.update(config("A"))
+        self.wait_until_started()
+        threading.Timer(0.3, release.set).start()
+        self.assertEqual(job.result_for(config("A")), ["Worth the wait?"])
+        self.assertEqual(self.calls, ["A"])
+
+if __name__ == '__main__':
+    unittest.main()
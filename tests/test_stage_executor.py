@@ -0,0 +1,32 @@
+import time
+import unittest
+from src.utils.stage_executor import StageExecutor
+
+class TestStageExecutor(unittest.TestCase):
+    def test_independent_stages_run_in_parallel(self):
+        executor = StageExecutor(max_workers=2)
+        executor.add_stage("summary", lambda: "summary")
+        executor.add_stage("report", lambda summary: time.sleep(0.2) or f"report({summary})", depends_on=["summary"])
+        executor.add_stage("learning_path", lambda summary: time.sleep(0.2) or f"path({summary})", depends_on=["summary"])
+
+        order = [name for name, _ in executor.run()]
+
+        self.assertEqual(order[0], "summary")
+        self.assertCountEqual(order[1:], ["report", "learning_path"])
+        self.assertEqual(executor.results["report"], "report(summary)")
+        self.assertLess(executor.timings["total"], 0.35)
+        self.assertIn("learning_path", executor.timings)
+
+    def test_unknown_dependency_is_rejected(self):
+        executor = StageExecutor()
+        with self.assertRaises(ValueError):
+            executor.add_stage("report", lambda summary: summary, depends_on=["summary"])
+
+    def test_stage_errors_propagate(self):
+        executor = StageExecutor()
+        executor.add_stage("summary", lambda: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            list(executor.run())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from src.utils.text_metrics import MetricsEngine, analyze_text, analyze_transcript
+
+class TestTextMetrics(unittest.TestCase):
+    def test_filler_words_are_matched_on_word_boundaries(self):
+        metrics = analyze_text("Um, I carried an umbrella to the drum circle. Uh, it rained.")
+        self.assertEqual(metrics.filler_count, 2)
+        self.assertEqual(metrics.filler_counts, {"um": 1, "uh": 1})
+
+    def test_word_and_sentence_counts(self):
+        metrics = analyze_text("I led the team. We shipped it on time! Any questions")
+        self.assertEqual(metrics.word_count, 11)
+        self.assertEqual(metrics.sentence_count, 3)
+
+    def test_keywords_match_inflections_and_phrases(self):
+        metrics = analyze_text("Answers were rambling. Practise the STAR method and cut filler words from your projects.")
+        self.assertTrue(metrics.mentions("ramble"))
+        self.assertTrue(metrics.mentions("star method"))
+        self.assertTrue(metrics.mentions("filler words"))
+        self.assertTrue(metrics.mentions("project"))
+        self.assertFalse(metrics.mentions("concise"))
+
+    def test_transcript_totals(self):
+        transcript = [{"question": "Q1", "answer": "Um I worked on a project."}, {"question": "Q2", "answer": "Yes."}]
+        metrics = analyze_transcript(transcript)
+        self.assertEqual(metrics.answer_count, 2)
+        self.assertEqual(metrics.total_words, 7)
+        self.assertEqual(metrics.filler_count, 1)
+        self.assertEqual(metrics.avg_answer_length, 3.5)
+        self.assertEqual(metrics.keyword_hits, {"project": 1})
+
+    def test_batch_analysis(self):
+        engine = MetricsEngine(keywords=("team",))
+        results = engine.analyze_batch([[{"answer": "team team"}], [{"answer": "uh"}], []])
+        self.assertEqual([r.keyword_hits for r in results], [{"team": 2}, {}, {}])
+        self.assertEqual([r.filler_count for r in results], [0, 1, 0])
+
+    def test_batch_totals_match_per_transcript_analysis(self):
+        engine = MetricsEngine()
+        transcripts = [
+            [{"answer": "Um I led the team. We shipped the project!"}, {"answer": "Uh, detailed and direct."}],
+            [],
+            [{"answer": "Strong skills, excellent projects. Um."}],
+        ]
+        for batch, single in zip(engine.analyze_batch(transcripts), map(engine.analyze_transcript, transcripts)):
+            self.assertEqual(
+                (batch.answer_count, batch.total_words, batch.total_sentences, batch.filler_count, batch.keyword_hits),
+                (single.answer_count, single.total_words, single.total_sentences, single.filler_count, single.keyword_hits),
+            )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import contextvars
+import unittest
+from benchmarks.interview_latency import BENCHMARK_CONFIG, FakeLLM, _load_manager_class, lift_request_quota
+from src.utils.stage_executor import StageExecutor
+from src.utils.token_stream import FinalAnswerFilter, capture_tokens, emit_token, stream_tokens
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+def fake_llm_call(words, on_token=None):
+    """Emits each word like a streaming model client and returns the full text."""
+    with capture_tokens(on_token):
+        for word in words:
+            emit_token(word)
+    return "".join(words)
+
+class TestStreamTokens(unittest.TestCase):
+    def test_tokens_arrive_in_order_before_the_result(self):
+        events = list(stream_tokens(fake_llm_call, ["Good ", "use ", "of ", "STAR."]))
+        self.assertEqual(events, [("token", "Good "), ("token", "use "), ("token", "of "), ("token", "STAR."), ("result", "Good use of STAR.")])
+
+    def test_errors_are_reraised_after_the_streamed_tokens(self):
+        def failing(on_token=None):
+            on_token("partial")
+            raise ValueError("boom")
+        stream = stream_tokens(failing)
+        self.assertEqual(next(stream), ("token", "partial"))
+        with self.assertRaises(ValueError):
+            next(stream)
+
+    def test_worker_thread_sees_the_callers_context(self):
+        request_id.set("r1")
+        events = list(stream_tokens(lambda on_token=None: request_id.get()))
+        self.assertEqual(events, [("result", "r1")])
+
+    def test_emit_outside_capture_is_a_noop(self):
+        emit_token("ignored")
+
+class TestFinalAnswerFilter(unittest.TestCase):
+    def feed(self, tokens):
+        emitted = []
+        step = FinalAnswerFilter(emitted.append)
+        for token in tokens:
+            step.feed(token)
+        return "".join(emitted)
+
+    def test_tool_call_steps_are_not_streamed(self):
+        tokens = ["Thought: I should ", "check the answer.\n", "Action: Response Evaluator\n", "Action Input: {\"answer\": \"x\"}"]
+        self.assertEqual(self.feed(tokens), "")
+
+    def test_only_the_final_answer_is_streamed(self):
+        tokens = ["Thought: I now know ", "the final answer\nFinal ", "Answ", "er: Good use ", "of STAR."]
+        self.assertEqual(self.feed(tokens), "Good use of STAR.")
+
+class TestStageStreaming(unittest.TestCase):
+    def test_stream_yields_deltas_before_each_stage_result(self):
+        executor = StageExecutor(max_workers=2)
+        executor.add_stage("summary", lambda on_token: fake_llm_call(["a", "b", "c"], on_token), streams=True)
+        executor.add_stage("report", lambda summary: f"report({summary})", depends_on=["summary"])
+        events = list(executor.stream())
+
+        self.assertEqual([e for e in events if e[:2] == ("token", "summary")], [("token", "summary", t) for t in "abc"])
+        summary_result = events.index(("result", "summary", "abc"))
+        self.assertTrue(all(e[0] == "token" for e in events[:summary_result]))
+        self.assertEqual(events[-1], ("result", "report", "report(abc)"))
+
+    def test_stages_run_in_the_callers_context(self):
+        request_id.set("r2")
+        executor = StageExecutor(max_workers=2)
+        executor.add_stage("a", lambda: request_id.get())
+        executor.add_stage("b", lambda: request_id.get())
+        self.assertEqual(dict(executor.run()), {"a": "r2", "b": "r2"})
+
+class TestSyncFeedbackStreaming(unittest.TestCase):
+    def test_feedback_deltas_precede_the_feedback_event(self):
+        lift_request_quota()
+        manager = _load_manager_class()(
+            FakeLLM(latency=0.0, tokens=4), config=BENCHMARK_CONFIG, feedback_mode="sync", use_cache=False,
+            use_question_bank=False, record_session=False, checkpoint=False, stream_output=True,
+        )
+        self.addCleanup(manager.close)
+        manager.questions = ["Q1", "Q2"]
+        list(manager.ask_next_question())
+        events = list(manager.ask_next_question("My answer."))
+
+        types = [event["type"] for event in events]
+        self.assertEqual(types, ["feedback_delta"] * 4 + ["feedback", "question"])
+        streamed = "".join(event["content"] for event in events if event["type"] == "feedback_delta")
+        self.assertIn(streamed.strip(), events[4]["content"])
+        self.assertEqual(manager.transcript[0]["feedback"].strip(), streamed.strip())
+
+if __name__ == '__main__':
+    unittest.main()
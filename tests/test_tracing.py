@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from benchmarks.interview_latency import BENCHMARK_CONFIG, FakeLLM, _load_manager_class, lift_request_quota
+from src.utils import tracing
+from src.utils.interviewer_profiles import profile_interviewers
+from src.utils.stage_executor import StageExecutor
+from src.utils.tracing import span, summarize_spans, traced
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "spans.jsonl")
+        self.previous = tracing.get_tracer()
+        self.tracer = tracing.configure(enabled=True, path=self.path)
+
+    def tearDown(self):
+        tracing.configure(enabled=self.previous.enabled, path=self.previous.path)
+        self.tmp_dir.cleanup()
+
+    def test_nested_spans_are_exported_as_jsonl(self):
+        with span("ui.turn", turn=1):
+            with span("crew.run", agent="Feedback Analyst") as run_span:
+                run_span.set(cache_hit=False)
+        self.tracer.close()
+
+        with open(self.path, encoding="utf-8") as f:
+            child, parent = [json.loads(line) for line in f]
+        self.assertEqual(child["parent_id"], parent["span_id"])
+        self.assertEqual(child["trace_id"], parent["trace_id"])
+        self.assertEqual(child["attributes"], {"agent": "Feedback Analyst", "cache_hit": False})
+        self.assertIsNone(parent["parent_id"])
+
+    def test_errors_are_recorded_and_reraised(self):
+        @traced("tool.failing")
+        def failing():
+            raise ValueError("boom")
+        with self.assertRaises(ValueError):
+            failing()
+        self.assertEqual(self.tracer.recent_spans()[-1]["error"], "ValueError: boom")
+
+    def test_stage_spans_nest_under_the_caller(self):
+        executor = StageExecutor(max_workers=2)
+        executor.add_stage("a", lambda: 1)
+        executor.add_stage("b", lambda: 2)
+        with span("finalize") as parent:
+            list(executor.run())
+        stages = [s for s in self.tracer.recent_spans() if s["name"] == "stage"]
+        self.assertEqual(len(stages), 2)
+        self.assertTrue(all(s["parent_id"] == parent.span_id for s in stages))
+
+    def test_profile_fan_out_spans_nest_under_the_caller(self):
+        def profile(interviewer):
+            with span("crew.run", agent=interviewer["name"]):
+                return f"Profile of {interviewer['name']}"
+        interviewers = [{"name": "Alice", "role": "Manager"}, {"name": "Bob", "role": "Engineer"}]
+        with span("prep") as parent:
+            profile_interviewers(interviewers, profile, company_name="Acme", cache=None, max_workers=2)
+        runs = [s for s in self.tracer.recent_spans() if s["name"] == "crew.run"]
+        self.assertEqual(len(runs), 2)
+        self.assertTrue(all(s["parent_id"] == parent.span_id for s in runs))
+
+    def test_async_feedback_spans_nest_under_the_turn(self):
+        lift_request_quota()
+        manager = _load_manager_class()(
+            FakeLLM(latency=0.0, tokens=5), config=BENCHMARK_CONFIG, feedback_mode="async", use_cache=False,
+            use_question_bank=False, record_session=False, checkpoint=False,
+        )
+        self.addCleanup(manager.close)
+        manager.questions = ["Why Acme?", "Why now?"]
+        list(manager.ask_next_question())
+        with span("ui.turn") as turn:
+            list(manager.ask_next_question("Because I like it."))
+        manager.collect_feedback(wait=True)
+        feedback = [s for s in self.tracer.recent_spans() if s["name"] == "crew.run" and s["attributes"]["task_type"] == "feedback"]
+        self.assertEqual(len(feedback), 1)
+        self.assertEqual(feedback[0]["parent_id"], turn.span_id)
+
+    def test_settings_are_read_on_first_use(self):
+        with patch.object(tracing, "_tracer", None), patch.dict(os.environ, {"TRACING": "1", "TRACE_PATH": self.path}):
+            self.assertTrue(tracing.tracing_enabled())
+            self.assertEqual(tracing.get_tracer().path, self.path)
+
+    def test_disabled_tracing_records_nothing(self):
+        tracer = tracing.configure(enabled=False)
+        with span("crew.run") as noop:
+            noop.set(cache_hit=True)
+        self.assertEqual(tracer.recent_spans(), [])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_summary_by_span_name(self):
+        spans = [
+            {"name": "crew.run", "duration_ms": 10.0, "error": None},
+            {"name": "crew.run", "duration_ms": 30.0, "error": "LLMCallError: x"},
+            {"name": "tool.web_search", "duration_ms": 5.0, "error": None},
+        ]
+        self.assertEqual(summarize_spans(spans)[0], {"name": "crew.run", "count": 2, "total_ms": 40.0, "p95_ms": 30.0, "errors": 1})
+
+if __name__ == '__main__':
+    unittest.main()
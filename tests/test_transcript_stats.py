@@ -0,0 +1,27 @@
+import unittest
+from src.utils.transcript_stats import TranscriptStats
+
+class TestTranscriptStats(unittest.TestCase):
+    def test_running_totals_match_a_full_rescan(self):
+        transcript = [
+            {"question": "Q1", "answer": "Um, I led a project with my team.", "interviewer": "Alice"},
+            {"question": "Q2", "answer": "Uh, I have experience with that.", "interviewer": "Bob"},
+            {"question": "Q3", "answer": "Yes.", "interviewer": "Alice"},
+        ]
+        stats = TranscriptStats()
+        for entry in transcript:
+            stats.add(entry["answer"], entry["interviewer"])
+
+        self.assertEqual(stats.snapshot(), TranscriptStats.from_transcript(transcript).snapshot())
+        self.assertEqual(stats.answer_count, 3)
+        self.assertEqual(stats.filler_count, 2)
+        self.assertEqual(stats.keyword_coverage, 0.75)
+        self.assertEqual(stats.per_interviewer["Alice"], {"answers": 2, "words": 9, "filler_words": 1})
+
+    def test_empty_stats(self):
+        snapshot = TranscriptStats().snapshot()
+        self.assertEqual(snapshot["avg_answer_length"], 0.0)
+        self.assertEqual(snapshot["filler_rate"], 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import threading
+import time
+import unittest
+from src.utils.transcript_stats import TranscriptStats
+from src.worker_pool import SimulationWorkerPool, RemoteSimulation, PoolBusyError, WorkerError
+
+class FakeManager:
+    """Stands in for SimulationManager inside the worker processes."""
+    def __init__(self, config=None, session_id=None, delay=0.0):
+        self.config = config
+        self.delay = delay
+        self.questions = ["Q1", "Q2"]
+        self.stats = TranscriptStats()
+
+    def adopt_questions(self, questions):
+        self.questions = list(questions)
+
+    def start_simulation(self, on_question, on_feedback, on_finish):
+        on_finish("Starting")
+        on_question(f"Hello from {self.config['company_name']}", is_intro=True)
+
+    def ask_next_question(self, user_response=None):
+        time.sleep(self.delay)
+        self.stats.add(user_response)
+        if not self.questions:
+            yield {"type": "final_results", "content": "Done"}
+            return
+        yield {"type": "question", "content": self.questions.pop(0)}
+
+    def collect_feedback(self, wait=False):
+        return []
+
+    def has_pending_feedback(self):
+        return False
+
+    def close(self):
+        pass
+
+def fake_prefetch(config):
+    return [f"Why {config['company_name']}?"]
+
+class TestSimulationWorkerPool(unittest.TestCase):
+    def make_pool(self, **kwargs):
+        pool = SimulationWorkerPool(
+            manager_factory=f"{__name__}:FakeManager", prefetch_function=f"{__name__}:fake_prefetch", **kwargs
+        ).start()
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    def test_session_runs_in_worker(self):
+        pool = self.make_pool(num_workers=2)
+        session = RemoteSimulation(pool, {"company_name": "SAS"})
+        session.adopt_questions(["Why SAS?"])
+        messages = []
+        session.start_simulation(
+            on_question=lambda msg, is_intro: messages.append(msg),
+            on_feedback=messages.append,
+            on_finish=messages.append
+        )
+        events = list(session.ask_next_question("Um, I like CAD."))
+
+        self.assertEqual(messages, ["Starting", "Hello from SAS"])
+        self.assertEqual(events, [{"type": "question", "content": "Why SAS?"}])
+        self.assertEqual(session.stats.filler_count, 1)
+        self.assertEqual(pool.metrics()["completed"], 2)
+
+    def test_full_queue_applies_backpressure(self):
+        pool = self.make_pool(num_workers=1, max_queue_depth=1)
+        session = RemoteSimulation(pool, {"company_name": "SAS"}, delay=0.5)
+        session.start_simulation(lambda msg, is_intro: None, print, lambda msg: None)
+
+        pending = pool.submit(session.session_id, "ask", "first answer")
+        with self.assertRaises(PoolBusyError):
+            pool.submit(session.session_id, "ask", "second answer")
+        list(pending)
+        self.assertEqual(pool.metrics()["rejected"], 1)
+
+    def start_session(self, pool, **options):
+        session = RemoteSimulation(pool, {"company_name": "SAS"}, **options)
+        session.start_simulation(lambda msg, is_intro: None, print, lambda msg: None)
+        return session
+
+    def test_sessions_on_one_worker_run_concurrently(self):
+        pool = self.make_pool(num_workers=1)
+        sessions = [self.start_session(pool, delay=0.5) for _ in range(3)]
+        threads = [threading.Thread(target=lambda s=session: list(s.ask_next_question("answer"))) for session in sessions]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLess(time.perf_counter() - started, 1.2)
+        self.assertEqual(pool.metrics()["completed"], 6)
+
+    def test_dead_worker_is_restarted(self):
+        pool = self.make_pool(num_workers=1)
+        session = self.start_session(pool, delay=5)
+        pending = pool.submit(session.session_id, "ask", "answer")
+        time.sleep(0.5)
+        pool._processes[0].kill()
+        with self.assertRaises(WorkerError):
+            list(pending)
+
+        metrics = pool.metrics()
+        self.assertEqual(metrics["restarts"], 1)
+        self.assertEqual(metrics["queue_depth"], [0])
+        replacement = self.start_session(pool)
+        self.assertEqual(list(replacement.ask_next_question("answer")), [{"type": "question", "content": "Q1"}])
+
+    def test_finished_sessions_are_released(self):
+        pool = self.make_pool(num_workers=1)
+        session = self.start_session(pool)
+        for _ in range(2):
+            list(session.ask_next_question("answer"))
+        self.assertEqual(list(session.ask_next_question("answer"))[0]["type"], "final_results")
+        events = list(session.ask_next_question("answer"))
+        self.assertEqual(events[0]["type"], "error")
+        self.assertIn("not active", events[0]["content"])
+
+    def test_idle_sessions_are_released(self):
+        pool = self.make_pool(num_workers=1, session_idle_ttl=0.2)
+        session = self.start_session(pool)
+        time.sleep(1.0)
+        events = list(session.ask_next_question("answer"))
+        self.assertIn("not active", events[0]["content"])
+
+    def test_questions_are_prefetched_on_a_worker(self):
+        pool = self.make_pool(num_workers=1)
+        self.assertEqual(pool.prefetch_questions({"company_name": "SAS"}), ["Why SAS?"])
+        self.assertEqual(pool.metrics()["queue_depth"], [0])
+
+if __name__ == '__main__':
+    unittest.main()